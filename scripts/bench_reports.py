@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Shiftfy — Report Render Benchmark
+=================================
+Runs every generator N times, each run in a fresh process, and records wall
+time, CPU time, peak RSS, page count, pages/second and output size. One
+extra run with ``REPORTS_OPTIMIZE=0`` records the size ReportLab's output
+would have without ``pdfopt``, so the saving is reported next to it.
+
+Usage:
+    python3 scripts/bench_reports.py                     # all generators, 5 runs
+    python3 scripts/bench_reports.py dsgvo -n 10         # one generator
+    python3 scripts/bench_reports.py --save-baseline     # store as new baseline
+    python3 scripts/bench_reports.py --threshold 0.10    # fail on >10% regressions
+
+Results:
+    reports/bench/latest.json     — this run
+    reports/bench/baseline.json   — reference run (``--save-baseline``)
+
+When a baseline exists, median wall time, CPU time, peak RSS and output size
+are compared against it and the script exits with status 1 if any of them
+regressed by more than ``--threshold``. Runs use a fixed SOURCE_DATE_EPOCH so
+output sizes are comparable between runs.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import reportlab
+
+from reportlib import pdfopt
+from reportlib.registry import REPORTS_DIR, ROOT_DIR, select
+
+BENCH_DIR = os.path.join(REPORTS_DIR, "bench")
+LATEST_PATH = os.path.join(BENCH_DIR, "latest.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+# Metrics compared against the baseline (all "lower is better").
+COMPARED = ("wall_s", "cpu_s", "peak_rss_mb", "size_kb")
+
+_PAGE_OBJ = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+
+def count_pages(path):
+    with open(path, "rb") as fh:
+        data = fh.read()
+    try:
+        objects, _ = pdfopt.load(data)   # page objects may sit in object streams
+    except (pdfopt.PdfError, ValueError):
+        return len(_PAGE_OBJ.findall(data))
+    return sum(1 for v in objects.values()
+               if isinstance(v, dict) and v.get(pdfopt.Name(b"Type")) == b"Page")
+
+
+def run_once(spec, env):
+    """Run a generator in a child process and measure it via wait4()."""
+    since = time.time_ns() - 2_000_000_000
+    with tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, spec.script_path],
+            cwd=ROOT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=err,
+        )
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if proc.returncode != 0:
+            err.seek(0)
+            raise RuntimeError(f"{spec.name} failed:\n{err.read().decode(errors='replace')}")
+    outputs = spec.find_outputs(since)
+    return {
+        "wall_s": wall,
+        "cpu_s": usage.ru_utime + usage.ru_stime,
+        # ru_maxrss is in KiB on Linux, bytes on macOS.
+        "peak_rss_mb": usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        "pages": sum(count_pages(p) for p in outputs),
+        "size_kb": sum(os.path.getsize(p) for p in outputs) / 1024,
+    }
+
+
+def summarise(runs, raw):
+    wall = [r["wall_s"] for r in runs]
+    med_wall = statistics.median(wall)
+    pages = runs[-1]["pages"]
+    return {
+        "runs": len(runs),
+        "wall_s": round(med_wall, 4),
+        "wall_min_s": round(min(wall), 4),
+        "wall_stdev_s": round(statistics.stdev(wall), 4) if len(wall) > 1 else 0.0,
+        "cpu_s": round(statistics.median(r["cpu_s"] for r in runs), 4),
+        "peak_rss_mb": round(max(r["peak_rss_mb"] for r in runs), 1),
+        "pages": pages,
+        "pages_per_s": round(pages / med_wall, 1) if med_wall else 0.0,
+        "size_kb": round(runs[-1]["size_kb"], 1),
+        "size_raw_kb": round(raw["size_kb"], 1),
+        "size_saved": round(1 - runs[-1]["size_kb"] / raw["size_kb"], 4) if raw["size_kb"] else 0.0,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return a list of (report, metric, old, new, change) regressions."""
+    regressions = []
+    for name, cur in results.items():
+        old = baseline.get("reports", {}).get(name)
+        if not old:
+            continue
+        for metric in COMPARED:
+            if not old.get(metric):
+                continue
+            change = cur[metric] / old[metric] - 1
+            cur.setdefault("vs_baseline", {})[metric] = round(change, 4)
+            if change > threshold:
+                regressions.append((name, metric, old[metric], cur[metric], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Shiftfy report generators.")
+    parser.add_argument("reports", nargs="*", help="report names (default: all)")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="measured runs per generator")
+    parser.add_argument("--warmup", type=int, default=1, help="unmeasured runs first")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative regression that fails the run (default 0.15)")
+    parser.add_argument("-o", "--output", default=LATEST_PATH, help="where to write results")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.setdefault("SOURCE_DATE_EPOCH", "1767225600")  # 2026-01-01, fixed output sizes
+
+    results = {}
+    for spec in select(args.reports):
+        for _ in range(args.warmup):
+            run_once(spec, env)
+        raw = run_once(spec, dict(env, **{pdfopt.OPTIMIZE_ENV: "0"}))
+        runs = [run_once(spec, env) for _ in range(args.runs)]
+        results[spec.name] = summary = summarise(runs, raw)
+        print(f"  {spec.name:<12} {summary['wall_s']*1000:8.1f} ms  "
+              f"cpu {summary['cpu_s']*1000:7.1f} ms  "
+              f"rss {summary['peak_rss_mb']:6.1f} MB  "
+              f"{summary['pages']:3d} pages  {summary['pages_per_s']:6.1f} p/s  "
+              f"{summary['size_kb']:7.1f} KB (raw {summary['size_raw_kb']:.1f} KB, "
+              f"−{summary['size_saved']:.0%})")
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            regressions = compare(results, json.load(fh), args.threshold)
+
+    doc = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "reportlab": reportlab.Version,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "runs": args.runs,
+        "reports": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(doc, fh, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(doc, fh, indent=2)
+        print(f"\nBaseline saved to {os.path.relpath(args.baseline, ROOT_DIR)}")
+
+    for name, metric, old, new, change in regressions:
+        print(f"  ✘ {name}: {metric} {old} → {new} (+{change:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Shiftfy — Report Build Driver
+=============================
+Regenerates the PDF report set, skipping every report whose inputs are
+unchanged since the last build (see ``reportlib/manifest.py``).
+
+Usage:
+    python3 scripts/build_reports.py                 # build what changed
+    python3 scripts/build_reports.py dsgvo status    # only these reports
+    python3 scripts/build_reports.py --force         # rebuild everything
+    python3 scripts/build_reports.py --list          # show state, build nothing
+
+    SOURCE_DATE_EPOCH=$(git log -1 --format=%ct) python3 scripts/build_reports.py
+                                                     # byte-reproducible PDFs
+    REPORTS_JOBS=8 python3 scripts/build_reports.py dsgvo ticketify
+                                                     # lay sections out in 8
+                                                     # worker processes
+    REPORTS_PROFILE=1 python3 scripts/build_reports.py --force
+                                                     # per-section timings in
+                                                     # reports/profile/
+    python3 scripts/build_reports.py --watch         # build, then rebuild on
+                                                     # every save (see
+                                                     # reportlib/watch.py)
+
+Each generator runs in its own process, exactly as when invoked by hand.
+In watch mode, rebuilds after the initial build run in warm worker processes
+instead, one task per affected report and language.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from reportlib.manifest import Manifest
+from reportlib.registry import ROOT_DIR, select
+from reportlib.watch import DEFAULT_DEBOUNCE_S, Watcher
+
+
+def run_generator(spec):
+    """Run one generator; return (outputs, duration, error)."""
+    # Filesystem timestamps can be coarser than time.time_ns(); allow for it.
+    since = time.time_ns() - 2_000_000_000
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, spec.script_path],
+        cwd=ROOT_DIR, capture_output=True, text=True,
+    )
+    duration = time.perf_counter() - start
+    if proc.returncode != 0:
+        return [], duration, proc.stderr.strip() or f"exit code {proc.returncode}"
+    outputs = spec.find_outputs(since)
+    if not outputs:
+        return [], duration, "generator finished but wrote no matching output"
+    return outputs, duration, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Shiftfy PDF reports.")
+    parser.add_argument("reports", nargs="*", help="report names (default: all)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--list", action="store_true", help="show what would be built")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="generators to run in parallel")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild what each change affects")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_S,
+                        help="seconds without changes before a rebuild (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    specs = select(args.reports)
+    manifest = Manifest()
+    hashes = {spec.name: manifest.input_hash(spec) for spec in specs}
+    todo = [s for s in specs if args.force or not manifest.is_current(s, hashes[s.name])]
+
+    if args.list:
+        for spec in specs:
+            state = "stale" if spec in todo else "up to date"
+            print(f"  {spec.name:<12} {state}")
+        return 0
+
+    for spec in specs:
+        if spec not in todo:
+            print(f"  ✔ {spec.name:<12} up to date")
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = pool.map(lambda s: (s, run_generator(s)), todo)
+        for spec, (outputs, duration, error) in results:
+            if error:
+                failed += 1
+                print(f"  ✘ {spec.name:<12} failed after {duration:.2f}s\n{error}")
+                continue
+            manifest.record(spec, hashes[spec.name], outputs, duration)
+            print(f"  ✔ {spec.name:<12} built in {duration:.2f}s "
+                  f"({len(outputs)} file{'s' if len(outputs) != 1 else ''})")
+
+    manifest.save()
+    if args.watch:
+        return Watcher(specs, manifest, jobs=args.jobs, debounce=args.debounce).run()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,14 +7,19 @@ DSGVO compliance audit data.
 
 Usage:
     python3 scripts/generate_dsgvo_report.py
+    python3 scripts/generate_dsgvo_report.py --dumps /backups/2026-10-18
+
+--dumps (or REPORTS_RETENTION_DUMPS) points at CSV/Parquet table exports;
+section 3 then shows a retention dry run over them (reportlib/retention.py).
 
 Output:
     reports/Shiftfy_DSGVO_Compliance_EN_<date>.pdf
     reports/Shiftfy_DSGVO_Compliance_DE_<date>.pdf
 """
 
+import argparse
 import os
-from datetime import datetime
+from functools import lru_cache
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
@@ -25,7 +30,6 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import (
     SimpleDocTemplate,
-    Paragraph,
     Spacer,
     Table,
     TableStyle,
@@ -35,11 +39,22 @@ from reportlab.platypus import (
 )
 from reportlab.graphics.shapes import Drawing, Rect, String
 
+from reportlib.buildinfo import BUILD_DATE
+from reportlib.layoutcache import Paragraph
+from reportlib.numfmt import formatter
+from reportlib.output import PdfOutput
+from reportlib.parallel import build_sections
+from reportlib.prismaschema import load_schema
+from reportlib.profiling import RenderProfiler
+from reportlib.retention import dry_run
+from reportlib.styles import register_theme
+from reportlib.tables import build_table
+
 # ── Paths ─────────────────────────────────────────────────────
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 FONTS_DIR = os.path.join(SCRIPT_DIR, "fonts")
 REPORTS_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), "reports")
-os.makedirs(REPORTS_DIR, exist_ok=True)
+DUMPS_ENV = "REPORTS_RETENTION_DUMPS"
 
 # ── Fonts ─────────────────────────────────────────────────────
 pdfmetrics.registerFont(TTFont("DejaVu", os.path.join(FONTS_DIR, "DejaVuSans.ttf")))
@@ -70,16 +85,18 @@ WARNING = HexColor("#d97706")       # Amber-600
 DANGER = HexColor("#dc2626")        # Red-600
 SHIELD_BG = HexColor("#064e3b")     # Emerald-900
 
-TODAY = datetime.now().strftime("%d-%m-%Y")
-TODAY_DISPLAY = datetime.now().strftime("%d %B %Y")
-TODAY_DE = datetime.now().strftime("%d. %B %Y")
+TODAY = BUILD_DATE.strftime("%d-%m-%Y")
+TODAY_DISPLAY = BUILD_DATE.strftime("%d %B %Y")
+TODAY_DE = BUILD_DATE.strftime("%d. %B %Y")
 
 
 # ═══════════════════════════════════════════════════════════════
 # STYLES
 # ═══════════════════════════════════════════════════════════════
 
+@register_theme("dsgvo")
 def build_styles():
+    """Return the report styles; built once per process and shared by DE/EN."""
     return {
         "title": ParagraphStyle(
             "Title", fontName="DejaVu-Bold", fontSize=26, leading=32,
@@ -156,33 +173,28 @@ def build_styles():
 # ═══════════════════════════════════════════════════════════════
 
 def make_table(styles, headers, rows, col_widths=None):
-    """Build a styled table with branded header row."""
-    header_cells = [Paragraph(h, styles["th"]) for h in headers]
-    data = [header_cells]
-    for row in rows:
-        data.append([
-            Paragraph(str(c), styles["tc"]) if not isinstance(c, Paragraph) else c
-            for c in row
-        ])
-
-    tbl = Table(data, colWidths=col_widths, repeatRows=1)
-    style_cmds = [
-        ("BACKGROUND", (0, 0), (-1, 0), BRAND),
-        ("TEXTCOLOR", (0, 0), (-1, 0), white),
-        ("FONTNAME", (0, 0), (-1, 0), "DejaVu-Bold"),
-        ("FONTSIZE", (0, 0), (-1, -1), 8.5),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("GRID", (0, 0), (-1, -1), 0.4, BORDER),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("LEFTPADDING", (0, 0), (-1, -1), 5),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 5),
-    ]
-    for i in range(1, len(data)):
-        if i % 2 == 0:
-            style_cmds.append(("BACKGROUND", (0, i), (-1, i), BG_LIGHT))
-    tbl.setStyle(TableStyle(style_cmds))
-    return tbl
+    """Build a styled table with branded header row.
+
+    Text cells are wrapped in Paragraphs; numeric cells stay plain strings.
+    """
+    return build_table(
+        [[Paragraph(h, styles["th"]) for h in headers]] + list(rows),
+        col_widths,
+        cell_style=styles["tc"],
+        style=[
+            ("BACKGROUND", (0, 0), (-1, 0), BRAND),
+            ("TEXTCOLOR", (0, 0), (-1, 0), white),
+            ("FONTNAME", (0, 0), (-1, 0), "DejaVu-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 8.5),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("GRID", (0, 0), (-1, -1), 0.4, BORDER),
+            ("TOPPADDING", (0, 0), (-1, -1), 5),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+            ("LEFTPADDING", (0, 0), (-1, -1), 5),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 5),
+        ],
+        zebra=(None, BG_LIGHT),
+    )
 
 
 def status_cell(styles, val):
@@ -210,6 +222,16 @@ def cover_block(t):
     return d
 
 
+# Columns dropped by the GPS purge migration, per table. Section 1 lists them
+# and the retention dry run checks that they stay empty, in both languages.
+GPS_PURGED_COLUMNS = {
+    "Location": ("latitude", "longitude", "geofenceRadius"),
+    "ServiceVisit": ("checkInLat", "checkInLng", "checkOutLat", "checkOutLng", "checkInWithinFence"),
+    "VisitSignature": ("signedLat", "signedLng"),
+    "ServiceVisitAuditLog": ("gpsLat", "gpsLng", "gpsAccuracy", "ipAddress"),
+}
+
+
 # ═══════════════════════════════════════════════════════════════
 # CONTENT — GERMAN
 # ═══════════════════════════════════════════════════════════════
@@ -250,12 +272,7 @@ CONTENT_DE = {
     "s1_migration_title": "1.1 Schema-Migration",
     "s1_migration_name": "Migration: dsgvo_remove_gps_and_location_tracking_fields",
     "s1_migration_headers": ["Tabelle", "Entfernte Spalten"],
-    "s1_migration_rows": [
-        ("Location", "latitude, longitude, geofenceRadius"),
-        ("ServiceVisit", "checkInLat, checkInLng, checkOutLat, checkOutLng, checkInWithinFence"),
-        ("VisitSignature", "signedLat, signedLng"),
-        ("ServiceVisitAuditLog", "gpsLat, gpsLng, gpsAccuracy, ipAddress"),
-    ],
+    "s1_migration_rows": [(table, ", ".join(cols)) for table, cols in GPS_PURGED_COLUMNS.items()],
     "s1_migration_note": "Bestehende Daten wurden vor dem DROP auf NULL gesetzt. Migration ist irreversibel.",
 
     "s1_deleted_title": "1.2 Gelöschte Dateien (5)",
@@ -378,6 +395,29 @@ CONTENT_DE = {
         ("TimeEntryAudit", "10 Jahre", "§147 AO — Lohnbuchhaltung"),
     ],
 
+    "s3_dry_title": "Probelauf gegen exportierte Tabellen",
+    "s3_dry_intro": (
+        "Stand {as_of}, Export {dumps}. Geprüft werden die Regeln des Löschjobs, "
+        "die gesetzlichen Aufbewahrungsfristen und die in Abschnitt 1 entfernten "
+        "GPS-Spalten. {ok} von {checked} Prüfungen sind konform."
+    ),
+    "s3_dry_uncovered": "Nicht vom Löschjob abgedeckt: {models}.",
+    "s3_dry_headers": ["Modell", "Prüfung", "Zeilen", "Betroffen", "Ergebnis"],
+    "s3_dry_rule": "{field} älter als {days} Tage",
+    "s3_dry_statutory": "{field} älter als {years} Jahre",
+    "s3_dry_purged": "{columns} leer",
+    "s3_dry_oldest": "ältester {date}",
+    "s3_dry_date_format": "%d.%m.%Y",
+    "s3_dry_status": {
+        "ok": "✅ Konform",
+        "due": "✅ Nächster Lauf löscht",
+        "blocked": "⚠️ Sicherheitsgrenze ({share} %), Job löscht nicht",
+        "overdue": "Überfällig",
+        "residual": "Daten vorhanden",
+        "missing": "Kein Export",
+        "error": "Fehler: {error}",
+    },
+
     "s3_nuke_title": "3.2 Nuclear Option (Art. 17 & Art. 28)",
     "s3_nuke_endpoint": "Neuer Endpunkt: DELETE /api/admin/workspace-wipe",
     "s3_nuke_items": [
@@ -388,6 +428,19 @@ CONTENT_DE = {
         "Irreversibel — kein Undo",
         "Stripe-Abo muss separat über Kundenportal gekündigt werden",
     ],
+    "s3_schema_title": "Abgleich mit prisma/schema.prisma",
+    "s3_schema_summary": (
+        "{cascaded} von {total} Modellen werden mit dem Workspace gelöscht "
+        "(onDelete: Cascade, direkt oder über ein Elternmodell). "
+        "Beziehungen zum gelöschten Bestand ohne Kaskade:"
+    ),
+    "s3_schema_headers": ["Modell", "Beziehung", "onDelete", "Auswirkung"],
+    "s3_schema_effects": {
+        "SetNull": "Bleibt erhalten, Verweis wird geleert",
+        "Restrict": "Blockiert die Löschung",
+        "NoAction": "Blockiert die Löschung",
+        "SetDefault": "Bleibt erhalten, Verweis auf Standardwert",
+    },
 
     "s3_excluded_title": "3.3 Nicht automatisch gelöschte Daten",
     "s3_excluded_headers": ["Datentyp", "Begründung"],
@@ -587,12 +640,7 @@ CONTENT_EN = {
     "s1_migration_title": "1.1 Schema Migration",
     "s1_migration_name": "Migration: dsgvo_remove_gps_and_location_tracking_fields",
     "s1_migration_headers": ["Table", "Removed Columns"],
-    "s1_migration_rows": [
-        ("Location", "latitude, longitude, geofenceRadius"),
-        ("ServiceVisit", "checkInLat, checkInLng, checkOutLat, checkOutLng, checkInWithinFence"),
-        ("VisitSignature", "signedLat, signedLng"),
-        ("ServiceVisitAuditLog", "gpsLat, gpsLng, gpsAccuracy, ipAddress"),
-    ],
+    "s1_migration_rows": [(table, ", ".join(cols)) for table, cols in GPS_PURGED_COLUMNS.items()],
     "s1_migration_note": "Existing data was set to NULL before DROP. Migration is irreversible.",
 
     "s1_deleted_title": "1.2 Deleted Files (5)",
@@ -713,6 +761,29 @@ CONTENT_EN = {
         ("TimeEntryAudit", "10 years", "§147 AO — payroll records"),
     ],
 
+    "s3_dry_title": "Dry run against exported tables",
+    "s3_dry_intro": (
+        "As of {as_of}, export {dumps}. Checked: the retention job's rules, the "
+        "statutory retention periods, and the GPS columns removed in section 1. "
+        "{ok} of {checked} checks are compliant."
+    ),
+    "s3_dry_uncovered": "Not covered by the retention job: {models}.",
+    "s3_dry_headers": ["Model", "Check", "Rows", "Affected", "Result"],
+    "s3_dry_rule": "{field} older than {days} days",
+    "s3_dry_statutory": "{field} older than {years} years",
+    "s3_dry_purged": "{columns} empty",
+    "s3_dry_oldest": "oldest {date}",
+    "s3_dry_date_format": "%Y-%m-%d",
+    "s3_dry_status": {
+        "ok": "✅ Compliant",
+        "due": "✅ Deleted by next run",
+        "blocked": "⚠️ Safety threshold ({share}%), job will not delete",
+        "overdue": "Overdue",
+        "residual": "Data present",
+        "missing": "No export",
+        "error": "Error: {error}",
+    },
+
     "s3_nuke_title": "3.2 Nuclear Option (Art. 17 & Art. 28)",
     "s3_nuke_endpoint": "New Endpoint: DELETE /api/admin/workspace-wipe",
     "s3_nuke_items": [
@@ -723,6 +794,19 @@ CONTENT_EN = {
         "Irreversible — no undo",
         "Stripe subscription must be cancelled separately via customer portal",
     ],
+    "s3_schema_title": "Checked against prisma/schema.prisma",
+    "s3_schema_summary": (
+        "{cascaded} of {total} models are deleted with the workspace "
+        "(onDelete: Cascade, directly or through a parent model). "
+        "Relations into the deleted data that do not cascade:"
+    ),
+    "s3_schema_headers": ["Model", "Relation", "onDelete", "Effect"],
+    "s3_schema_effects": {
+        "SetNull": "Kept, reference cleared",
+        "Restrict": "Blocks the deletion",
+        "NoAction": "Blocks the deletion",
+        "SetDefault": "Kept, reference set to default",
+    },
 
     "s3_excluded_title": "3.3 Data Not Automatically Deleted",
     "s3_excluded_headers": ["Data Type", "Reason"],
@@ -886,39 +970,11 @@ CONTENT_EN = {
 # PDF BUILDER
 # ═══════════════════════════════════════════════════════════════
 
-def build_pdf(lang="de"):
-    """Build the DSGVO compliance PDF for the given language."""
-    c = CONTENT_DE if lang == "de" else CONTENT_EN
-    styles = build_styles()
-
-    filename = os.path.join(
-        REPORTS_DIR,
-        f"Shiftfy_DSGVO_Compliance_{lang.upper()}_{TODAY}.pdf",
-    )
-
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=A4,
-        leftMargin=18 * mm,
-        rightMargin=18 * mm,
-        topMargin=20 * mm,
-        bottomMargin=20 * mm,
-    )
-
-    def footer(canvas, doc_obj):
-        canvas.saveState()
-        canvas.setFont("DejaVu", 7.5)
-        canvas.setFillColor(TEXT_MUTED)
-        w, _ = A4
-        canvas.drawCentredString(w / 2, 10 * mm, f'{c["footer"]} {doc_obj.page}')
-        canvas.restoreState()
-
-    story = []
-
-    # ── COVER ──────────────────────────────────────────────────
-    story.append(Spacer(1, 25 * mm))
-    story.append(cover_block(c))
-    story.append(Spacer(1, 12 * mm))
+# ── COVER ──────────────────────────────────────────────────
+def cover_section(c, styles):
+    yield Spacer(1, 25 * mm)
+    yield cover_block(c)
+    yield Spacer(1, 12 * mm)
 
     # Meta table
     meta_data = [
@@ -933,98 +989,106 @@ def build_pdf(lang="de"):
         ("TEXTCOLOR", (0, 0), (0, -1), TEXT_MUTED),
         ("LINEBELOW", (0, 0), (-1, -2), 0.5, BORDER),
     ]))
-    story.append(meta_tbl)
-    story.append(PageBreak())
+    yield meta_tbl
+    yield PageBreak()
+
 
-    # ── SUMMARY ────────────────────────────────────────────────
-    story.append(Paragraph(c["summary_title"], styles["h1"]))
+# ── SUMMARY ────────────────────────────────────────────────
+def summary_section(c, styles):
+    yield Paragraph(c["summary_title"], styles["h1"])
     summary_rows = []
     for area, stat in c["summary_rows"]:
         summary_rows.append([
             Paragraph(area, styles["tc_bold"]),
             status_cell(styles, stat),
         ])
-    story.append(make_table(styles, c["summary_headers"], summary_rows, [280, 130]))
-    story.append(Spacer(1, 6 * mm))
-
-    # ── SECTION 1: GPS PURGE ──────────────────────────────────
-    story.append(Paragraph(c["s1_title"], styles["h1"]))
-    story.append(Paragraph(f'<b>{c["s1_status"]}</b>', styles["body_bold"]))
-    story.append(Paragraph(c["s1_intro"], styles["body"]))
-
-    story.append(Paragraph(c["s1_migration_title"], styles["h2"]))
-    story.append(Paragraph(f'<i>{c["s1_migration_name"]}</i>', styles["small"]))
-    story.append(Spacer(1, 2 * mm))
-    story.append(make_table(
+    yield make_table(styles, c["summary_headers"], summary_rows, [280, 130])
+    yield Spacer(1, 6 * mm)
+
+
+# ── SECTION 1: GPS PURGE ──────────────────────────────────
+def gps_purge_section(c, styles):
+    yield Paragraph(c["s1_title"], styles["h1"])
+    yield Paragraph(f'<b>{c["s1_status"]}</b>', styles["body_bold"])
+    yield Paragraph(c["s1_intro"], styles["body"])
+
+    yield Paragraph(c["s1_migration_title"], styles["h2"])
+    yield Paragraph(f'<i>{c["s1_migration_name"]}</i>', styles["small"])
+    yield Spacer(1, 2 * mm)
+    yield make_table(
         styles, c["s1_migration_headers"], c["s1_migration_rows"],
         [120, 290],
-    ))
-    story.append(Paragraph(f'<i>{c["s1_migration_note"]}</i>', styles["small"]))
-    story.append(Spacer(1, 3 * mm))
+    )
+    yield Paragraph(f'<i>{c["s1_migration_note"]}</i>', styles["small"])
+    yield Spacer(1, 3 * mm)
 
-    story.append(Paragraph(c["s1_deleted_title"], styles["h2"]))
-    story.append(make_table(
+    yield Paragraph(c["s1_deleted_title"], styles["h2"])
+    yield make_table(
         styles, c["s1_deleted_headers"], c["s1_deleted_rows"],
         [230, 180],
-    ))
+    )
 
-    story.append(Paragraph(c["s1_backend_title"], styles["h2"]))
+    yield Paragraph(c["s1_backend_title"], styles["h2"])
     for item in c["s1_backend_items"]:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+        yield Paragraph(f"• {item}", styles["bullet"])
 
-    story.append(Paragraph(c["s1_frontend_title"], styles["h2"]))
+    yield Paragraph(c["s1_frontend_title"], styles["h2"])
     for item in c["s1_frontend_items"]:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+        yield Paragraph(f"• {item}", styles["bullet"])
 
-    story.append(Paragraph(c["s1_infra_title"], styles["h2"]))
+    yield Paragraph(c["s1_infra_title"], styles["h2"])
     for item in c["s1_infra_items"]:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+        yield Paragraph(f"• {item}", styles["bullet"])
 
-    story.append(Paragraph(c["s1_kept_title"], styles["h2"]))
-    story.append(Paragraph(c["s1_kept_body"], styles["body"]))
+    yield Paragraph(c["s1_kept_title"], styles["h2"])
+    yield Paragraph(c["s1_kept_body"], styles["body"])
 
-    story.append(Paragraph(c["s1_rec_title"], styles["h3"]))
+    yield Paragraph(c["s1_rec_title"], styles["h3"])
     for item in c["s1_rec_items"]:
-        story.append(Paragraph(f"→ {item}", styles["bullet"]))
+        yield Paragraph(f"→ {item}", styles["bullet"])
+
+    yield PageBreak()
 
-    story.append(PageBreak())
 
-    # ── SECTION 2: ABSENCE MINIMIZATION ───────────────────────
-    story.append(Paragraph(c["s2_title"], styles["h1"]))
-    story.append(Paragraph(f'<b>{c["s2_status"]}</b>', styles["body_bold"]))
-    story.append(Paragraph(c["s2_intro"], styles["body"]))
+# ── SECTION 2: ABSENCE MINIMIZATION ───────────────────────
+def absence_section(c, styles):
+    yield Paragraph(c["s2_title"], styles["h1"])
+    yield Paragraph(f'<b>{c["s2_status"]}</b>', styles["body_bold"])
+    yield Paragraph(c["s2_intro"], styles["body"])
 
-    story.append(Paragraph(c["s2_migration_title"], styles["h2"]))
-    story.append(Paragraph(f'<i>{c["s2_migration_name"]}</i>', styles["small"]))
-    story.append(Spacer(1, 2 * mm))
-    story.append(make_table(
+    yield Paragraph(c["s2_migration_title"], styles["h2"])
+    yield Paragraph(f'<i>{c["s2_migration_name"]}</i>', styles["small"])
+    yield Spacer(1, 2 * mm)
+    yield make_table(
         styles, c["s2_migration_headers"], c["s2_migration_rows"],
         [100, 130, 180],
-    ))
+    )
 
-    story.append(Paragraph(c["s2_api_title"], styles["h2"]))
+    yield Paragraph(c["s2_api_title"], styles["h2"])
     for item in c["s2_api_items"]:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+        yield Paragraph(f"• {item}", styles["bullet"])
 
-    story.append(Paragraph(c["s2_frontend_title"], styles["h2"]))
+    yield Paragraph(c["s2_frontend_title"], styles["h2"])
     for item in c["s2_frontend_items"]:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+        yield Paragraph(f"• {item}", styles["bullet"])
 
-    story.append(Paragraph(c["s2_rec_title"], styles["h3"]))
+    yield Paragraph(c["s2_rec_title"], styles["h3"])
     for item in c["s2_rec_items"]:
-        story.append(Paragraph(f"→ {item}", styles["bullet"]))
+        yield Paragraph(f"→ {item}", styles["bullet"])
+
+    yield PageBreak()
 
-    story.append(PageBreak())
 
-    # ── SECTION 3: RETENTION ──────────────────────────────────
-    story.append(Paragraph(c["s3_title"], styles["h1"]))
-    story.append(Paragraph(f'<b>{c["s3_status"]}</b>', styles["body_bold"]))
-    story.append(Paragraph(c["s3_intro"], styles["body"]))
+# ── SECTION 3: RETENTION ──────────────────────────────────
+def retention_section(c, styles, dumps=None):
+    yield Paragraph(c["s3_title"], styles["h1"])
+    yield Paragraph(f'<b>{c["s3_status"]}</b>', styles["body_bold"])
+    yield Paragraph(c["s3_intro"], styles["body"])
 
-    story.append(Paragraph(c["s3_auto_title"], styles["h2"]))
-    story.append(Paragraph(f'<b>{c["s3_auto_endpoint"]}</b>', styles["body_bold"]))
-    story.append(Paragraph(c["s3_auto_cron"], styles["small"]))
-    story.append(Spacer(1, 2 * mm))
+    yield Paragraph(c["s3_auto_title"], styles["h2"])
+    yield Paragraph(f'<b>{c["s3_auto_endpoint"]}</b>', styles["body_bold"])
+    yield Paragraph(c["s3_auto_cron"], styles["small"])
+    yield Spacer(1, 2 * mm)
     # Highlight 10-year rows
     auto_rows = []
     for dtype, ret, basis in c["s3_auto_rows"]:
@@ -1036,101 +1100,193 @@ def build_pdf(lang="de"):
             ])
         else:
             auto_rows.append([dtype, ret, basis])
-    story.append(make_table(
+    yield make_table(
         styles, c["s3_auto_headers"], auto_rows,
         [130, 70, 210],
-    ))
+    )
+    if dumps:
+        yield from retention_dry_run(c, styles, dumps)
 
-    story.append(Paragraph(c["s3_nuke_title"], styles["h2"]))
-    story.append(Paragraph(f'<b>{c["s3_nuke_endpoint"]}</b>', styles["body_bold"]))
+    yield Paragraph(c["s3_nuke_title"], styles["h2"])
+    yield Paragraph(f'<b>{c["s3_nuke_endpoint"]}</b>', styles["body_bold"])
     for item in c["s3_nuke_items"]:
-        story.append(Paragraph(f"• {item}", styles["bullet"]))
+        yield Paragraph(f"• {item}", styles["bullet"])
+    yield from cascade_check(c, styles)
 
-    story.append(Paragraph(c["s3_excluded_title"], styles["h2"]))
-    story.append(make_table(
+    yield Paragraph(c["s3_excluded_title"], styles["h2"])
+    yield make_table(
         styles, c["s3_excluded_headers"], c["s3_excluded_rows"],
         [160, 250],
-    ))
+    )
 
-    story.append(Paragraph(c["s3_rec_title"], styles["h3"]))
+    yield Paragraph(c["s3_rec_title"], styles["h3"])
     for item in c["s3_rec_items"]:
-        story.append(Paragraph(f"→ {item}", styles["bullet"]))
-
-    story.append(PageBreak())
-
-    # ── SECTION 4: SECURITY ───────────────────────────────────
-    story.append(Paragraph(c["s4_title"], styles["h1"]))
-    story.append(Paragraph(f'<b>{c["s4_status"]}</b>', styles["body_bold"]))
-    story.append(Paragraph(c["s4_intro"], styles["body"]))
+        yield Paragraph(f"→ {item}", styles["bullet"])
+
+    yield PageBreak()
+
+
+@lru_cache(maxsize=None)
+def retention_audit(dumps):
+    """The dry run over *dumps*, shared by both languages."""
+    return dry_run(dumps, load_schema(), purged=GPS_PURGED_COLUMNS)
+
+
+def retention_dry_run(c, styles, dumps):
+    """Counts from the table exports in *dumps* next to the retention table."""
+    audit = retention_audit(dumps)
+    num = formatter("de" if c is CONTENT_DE else "en").integer
+    labels = c["s3_dry_status"]
+    status_style = {"ok": "tc_success", "due": "tc_success", "blocked": "tc_warning",
+                    "overdue": "tc_danger", "residual": "tc_danger"}
+    rows, ok, checked = [], 0, 0
+
+    def row(result, check, affected, status):
+        nonlocal ok, checked
+        if status not in ("missing", "error"):
+            checked += 1
+            ok += status in ("ok", "due")
+        text = labels[status].format(error=result.error, share=round(audit.threshold * 100))
+        rows.append([
+            result.check.model, check,
+            num(result.rows) if result.path else "—",
+            affected,
+            Paragraph(text, styles[status_style.get(status, "tc")]),
+        ])
 
-    story.append(Paragraph(c["s4_transport_title"], styles["h2"]))
-    story.append(make_table(
+    for result in audit.results:
+        check = result.check
+        if check.date_field:
+            if check.statutory:
+                rule = c["s3_dry_statutory"].format(field=check.date_field, years=check.days // 365)
+            else:
+                rule = c["s3_dry_rule"].format(field=check.date_field, days=check.days)
+                rule += "".join(f", {col} = {val}" for col, val in check.filters)
+            affected = num(result.expired) if result.path else "—"
+            if result.oldest is not None:
+                oldest = result.oldest.astype("datetime64[s]").item()
+                affected += " (" + c["s3_dry_oldest"].format(
+                    date=oldest.strftime(c["s3_dry_date_format"])) + ")"
+            row(result, rule, affected, result.status(audit.threshold))
+        if check.purged:
+            affected = num(result.residual) if result.path else "—"
+            row(result, c["s3_dry_purged"].format(columns=", ".join(check.purged)),
+                affected, result.purge_status())
+
+    covered = {r.check.model for r in audit.results if r.check.date_field}
+    uncovered = [dtype.split()[0] for dtype, _, _ in c["s3_auto_rows"]
+                 if dtype.split()[0] not in covered]
+
+    yield Paragraph(c["s3_dry_title"], styles["h3"])
+    yield Paragraph(c["s3_dry_intro"].format(
+        as_of=audit.as_of.item().strftime(c["s3_dry_date_format"]),
+        dumps=os.path.basename(os.path.normpath(dumps)), ok=ok, checked=checked), styles["body"])
+    yield make_table(styles, c["s3_dry_headers"], rows, [112, 118, 50, 62, 68])
+    if uncovered:
+        yield Paragraph(c["s3_dry_uncovered"].format(models=", ".join(uncovered)), styles["small"])
+
+
+def cascade_check(c, styles):
+    """What the schema says a workspace wipe deletes, and what it leaves behind."""
+    schema = load_schema()
+    deleted = schema.cascade_from("Workspace") | {"Workspace"}
+    rows = []
+    for model in schema.models:
+        if model.name in deleted:
+            continue
+        for fk in model.foreign_keys:
+            if fk.type in deleted:
+                # Prisma's default: SetNull for optional relations, Restrict otherwise
+                action = fk.relation.on_delete or ("SetNull" if fk.optional else "Restrict")
+                rows.append([
+                    model.name, f"{fk.name} → {fk.type}", action,
+                    c["s3_schema_effects"].get(action, action),
+                ])
+    yield Paragraph(c["s3_schema_title"], styles["h3"])
+    yield Paragraph(c["s3_schema_summary"].format(
+        cascaded=len(deleted) - 1, total=len(schema.models)), styles["body"])
+    if rows:
+        yield make_table(styles, c["s3_schema_headers"], rows, [95, 125, 60, 130])
+
+
+# ── SECTION 4: SECURITY ───────────────────────────────────
+def security_section(c, styles):
+    yield Paragraph(c["s4_title"], styles["h1"])
+    yield Paragraph(f'<b>{c["s4_status"]}</b>', styles["body_bold"])
+    yield Paragraph(c["s4_intro"], styles["body"])
+
+    yield Paragraph(c["s4_transport_title"], styles["h2"])
+    yield make_table(
         styles, c["s4_transport_headers"], c["s4_transport_rows"],
         [110, 40, 260],
-    ))
+    )
 
-    story.append(Paragraph(c["s4_auth_title"], styles["h2"]))
-    story.append(make_table(
+    yield Paragraph(c["s4_auth_title"], styles["h2"])
+    yield make_table(
         styles, c["s4_auth_headers"], c["s4_auth_rows"],
         [110, 40, 260],
-    ))
+    )
 
-    story.append(Paragraph(c["s4_rate_title"], styles["h2"]))
-    story.append(make_table(
+    yield Paragraph(c["s4_rate_title"], styles["h2"])
+    yield make_table(
         styles, c["s4_rate_headers"], c["s4_rate_rows"],
         [110, 80, 220],
-    ))
+    )
 
-    story.append(Paragraph(c["s4_monitoring_title"], styles["h2"]))
-    story.append(make_table(
+    yield Paragraph(c["s4_monitoring_title"], styles["h2"])
+    yield make_table(
         styles, c["s4_monitoring_headers"], c["s4_monitoring_rows"],
         [100, 100, 210],
-    ))
+    )
 
-    story.append(Paragraph(c["s4_third_title"], styles["h2"]))
-    story.append(make_table(
+    yield Paragraph(c["s4_third_title"], styles["h2"])
+    yield make_table(
         styles, c["s4_third_headers"], c["s4_third_rows"],
         [80, 130, 200],
-    ))
+    )
 
-    story.append(Paragraph(c["s4_cron_title"], styles["h2"]))
-    story.append(make_table(
+    yield Paragraph(c["s4_cron_title"], styles["h2"])
+    yield make_table(
         styles, c["s4_cron_headers"], c["s4_cron_rows"],
         [150, 130, 130],
-    ))
+    )
 
-    story.append(Paragraph(c["s4_rec_title"], styles["h3"]))
+    yield Paragraph(c["s4_rec_title"], styles["h3"])
     for item in c["s4_rec_items"]:
-        story.append(Paragraph(f"→ {item}", styles["bullet"]))
+        yield Paragraph(f"→ {item}", styles["bullet"])
+
+    yield PageBreak()
 
-    story.append(PageBreak())
 
-    # ── SECTION 5: CHANGELOG ──────────────────────────────────
-    story.append(Paragraph(c["s5_title"], styles["h1"]))
+# ── SECTION 5: CHANGELOG ──────────────────────────────────
+def changelog_section(c, styles):
+    yield Paragraph(c["s5_title"], styles["h1"])
 
-    story.append(Paragraph(c["s5_deleted_title"], styles["h2"]))
+    yield Paragraph(c["s5_deleted_title"], styles["h2"])
     for i, f in enumerate(c["s5_deleted"], 1):
-        story.append(Paragraph(f"{i}. {f}", styles["bullet"]))
+        yield Paragraph(f"{i}. {f}", styles["bullet"])
 
-    story.append(Paragraph(c["s5_new_title"], styles["h2"]))
+    yield Paragraph(c["s5_new_title"], styles["h2"])
     for i, f in enumerate(c["s5_new"], 1):
-        story.append(Paragraph(f"{i}. {f}", styles["bullet"]))
+        yield Paragraph(f"{i}. {f}", styles["bullet"])
 
-    story.append(Paragraph(c["s5_changed_title"], styles["h2"]))
+    yield Paragraph(c["s5_changed_title"], styles["h2"])
     for i, f in enumerate(c["s5_changed"], 1):
-        story.append(Paragraph(f"{i}. {f}", styles["bullet"]))
+        yield Paragraph(f"{i}. {f}", styles["bullet"])
 
-    story.append(Paragraph(c["s5_migrations_title"], styles["h2"]))
+    yield Paragraph(c["s5_migrations_title"], styles["h2"])
     for i, m in enumerate(c["s5_migrations"], 1):
-        story.append(Paragraph(f"{i}. {m}", styles["bullet"]))
+        yield Paragraph(f"{i}. {m}", styles["bullet"])
 
-    story.append(Spacer(1, 4 * mm))
-    story.append(Paragraph(f'<b>{c["s5_tests"]}</b>', styles["body_bold"]))
+    yield Spacer(1, 4 * mm)
+    yield Paragraph(f'<b>{c["s5_tests"]}</b>', styles["body_bold"])
 
-    story.append(PageBreak())
+    yield PageBreak()
 
-    # ── SECTION 6: RECOMMENDATIONS ────────────────────────────
-    story.append(Paragraph(c["s6_title"], styles["h1"]))
+
+# ── SECTION 6: RECOMMENDATIONS ────────────────────────────
+def recommendations_section(c, styles):
+    yield Paragraph(c["s6_title"], styles["h1"])
     rec_rows = []
     for num, action, prio, effort in c["s6_rows"]:
         prio_style = styles["tc_warning"] if prio in ("Hoch", "High") else styles["tc"]
@@ -1140,19 +1296,65 @@ def build_pdf(lang="de"):
             Paragraph(prio, prio_style),
             Paragraph(effort, styles["tc"]),
         ])
-    story.append(make_table(
+    yield make_table(
         styles, c["s6_headers"], rec_rows,
         [25, 240, 65, 80],
-    ))
+    )
+
+    yield Spacer(1, 10 * mm)
+    yield HRFlowable(width="100%", thickness=1, color=BORDER)
+    yield Spacer(1, 4 * mm)
+    yield Paragraph(f'<i>{c["closing"]}</i>', styles["small"])
+
+
+def build_pdf(lang="de", output=None, dumps=None):
+    """Build the DSGVO compliance PDF for the given language.
 
-    story.append(Spacer(1, 10 * mm))
-    story.append(HRFlowable(width="100%", thickness=1, color=BORDER))
-    story.append(Spacer(1, 4 * mm))
-    story.append(Paragraph(f'<i>{c["closing"]}</i>', styles["small"]))
+    *output* is a path or writable stream (default: the dated file in
+    ``reports/``); returns a ``RenderResult``. *dumps* is a directory of
+    table exports for the retention dry run (default: ``$REPORTS_RETENTION_DUMPS``).
+    """
+    c = CONTENT_DE if lang == "de" else CONTENT_EN
+    dumps = dumps or os.environ.get(DUMPS_ENV)
+    styles = build_styles()
+
+    out = PdfOutput(
+        f"dsgvo-{lang}", output,
+        os.path.join(REPORTS_DIR, f"Shiftfy_DSGVO_Compliance_{lang.upper()}_{TODAY}.pdf"),
+    )
+
+    doc = SimpleDocTemplate(
+        out,
+        pagesize=A4,
+        leftMargin=18 * mm,
+        rightMargin=18 * mm,
+        topMargin=20 * mm,
+        bottomMargin=20 * mm,
+    )
 
-    # Build
-    doc.build(story, onFirstPage=footer, onLaterPages=footer)
-    return filename
+    def footer(canvas, doc_obj):
+        canvas.saveState()
+        canvas.setFont("DejaVu", 7.5)
+        canvas.setFillColor(TEXT_MUTED)
+        w, _ = A4
+        canvas.drawCentredString(w / 2, 10 * mm, f'{c["footer"]} {doc_obj.page}')
+        canvas.restoreState()
+
+    profiler = RenderProfiler(f"dsgvo-{lang}", levels=("H1", "H2"))
+    # Sections are generators: layout pulls flowables as it reaches them.
+    # Each group starts on a new page and can be laid out on its own
+    # (REPORTS_JOBS > 1, see reportlib/parallel.py).
+    groups = [
+        (cover_section(c, styles),),
+        (summary_section(c, styles), gps_purge_section(c, styles)),
+        (absence_section(c, styles),),
+        (retention_section(c, styles, dumps),),
+        (security_section(c, styles),),
+        (changelog_section(c, styles),),
+        (recommendations_section(c, styles),),
+    ]
+    build_sections(doc, groups, profiler=profiler, onFirstPage=footer, onLaterPages=footer)
+    return out.result(doc)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1160,15 +1362,20 @@ def build_pdf(lang="de"):
 # ═══════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the Shiftfy DSGVO reports.")
+    parser.add_argument("--dumps", metavar="DIR",
+                        help=f"table exports for the retention dry run (default: ${DUMPS_ENV})")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("  Shiftfy — DSGVO Compliance Report Generator")
     print("=" * 60)
     print()
 
-    de_path = build_pdf("de")
+    de_path = build_pdf("de", dumps=args.dumps)
     print(f"  ✓  German report:  {de_path}")
 
-    en_path = build_pdf("en")
+    en_path = build_pdf("en", dumps=args.dumps)
     print(f"  ✓  English report: {en_path}")
 
     print()
@@ -5,15 +5,13 @@ Generates a professional PDF report.
 """
 
 import os
-from datetime import date
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm, cm
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.platypus import (
     SimpleDocTemplate,
-    Paragraph,
     Spacer,
     Table,
     TableStyle,
@@ -22,6 +20,17 @@ from reportlab.platypus import (
     KeepTogether,
 )
 
+from reportlib.buildinfo import BUILD_DATE
+from reportlib.charts import line_chart
+from reportlib.layoutcache import Paragraph
+from reportlib.numfmt import EN_US, Formatter
+from reportlib.output import PdfOutput
+from reportlib.priceopt import CONVERSION, STRIPE_FEE, WORKSPACES, price_study
+from reportlib.pricing import ANNUAL, FAIR_TABLE, MARKET_TABLE, TEAM_TABLE, comparison
+from reportlib.profiling import RenderProfiler
+from reportlib.styles import register_theme, sample_styles
+from reportlib.tables import build_table
+
 # ─── Colours ─────────────────────────────────────────────────
 EMERALD = colors.HexColor("#059669")
 EMERALD_LIGHT = colors.HexColor("#d1fae5")
@@ -40,78 +49,84 @@ BLUE_TEXT = colors.HexColor("#2563eb")
 
 # ─── Output path ─────────────────────────────────────────────
 OUT_DIR = os.path.join(os.path.dirname(__file__), "..", "reports")
-os.makedirs(OUT_DIR, exist_ok=True)
 OUT_PATH = os.path.join(OUT_DIR, "shiftfy-vs-clockin-pricing-report.pdf")
 
 # ─── Styles ──────────────────────────────────────────────────
-styles = getSampleStyleSheet()
-
-styles.add(ParagraphStyle(
-    "CoverTitle", parent=styles["Title"],
-    fontSize=28, leading=34, textColor=DARK,
-    spaceAfter=6, alignment=TA_LEFT, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "CoverSub", parent=styles["Normal"],
-    fontSize=14, leading=20, textColor=GRAY_500,
-    spaceAfter=4, fontName="Helvetica",
-))
-styles.add(ParagraphStyle(
-    "SectionHead", parent=styles["Heading1"],
-    fontSize=18, leading=24, textColor=EMERALD,
-    spaceBefore=20, spaceAfter=10, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "SubHead", parent=styles["Heading2"],
-    fontSize=13, leading=18, textColor=DARK,
-    spaceBefore=14, spaceAfter=6, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "Body", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=GRAY_700,
-    spaceAfter=6, fontName="Helvetica",
-))
-styles.add(ParagraphStyle(
-    "BodyBold", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=DARK,
-    spaceAfter=6, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "SmallGray", parent=styles["Normal"],
-    fontSize=8, leading=11, textColor=GRAY_500,
-    spaceAfter=4, fontName="Helvetica",
-))
-styles.add(ParagraphStyle(
-    "TableCell", parent=styles["Normal"],
-    fontSize=9, leading=12, textColor=GRAY_700,
-    fontName="Helvetica",
-))
-styles.add(ParagraphStyle(
-    "TableCellBold", parent=styles["Normal"],
-    fontSize=9, leading=12, textColor=DARK,
-    fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "TableHeader", parent=styles["Normal"],
-    fontSize=9, leading=12, textColor=WHITE,
-    fontName="Helvetica-Bold", alignment=TA_CENTER,
-))
-styles.add(ParagraphStyle(
-    "CalloutBody", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=DARK,
-    fontName="Helvetica", spaceAfter=4,
-))
-styles.add(ParagraphStyle(
-    "BulletItem", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=GRAY_700,
-    fontName="Helvetica", leftIndent=14, bulletIndent=0,
-    spaceAfter=3,
-))
-styles.add(ParagraphStyle(
-    "WinnerCell", parent=styles["Normal"],
-    fontSize=9, leading=12, textColor=GREEN_TEXT,
-    fontName="Helvetica-Bold", alignment=TA_CENTER,
-))
+@register_theme("pricing_comparison_en")
+def build_styles():
+    """Return the report's paragraph styles (built once per process)."""
+    ss = sample_styles()
+    return {
+        "CoverTitle": ParagraphStyle(
+            "CoverTitle", parent=ss["Title"],
+            fontSize=28, leading=34, textColor=DARK,
+            spaceAfter=6, alignment=TA_LEFT, fontName="Helvetica-Bold",
+        ),
+        "CoverSub": ParagraphStyle(
+            "CoverSub", parent=ss["Normal"],
+            fontSize=14, leading=20, textColor=GRAY_500,
+            spaceAfter=4, fontName="Helvetica",
+        ),
+        "SectionHead": ParagraphStyle(
+            "SectionHead", parent=ss["Heading1"],
+            fontSize=18, leading=24, textColor=EMERALD,
+            spaceBefore=20, spaceAfter=10, fontName="Helvetica-Bold",
+        ),
+        "SubHead": ParagraphStyle(
+            "SubHead", parent=ss["Heading2"],
+            fontSize=13, leading=18, textColor=DARK,
+            spaceBefore=14, spaceAfter=6, fontName="Helvetica-Bold",
+        ),
+        "Body": ParagraphStyle(
+            "Body", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=GRAY_700,
+            spaceAfter=6, fontName="Helvetica",
+        ),
+        "BodyBold": ParagraphStyle(
+            "BodyBold", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=DARK,
+            spaceAfter=6, fontName="Helvetica-Bold",
+        ),
+        "SmallGray": ParagraphStyle(
+            "SmallGray", parent=ss["Normal"],
+            fontSize=8, leading=11, textColor=GRAY_500,
+            spaceAfter=4, fontName="Helvetica",
+        ),
+        "TableCell": ParagraphStyle(
+            "TableCell", parent=ss["Normal"],
+            fontSize=9, leading=12, textColor=GRAY_700,
+            fontName="Helvetica",
+        ),
+        "TableCellBold": ParagraphStyle(
+            "TableCellBold", parent=ss["Normal"],
+            fontSize=9, leading=12, textColor=DARK,
+            fontName="Helvetica-Bold",
+        ),
+        "TableHeader": ParagraphStyle(
+            "TableHeader", parent=ss["Normal"],
+            fontSize=9, leading=12, textColor=WHITE,
+            fontName="Helvetica-Bold", alignment=TA_CENTER,
+        ),
+        "CalloutBody": ParagraphStyle(
+            "CalloutBody", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=DARK,
+            fontName="Helvetica", spaceAfter=4,
+        ),
+        "BulletItem": ParagraphStyle(
+            "BulletItem", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=GRAY_700,
+            fontName="Helvetica", leftIndent=14, bulletIndent=0,
+            spaceAfter=3,
+        ),
+        "WinnerCell": ParagraphStyle(
+            "WinnerCell", parent=ss["Normal"],
+            fontSize=9, leading=12, textColor=GREEN_TEXT,
+            fontName="Helvetica-Bold", alignment=TA_CENTER,
+        ),
+    }
+
+
+styles = build_styles()
 
 # ─── Helpers ─────────────────────────────────────────────────
 
@@ -132,36 +147,32 @@ def hr():
 
 def make_table(data, col_widths=None, header_rows=1):
     """Create a styled table with emerald header."""
-    t = Table(data, colWidths=col_widths, repeatRows=header_rows)
-    style_cmds = [
-        # Header
-        ("BACKGROUND", (0, 0), (-1, header_rows - 1), EMERALD),
-        ("TEXTCOLOR", (0, 0), (-1, header_rows - 1), WHITE),
-        ("FONTNAME", (0, 0), (-1, header_rows - 1), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, header_rows - 1), 9),
-        ("BOTTOMPADDING", (0, 0), (-1, header_rows - 1), 8),
-        ("TOPPADDING", (0, 0), (-1, header_rows - 1), 8),
-        # Body
-        ("FONTNAME", (0, header_rows), (-1, -1), "Helvetica"),
-        ("FONTSIZE", (0, header_rows), (-1, -1), 9),
-        ("TEXTCOLOR", (0, header_rows), (-1, -1), GRAY_700),
-        ("BOTTOMPADDING", (0, header_rows), (-1, -1), 6),
-        ("TOPPADDING", (0, header_rows), (-1, -1), 6),
-        # Grid
-        ("GRID", (0, 0), (-1, -1), 0.5, GRAY_200),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        # First column bold
-        ("FONTNAME", (0, header_rows), (0, -1), "Helvetica-Bold"),
-        ("TEXTCOLOR", (0, header_rows), (0, -1), DARK),
-    ]
-    # Alternating row colours
-    for i in range(header_rows, len(data)):
-        if i % 2 == 0:
-            style_cmds.append(("BACKGROUND", (0, i), (-1, i), GRAY_50))
-        else:
-            style_cmds.append(("BACKGROUND", (0, i), (-1, i), WHITE))
-    t.setStyle(TableStyle(style_cmds))
-    return t
+    return build_table(
+        data, col_widths, header_rows,
+        style=[
+            # Header
+            ("BACKGROUND", (0, 0), (-1, header_rows - 1), EMERALD),
+            ("TEXTCOLOR", (0, 0), (-1, header_rows - 1), WHITE),
+            ("FONTNAME", (0, 0), (-1, header_rows - 1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, header_rows - 1), 9),
+            ("BOTTOMPADDING", (0, 0), (-1, header_rows - 1), 8),
+            ("TOPPADDING", (0, 0), (-1, header_rows - 1), 8),
+            # Body
+            ("FONTNAME", (0, header_rows), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, header_rows), (-1, -1), 9),
+            ("TEXTCOLOR", (0, header_rows), (-1, -1), GRAY_700),
+            ("BOTTOMPADDING", (0, header_rows), (-1, -1), 6),
+            ("TOPPADDING", (0, header_rows), (-1, -1), 6),
+            # Grid
+            ("GRID", (0, 0), (-1, -1), 0.5, GRAY_200),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            # First column bold
+            ("FONTNAME", (0, header_rows), (0, -1), "Helvetica-Bold"),
+            ("TEXTCOLOR", (0, header_rows), (0, -1), DARK),
+        ],
+        # Alternating row colours
+        zebra=(WHITE, GRAY_50),
+    )
 
 def callout_box(title, body_lines, bg=EMERALD_50, border=EMERALD):
     """A highlight callout box."""
@@ -185,14 +196,56 @@ def callout_box(title, body_lines, bg=EMERALD_50, border=EMERALD):
 def bullet(text):
     return Paragraph(f"• {text}", styles["BulletItem"])
 
+FMT = Formatter(EN_US)
+
+def eur(v, decimals=2):
+    return FMT.currency(v, decimals)
+
+def pct(fraction):
+    return f"{abs(fraction) * 100:.0f}%"
+
+def span(low, high):
+    return f"{abs(low) * 100:.0f}–{pct(high)}"
+
+def delta(ours, theirs, amount=True):
+    """Savings cell: "−25% (€1.00)" when Shiftfy is cheaper, "+12% (€26.00 more)" otherwise."""
+    saved = 1 - ours / theirs
+    if saved >= 0:
+        return f"−{pct(saved)} ({eur(theirs - ours)})" if amount else f"−{pct(saved)} ✓"
+    return f"+{pct(saved)} ({eur(ours - theirs)} more)"
+
+def users(n):
+    return "any size" if n == float("inf") else f"{n:,} users"
+
+def switch_reason(rivalry, x):
+    """Why the cheaper side changes at crossover *x*."""
+    rival = rivalry.rival
+    if x.kind == "price":
+        n = x.users
+        return f"Equal cost at {n.numerator if n.denominator == 1 else f'{float(n):.1f}'} users"
+    if x.kind == "limit":
+        plan = x.below if x.below.vendor == "Shiftfy" else x.above
+        return f"Shiftfy {plan.plan} ends at {users(plan.max_users)}"
+    if x.above is rival:
+        return f"{rival.vendor} sold from {users(rival.min_users)}"
+    return f"{rival.vendor} sold up to {users(rival.max_users)}"
+
+def rival_name(offer):
+    return offer.label if offer.vendor == "Clockin" else offer.vendor
+
+def shade_losses(table, rows, column):
+    """Red text in *column* for the body *rows* where Shiftfy costs more."""
+    table.setStyle(TableStyle([("TEXTCOLOR", (column, r), (column, r), RED_TEXT) for r in rows]))
+
 
 # ═════════════════════════════════════════════════════════════
 #  BUILD DOCUMENT
 # ═════════════════════════════════════════════════════════════
 
-def build():
+def build(output=None):
+    out = PdfOutput("pricing-en", output, OUT_PATH)
     doc = SimpleDocTemplate(
-        OUT_PATH,
+        out,
         pagesize=A4,
         topMargin=20 * mm,
         bottomMargin=20 * mm,
@@ -202,8 +255,15 @@ def build():
         author="Shiftfy GmbH",
     )
 
-    story = []
+    profiler = RenderProfiler("pricing-en", levels=("SectionHead", "SubHead"))
+    story = profiler.story()
     W = doc.width  # usable width
+    cmp = comparison()
+    book = cmp.book
+    shiftfy, annual = book.vendor("Shiftfy"), book.vendor("Shiftfy", ANNUAL)
+    stechuhr = book.vendor("Clockin")[0]
+    shift_addon = book.addons["Clockin"]["Schichtplanung"]
+    tier_low, tier_high = cmp.tier_savings
 
     # ─────────────────────────────────────────────────────────
     # COVER
@@ -213,7 +273,7 @@ def build():
     story.append(Paragraph("Competitive Pricing &amp; Feature Analysis", styles["CoverSub"]))
     story.append(spacer(6))
     story.append(Paragraph(
-        f"Prepared by Shiftfy · {date.today().strftime('%B %d, %Y')} · Confidential",
+        f"Prepared by Shiftfy · {BUILD_DATE.strftime('%B %d, %Y')} · Confidential",
         styles["SmallGray"],
     ))
     story.append(spacer(10))
@@ -223,8 +283,8 @@ def build():
     stats_data = [
         ["", "Shiftfy", "Clockin"],
         ["Pricing model", "Pure per-user\n(no base fee)", "Pure per-user\n(no base fee)"],
-        ["Entry price", "€2.99/user/mo", "€3.99/user/mo"],
-        ["Shift planning", "Included in every plan", "Add-on €24/mo"],
+        ["Entry price", f"{eur(shiftfy[0].per_user)}/user/mo", f"{eur(stechuhr.per_user)}/user/mo"],
+        ["Shift planning", "Included in every plan", f"Add-on {eur(shift_addon, 0)}/mo"],
         ["Annual discount", "Up to 20%", "Up to 20% (24 months)"],
         ["Free trial", "14 days", "14 days"],
         ["Target market", "German SMBs", "German SMBs\n(Handwerk, Pflege)"],
@@ -236,8 +296,8 @@ def build():
     story.append(callout_box(
         "💡 Key Takeaway",
         [
-            "Shiftfy is <b>25–29% cheaper</b> than Clockin at every tier, "
-            "while <b>including shift planning for free</b> — a feature Clockin charges €24/month extra for. "
+            f"Shiftfy is <b>{span(tier_low, tier_high)} cheaper</b> than Clockin at every tier, "
+            f"while <b>including shift planning for free</b> — a feature Clockin charges {eur(shift_addon, 0)}/month extra for. "
             "This makes Shiftfy the clear price-performance leader for shift-based businesses."
         ],
     ))
@@ -266,26 +326,25 @@ def build():
     story.append(heading("2. Pricing Comparison"))
 
     story.append(subheading("2.1 Clockin Plans (per user, no base fee)"))
-    clockin_data = [
-        ["Plan", "Monthly", "12 months", "24 months (−20%)"],
-        ["Digitale Stechuhr", "€3.99/user", "€3.59/user", "€3.19/user"],
-        ["Projektzeiterfassung", "€6.99/user", "€6.29/user", "€5.59/user"],
-        ["Zeiterfassung &\nDokumentation", "€9.99/user", "€8.99/user", "€7.99/user"],
-    ]
+    clockin_data = [["Plan", "Monthly", "12 months", "24 months (−20%)"]]
+    clockin = book.offers_by_plan("Clockin")
+    for plan, offers in clockin.items():
+        clockin_data.append([plan.replace(" & ", " &\n")] +
+                            [f"{eur(offers[term].per_user)}/user" for term in (1, 12, 24)])
     story.append(make_table(clockin_data, col_widths=[42 * mm, 35 * mm, 35 * mm, 42 * mm]))
     story.append(spacer(4))
-    story.append(p("<b>Clockin Add-ons (flat fees):</b> Schichtplanung ab €24/mo · "
-                    "Videodokumentation ab €79/mo · Gesprächsnotizen ab €49/mo · "
-                    "Telefonassistent ab €99/mo"))
+    story.append(p("<b>Clockin Add-ons (flat fees):</b> " + " · ".join(
+        f"{name} ab {eur(price, 0)}/mo" for name, price in book.addons["Clockin"].items())))
 
     story.append(spacer(6))
     story.append(subheading("2.2 Shiftfy Plans (per user, no base fee)"))
-    shiftfy_data = [
-        ["Plan", "Monthly", "Annual (savings)"],
-        ["Basic", "€2.99/user", "€2.49/user (−17%)"],
-        ["Professional", "€4.99/user", "€3.99/user (−20%)"],
-        ["Enterprise", "€7.99/user", "€6.49/user (−19%)"],
-    ]
+    shiftfy_data = [["Plan", "Monthly", "Annual (savings)"]]
+    for monthly, yearly in zip(shiftfy, annual):
+        shiftfy_data.append([
+            monthly.plan,
+            f"{eur(monthly.per_user)}/user",
+            f"{eur(yearly.per_user)}/user (−{pct(1 - yearly.per_user / monthly.per_user)})",
+        ])
     story.append(make_table(shiftfy_data, col_widths=[42 * mm, 42 * mm, 52 * mm]))
     story.append(spacer(4))
     story.append(p("<b>No add-ons needed:</b> Shift planning, team chat, absence management, "
@@ -299,12 +358,10 @@ def build():
     story.append(p("All prices are monthly per-user rates. Green = cheaper option."))
 
     story.append(subheading("3.1 Tier-by-Tier (Monthly Billing)"))
-    tier_data = [
-        ["Tier", "Shiftfy", "Clockin", "Shiftfy Savings"],
-        ["Entry / Basic", "€2.99", "€3.99", "−25% ✓"],
-        ["Mid / Professional", "€4.99", "€6.99", "−29% ✓"],
-        ["Top / Enterprise", "€7.99", "€9.99", "−20% ✓"],
-    ]
+    tier_data = [["Tier", "Shiftfy", "Clockin", "Shiftfy Savings"]]
+    for level, (ours, theirs, saved) in zip(("Entry", "Mid", "Top"), cmp.tiers):
+        tier_data.append([f"{level} / {ours.plan}", eur(ours.per_user), eur(theirs.per_user),
+                          f"−{pct(saved)} ✓"])
     t = make_table(tier_data, col_widths=[38 * mm, 32 * mm, 32 * mm, 38 * mm])
     # Highlight savings column
     t.setStyle(TableStyle([
@@ -313,56 +370,83 @@ def build():
     ]))
     story.append(t)
 
+    limits = ", ".join(f"{o.plan} up to {o.max_users:,} users" for o in shiftfy if o.max_users < float("inf"))
     story.append(spacer(8))
-    story.append(subheading("3.2 Total Monthly Cost by Team Size (Basic tier)"))
-    story.append(p("Clockin Basic (Digitale Stechuhr) vs Shiftfy Basic — monthly billing."))
-
-    team_sizes = [1, 3, 5, 10, 15, 20, 30, 50, 100]
-    team_data = [["Team Size", "Shiftfy Basic", "Clockin Stechuhr", "Δ (Savings)"]]
-    for n in team_sizes:
-        s = n * 2.99
-        c = n * 3.99
-        delta = ((c - s) / c) * 100
-        team_data.append([
-            f"{n} users",
-            f"€{s:,.2f}",
-            f"€{c:,.2f}",
-            f"−{delta:.0f}% (€{c - s:,.2f})",
-        ])
-    story.append(make_table(team_data, col_widths=[28 * mm, 35 * mm, 38 * mm, 40 * mm]))
+    story.append(subheading("3.2 Total Monthly Cost by Team Size"))
+    story.append(p("Clockin Basic (Digitale Stechuhr) vs the cheapest Shiftfy plan a team of that size "
+                   f"may use ({limits}) — monthly billing."))
+
+    plans, ours, theirs = cmp.team
+    team_data = [["Team Size", "Shiftfy Plan", "Shiftfy", "Clockin Stechuhr", "Δ (Savings)"]]
+    for n, plan, s, c in zip(TEAM_TABLE, plans, ours, theirs):
+        team_data.append([f"{n} users", plan, eur(s), eur(c), delta(s, c)])
+    t1 = make_table(team_data, col_widths=[24 * mm, 28 * mm, 28 * mm, 32 * mm, 46 * mm])
+    shade_losses(t1, [i for i, (s, c) in enumerate(zip(ours, theirs), 1) if s > c], 4)
+    story.append(t1)
 
     story.append(spacer(8))
-    story.append(subheading("3.3 Fair Comparison: Shiftfy Basic vs Clockin + Schichtplanung Add-on"))
-    story.append(p("Since Clockin charges <b>€24/mo extra</b> for shift planning, "
+    story.append(subheading("3.3 Fair Comparison: Shiftfy vs Clockin + Schichtplanung Add-on"))
+    story.append(p(f"Since Clockin charges <b>{eur(shift_addon, 0)}/mo extra</b> for shift planning, "
                     "the fair comparison adds that to Clockin's cost:"))
 
-    addon_data = [["Team Size", "Shiftfy Basic", "Clockin + Schichtplanung", "Δ (Savings)"]]
-    for n in [1, 5, 10, 20, 50, 100]:
-        s = n * 2.99
-        c = n * 3.99 + 24.0
-        delta = ((c - s) / c) * 100
-        addon_data.append([
-            f"{n} users",
-            f"€{s:,.2f}",
-            f"€{c:,.2f}",
-            f"−{delta:.0f}% ✓",
-        ])
-    t2 = make_table(addon_data, col_widths=[28 * mm, 35 * mm, 45 * mm, 35 * mm])
+    plans, ours, theirs = cmp.fair
+    addon_data = [["Team Size", "Shiftfy Plan", "Shiftfy", "Clockin + Schichtplanung", "Δ (Savings)"]]
+    for n, plan, s, c in zip(FAIR_TABLE, plans, ours, theirs):
+        addon_data.append([f"{n} users", plan, eur(s), eur(c), delta(s, c, amount=False)])
+    t2 = make_table(addon_data, col_widths=[24 * mm, 28 * mm, 26 * mm, 42 * mm, 38 * mm])
     t2.setStyle(TableStyle([
-        ("TEXTCOLOR", (3, 1), (3, -1), GREEN_TEXT),
-        ("FONTNAME", (3, 1), (3, -1), "Helvetica-Bold"),
+        ("TEXTCOLOR", (4, 1), (4, -1), GREEN_TEXT),
+        ("FONTNAME", (4, 1), (4, -1), "Helvetica-Bold"),
     ]))
+    shade_losses(t2, [i for i, (s, c) in enumerate(zip(ours, theirs), 1) if s > c], 4)
     story.append(t2)
 
     story.append(spacer(6))
-    story.append(callout_box(
-        "🏆 Shiftfy wins at EVERY team size",
-        [
-            "When shift planning is required, Shiftfy is <b>47–89% cheaper</b> "
-            "than Clockin for teams of 1–100 users, because shift scheduling "
-            "is included at no extra cost."
-        ],
-    ))
+    fair_low, fair_high = cmp.fair_savings
+    turn = cmp.fair_crossover
+    if turn is None:
+        story.append(callout_box(
+            "🏆 Shiftfy wins at EVERY team size",
+            [
+                f"When shift planning is required, Shiftfy is <b>{span(fair_low, fair_high)} cheaper</b> "
+                f"than Clockin for teams of {FAIR_TABLE[0]}–{FAIR_TABLE[-1]} users, because shift scheduling "
+                "is included at no extra cost."
+            ],
+        ))
+    else:
+        story.append(callout_box(
+            f"🏆 Shiftfy wins for teams of up to {turn.team_size - 1} users",
+            [
+                f"When shift planning is required, Shiftfy is <b>{span(fair_low, fair_high)} cheaper</b> "
+                f"than Clockin for teams of 1–{turn.team_size - 1} users, because shift scheduling "
+                f"is included at no extra cost. From {turn.team_size} users, {turn.above.label} "
+                f"costs less than Shiftfy {turn.below.plan} ({switch_reason(cmp.rivals[0], turn).lower()})."
+            ],
+        ))
+
+    story.append(spacer(8))
+    story.append(subheading("3.4 Break-even Points"))
+    story.append(p("Which offer is cheaper for every team size from 1 to 10,000, against the cheapest "
+                   "Shiftfy plan a team may use. The other vendors are priced at their entry rate per seat "
+                   "and only for the team sizes they sell to (see the profit report's competitor table)."))
+    breakeven = [["Compared with", "Cheaper option by team size", "Switch"]]
+    for rivalry in cmp.rivals:
+        breakeven.append([
+            rival_name(rivalry.rival).replace(" + ", "\n+ "),
+            "\n".join(f"{o.vendor}: {lo:,}–{hi:,}" if hi else f"{o.vendor}: {lo:,}+"
+                      for lo, hi, o in rivalry.segments()),
+            "\n".join(switch_reason(rivalry, x) for x in rivalry.crossovers) or "—",
+        ])
+    story.append(make_table(breakeven, col_widths=[46 * mm, 50 * mm, 64 * mm]))
+
+    story.append(spacer(8))
+    story.append(subheading("3.5 Monthly Cost by Vendor and Team Size"))
+    market = [["Vendor"] + [f"{n:,}" for n in MARKET_TABLE]]
+    for vendor, costs in cmp.market:
+        market.append([vendor + ("*" if vendor == "Clockin" else "")] + list(eur(costs, 0)))
+    story.append(make_table(market, col_widths=[30 * mm] + [19 * mm] * len(MARKET_TABLE)))
+    story.append(p("* Digitale Stechuhr + Schichtplanung. Shiftfy on its cheapest plan for the team size. "
+                   "— = not sold at that team size.", "SmallGray"))
 
     # ─────────────────────────────────────────────────────────
     # 4. FEATURE COMPARISON
@@ -377,7 +461,7 @@ def build():
 
     features = [
         ["Feature", "Shiftfy Basic", "Shiftfy Pro", "Shiftfy Ent.", "Clockin"],
-        ["Shift Planning", YES, YES, YES, f"{PAID} €24/mo"],
+        ["Shift Planning", YES, YES, YES, f"{PAID} {eur(shift_addon, 0)}/mo"],
         ["Time Tracking", YES, YES, YES, YES],
         ["Absence Mgmt", YES, YES, YES, f"{YES} (basic)"],
         ["Team Chat", YES, YES, YES, NO],
@@ -409,8 +493,8 @@ def build():
 
     story.append(subheading("5.1 Shiftfy's Advantages"))
     for item in [
-        "<b>25–29% cheaper</b> than Clockin at every comparable tier",
-        "<b>Shift planning included</b> in every plan — Clockin charges €24/mo extra",
+        f"<b>{span(tier_low, tier_high)} cheaper</b> than Clockin at every comparable tier",
+        f"<b>Shift planning included</b> in every plan — Clockin charges {eur(shift_addon, 0)}/mo extra",
         "<b>Team chat built-in</b> — Clockin has no messaging feature",
         "<b>Auto-scheduling (Pro)</b> — AI-powered shift generation, no Clockin equivalent",
         "<b>Custom roles &amp; API/webhooks (Pro)</b> — Developer-friendly, no Clockin equivalent",
@@ -461,6 +545,7 @@ def build():
     # ─────────────────────────────────────────────────────────
     story.append(spacer(8))
     story.append(heading("7. Revenue Scenarios (New Pricing)"))
+    story.append(subheading("7.1 Today's Prices"))
     story.append(p("Projected monthly recurring revenue (MRR) at different customer milestones, "
                     "assuming 80% Basic / 15% Professional / 5% Enterprise mix, "
                     "average 12 users per workspace, monthly billing."))
@@ -468,9 +553,9 @@ def build():
     rev_data = [["Workspaces", "Avg Users", "MRR", "ARR"]]
     for ws in [50, 100, 250, 500, 1000]:
         users_per = 12
-        basic_rev = ws * 0.80 * users_per * 2.99
-        pro_rev = ws * 0.15 * users_per * 4.99
-        ent_rev = ws * 0.05 * users_per * 7.99
+        basic_rev = ws * 0.80 * users_per * shiftfy[0].per_user
+        pro_rev = ws * 0.15 * users_per * shiftfy[1].per_user
+        ent_rev = ws * 0.05 * users_per * shiftfy[2].per_user
         mrr = basic_rev + pro_rev + ent_rev
         arr = mrr * 12
         rev_data.append([
@@ -481,13 +566,57 @@ def build():
         ])
     story.append(make_table(rev_data, col_widths=[32 * mm, 32 * mm, 40 * mm, 45 * mm]))
 
+    study = price_study()
+    model, now = study.model, study.current
+    story.append(spacer(6))
+    story.append(subheading("7.2 Optimal Price Points"))
+    story.append(p(
+        "The mix above is fixed. Here it follows the prices: the further a tier's price moves above "
+        "Clockin's comparable tier, the fewer prospects buy it, and a cheaper tier draws buyers from the "
+        f"others. The demand model reproduces today's mix, {CONVERSION * 100:.0f}% conversion and "
+        f"{WORKSPACES:,} workspaces at today's prices, with an elasticity of {model.elasticity} per 100% "
+        f"price gap. Margin is ARR after {STRIPE_FEE * 100:.1f}% payment fees and {eur(model.seat_cost)} "
+        "cost per seat and month (the profit report's gross margin). Each optimum is the best of "
+        f"{study.arr.combinations:,} price combinations on a 5-cent grid "
+        f"({study.arr.scored:,} with every tier dearer than the one below)."
+    ))
+    opt = [["", "Today", "Max ARR", "Max margin"]]
+    outcomes = (now, study.arr.outcome, study.margin.outcome)
+    for i, tier in enumerate(model.tiers):
+        opt.append([f"{tier} (per user)"] + [eur(o.prices[i]) for o in outcomes])
+    opt.append(["Workspaces"] + [f"{sum(o.workspaces):,.0f}" for o in outcomes])
+    opt.append(["ARR"] + [eur(o.arr, 0) for o in outcomes])
+    opt.append(["Margin"] + [eur(o.margin, 0) for o in outcomes])
+    t3 = make_table(opt, col_widths=[40 * mm, 36 * mm, 36 * mm, 36 * mm])
+    t3.setStyle(TableStyle([("FONTNAME", (2, len(opt) - 2), (2, len(opt) - 2), "Helvetica-Bold"),
+                            ("FONTNAME", (3, len(opt) - 1), (3, len(opt) - 1), "Helvetica-Bold")]))
+    story.append(t3)
+
+    story.append(spacer(6))
+    story.append(subheading("7.3 Sensitivity"))
+    story.append(p("ARR as one tier's price moves away from the ARR optimum, the other tiers held there."))
+    story.append(line_chart(
+        study.moves * 100,
+        [(tier, values, color) for (tier, values), color in zip(study.sensitivity, (EMERALD, BLUE_TEXT, DARK))],
+        fmt=lambda v: eur(v, 0), zero=False,
+        x_labels=[(m, f"{'+' if m > 0 else '−'}{abs(m)}%" if m else "optimum") for m in (-50, -25, 0, 25, 50)]))
+    story.append(spacer(4))
+    scenarios = [["Elasticity"] + list(model.tiers) + ["Workspaces", "ARR", "vs today"]]
+    for elasticity, best in study.scenarios:
+        o = best.outcome
+        scenarios.append([f"{elasticity}"] + [eur(x) for x in o.prices] +
+                         [f"{sum(o.workspaces):,.0f}", eur(o.arr, 0), f"{(o.arr / now.arr - 1) * 100:+.0f}%"])
+    story.append(make_table(scenarios, col_widths=[22 * mm, 22 * mm, 24 * mm, 24 * mm, 24 * mm, 26 * mm, 20 * mm]))
+    story.append(p("The ARR optimum if prospects react less (lower elasticity) or more strongly to price.",
+                   "SmallGray"))
+
     # ─────────────────────────────────────────────────────────
     # FOOTER / DISCLAIMER
     # ─────────────────────────────────────────────────────────
     story.append(spacer(16))
     story.append(hr())
     story.append(p(
-        f"<i>Report generated on {date.today().strftime('%B %d, %Y')}. "
+        f"<i>Report generated on {BUILD_DATE.strftime('%B %d, %Y')}. "
         "Clockin pricing sourced from clockin.de/preise. "
         "Shiftfy pricing from src/lib/stripe.ts. "
         "All prices exclude VAT. Subject to change.</i>",
@@ -496,10 +625,11 @@ def build():
     story.append(p("<i>© 2026 Shiftfy GmbH — Confidential</i>", "SmallGray"))
 
     # ── Build ────────────────────────────────────────────────
-    doc.build(story)
-    print(f"\n✅ Report generated: {OUT_PATH}")
-    print(f"   File size: {os.path.getsize(OUT_PATH) / 1024:.1f} KB")
+    profiler.build(doc, story)
+    return out.result(doc)
 
 
 if __name__ == "__main__":
-    build()
+    result = build()
+    print(f"\n✅ Report generated: {result}")
+    print(f"   File size: {result.size / 1024:.1f} KB")
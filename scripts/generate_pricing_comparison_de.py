@@ -5,15 +5,13 @@ Erzeugt einen professionellen PDF-Bericht auf Deutsch.
 """
 
 import os
-from datetime import date
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.platypus import (
     SimpleDocTemplate,
-    Paragraph,
     Spacer,
     Table,
     TableStyle,
@@ -21,6 +19,17 @@ from reportlab.platypus import (
     HRFlowable,
 )
 
+from reportlib.buildinfo import BUILD_DATE
+from reportlib.charts import line_chart
+from reportlib.layoutcache import Paragraph
+from reportlib.numfmt import DE_DE, Formatter
+from reportlib.output import PdfOutput
+from reportlib.priceopt import CONVERSION, STRIPE_FEE, WORKSPACES, price_study
+from reportlib.pricing import ANNUAL, FAIR_TABLE, MARKET_TABLE, TEAM_TABLE, comparison
+from reportlib.profiling import RenderProfiler
+from reportlib.styles import register_theme, sample_styles
+from reportlib.tables import build_table
+
 # ─── Farben ──────────────────────────────────────────────────
 EMERALD = colors.HexColor("#059669")
 EMERALD_50 = colors.HexColor("#ecfdf5")
@@ -30,62 +39,70 @@ GRAY_500 = colors.HexColor("#6b7280")
 GRAY_200 = colors.HexColor("#e5e7eb")
 GRAY_50 = colors.HexColor("#f9fafb")
 WHITE = colors.white
+RED_TEXT = colors.HexColor("#dc2626")
 GREEN_TEXT = colors.HexColor("#059669")
+BLUE_TEXT = colors.HexColor("#2563eb")
 
 # ─── Ausgabepfad ─────────────────────────────────────────────
 OUT_DIR = os.path.join(os.path.dirname(__file__), "..", "reports")
-os.makedirs(OUT_DIR, exist_ok=True)
 OUT_PATH = os.path.join(OUT_DIR, "shiftfy-vs-clockin-preisvergleich.pdf")
 
 # ─── Stile ───────────────────────────────────────────────────
-styles = getSampleStyleSheet()
-
-styles.add(ParagraphStyle(
-    "CoverTitle", parent=styles["Title"],
-    fontSize=28, leading=34, textColor=DARK,
-    spaceAfter=6, alignment=TA_LEFT, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "CoverSub", parent=styles["Normal"],
-    fontSize=14, leading=20, textColor=GRAY_500,
-    spaceAfter=4, fontName="Helvetica",
-))
-styles.add(ParagraphStyle(
-    "SectionHead", parent=styles["Heading1"],
-    fontSize=18, leading=24, textColor=EMERALD,
-    spaceBefore=20, spaceAfter=10, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "SubHead", parent=styles["Heading2"],
-    fontSize=13, leading=18, textColor=DARK,
-    spaceBefore=14, spaceAfter=6, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "Body", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=GRAY_700,
-    spaceAfter=6, fontName="Helvetica",
-))
-styles.add(ParagraphStyle(
-    "BodyBold", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=DARK,
-    spaceAfter=6, fontName="Helvetica-Bold",
-))
-styles.add(ParagraphStyle(
-    "SmallGray", parent=styles["Normal"],
-    fontSize=8, leading=11, textColor=GRAY_500,
-    spaceAfter=4, fontName="Helvetica",
-))
-styles.add(ParagraphStyle(
-    "CalloutBody", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=DARK,
-    fontName="Helvetica", spaceAfter=4,
-))
-styles.add(ParagraphStyle(
-    "BulletItem", parent=styles["Normal"],
-    fontSize=10, leading=15, textColor=GRAY_700,
-    fontName="Helvetica", leftIndent=14, bulletIndent=0,
-    spaceAfter=3,
-))
+@register_theme("pricing_comparison_de")
+def build_styles():
+    """Return the report's paragraph styles (built once per process)."""
+    ss = sample_styles()
+    return {
+        "CoverTitle": ParagraphStyle(
+            "CoverTitle", parent=ss["Title"],
+            fontSize=28, leading=34, textColor=DARK,
+            spaceAfter=6, alignment=TA_LEFT, fontName="Helvetica-Bold",
+        ),
+        "CoverSub": ParagraphStyle(
+            "CoverSub", parent=ss["Normal"],
+            fontSize=14, leading=20, textColor=GRAY_500,
+            spaceAfter=4, fontName="Helvetica",
+        ),
+        "SectionHead": ParagraphStyle(
+            "SectionHead", parent=ss["Heading1"],
+            fontSize=18, leading=24, textColor=EMERALD,
+            spaceBefore=20, spaceAfter=10, fontName="Helvetica-Bold",
+        ),
+        "SubHead": ParagraphStyle(
+            "SubHead", parent=ss["Heading2"],
+            fontSize=13, leading=18, textColor=DARK,
+            spaceBefore=14, spaceAfter=6, fontName="Helvetica-Bold",
+        ),
+        "Body": ParagraphStyle(
+            "Body", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=GRAY_700,
+            spaceAfter=6, fontName="Helvetica",
+        ),
+        "BodyBold": ParagraphStyle(
+            "BodyBold", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=DARK,
+            spaceAfter=6, fontName="Helvetica-Bold",
+        ),
+        "SmallGray": ParagraphStyle(
+            "SmallGray", parent=ss["Normal"],
+            fontSize=8, leading=11, textColor=GRAY_500,
+            spaceAfter=4, fontName="Helvetica",
+        ),
+        "CalloutBody": ParagraphStyle(
+            "CalloutBody", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=DARK,
+            fontName="Helvetica", spaceAfter=4,
+        ),
+        "BulletItem": ParagraphStyle(
+            "BulletItem", parent=ss["Normal"],
+            fontSize=10, leading=15, textColor=GRAY_700,
+            fontName="Helvetica", leftIndent=14, bulletIndent=0,
+            spaceAfter=3,
+        ),
+    }
+
+
+styles = build_styles()
 
 # ─── Hilfsfunktionen ────────────────────────────────────────
 
@@ -104,35 +121,31 @@ def spacer(h=6):
 def hr():
     return HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=8, spaceBefore=4)
 
-def eur(val):
-    """Format a number as German EUR string: 1.234,56 €"""
-    s = f"{val:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-    return f"{s} €"
+FMT = Formatter(DE_DE)
+eur = FMT.currency      # 1.234,56 €
 
 def make_table(data, col_widths=None, header_rows=1):
-    t = Table(data, colWidths=col_widths, repeatRows=header_rows)
-    style_cmds = [
-        ("BACKGROUND", (0, 0), (-1, header_rows - 1), EMERALD),
-        ("TEXTCOLOR", (0, 0), (-1, header_rows - 1), WHITE),
-        ("FONTNAME", (0, 0), (-1, header_rows - 1), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, header_rows - 1), 9),
-        ("BOTTOMPADDING", (0, 0), (-1, header_rows - 1), 8),
-        ("TOPPADDING", (0, 0), (-1, header_rows - 1), 8),
-        ("FONTNAME", (0, header_rows), (-1, -1), "Helvetica"),
-        ("FONTSIZE", (0, header_rows), (-1, -1), 9),
-        ("TEXTCOLOR", (0, header_rows), (-1, -1), GRAY_700),
-        ("BOTTOMPADDING", (0, header_rows), (-1, -1), 6),
-        ("TOPPADDING", (0, header_rows), (-1, -1), 6),
-        ("GRID", (0, 0), (-1, -1), 0.5, GRAY_200),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("FONTNAME", (0, header_rows), (0, -1), "Helvetica-Bold"),
-        ("TEXTCOLOR", (0, header_rows), (0, -1), DARK),
-    ]
-    for i in range(header_rows, len(data)):
-        bg = GRAY_50 if i % 2 == 0 else WHITE
-        style_cmds.append(("BACKGROUND", (0, i), (-1, i), bg))
-    t.setStyle(TableStyle(style_cmds))
-    return t
+    return build_table(
+        data, col_widths, header_rows,
+        style=[
+            ("BACKGROUND", (0, 0), (-1, header_rows - 1), EMERALD),
+            ("TEXTCOLOR", (0, 0), (-1, header_rows - 1), WHITE),
+            ("FONTNAME", (0, 0), (-1, header_rows - 1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, header_rows - 1), 9),
+            ("BOTTOMPADDING", (0, 0), (-1, header_rows - 1), 8),
+            ("TOPPADDING", (0, 0), (-1, header_rows - 1), 8),
+            ("FONTNAME", (0, header_rows), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, header_rows), (-1, -1), 9),
+            ("TEXTCOLOR", (0, header_rows), (-1, -1), GRAY_700),
+            ("BOTTOMPADDING", (0, header_rows), (-1, -1), 6),
+            ("TOPPADDING", (0, header_rows), (-1, -1), 6),
+            ("GRID", (0, 0), (-1, -1), 0.5, GRAY_200),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("FONTNAME", (0, header_rows), (0, -1), "Helvetica-Bold"),
+            ("TEXTCOLOR", (0, header_rows), (0, -1), DARK),
+        ],
+        zebra=(WHITE, GRAY_50),
+    )
 
 def callout_box(title, body_lines, bg=EMERALD_50, border=EMERALD):
     content = []
@@ -155,6 +168,46 @@ def callout_box(title, body_lines, bg=EMERALD_50, border=EMERALD):
 def bullet(text):
     return Paragraph(f"\u2022 {text}", styles["BulletItem"])
 
+def pct(fraction):
+    return f"{abs(fraction) * 100:.0f} %"
+
+def span(low, high):
+    return f"{abs(low) * 100:.0f}\u2013{pct(high)}"
+
+def delta(ours, theirs, amount=True):
+    """Ersparnis-Zelle: „−25 % (1,00 €)“, wenn Shiftfy günstiger ist, sonst „+12 % (26,00 € mehr)“."""
+    saved = 1 - ours / theirs
+    if saved >= 0:
+        return f"\u2212{pct(saved)} ({eur(theirs - ours)})" if amount else f"\u2212{pct(saved)} \u2713"
+    return f"+{pct(saved)} ({eur(ours - theirs)} mehr)"
+
+def users(n):
+    return "jede Größe" if n == float("inf") else f"{FMT.integer(n)} Nutzern"
+
+def switch_reason(rivalry, x):
+    """Warum die günstigere Seite beim Wechselpunkt *x* wechselt."""
+    rival = rivalry.rival
+    if x.kind == "price":
+        n = x.users
+        at = FMT.integer(n.numerator) if n.denominator == 1 else FMT.number(float(n), 1)
+        return f"Gleiche Kosten bei {at} Nutzern"
+    if x.kind == "limit":
+        plan = x.below if x.below.vendor == "Shiftfy" else x.above
+        return f"Shiftfy {plan.plan} endet bei {users(plan.max_users)}"
+    if x.above is rival:
+        return f"{rival.vendor} ab {users(rival.min_users)}"
+    return f"{rival.vendor} bis {users(rival.max_users)}"
+
+def rival_name(offer):
+    return offer.label if offer.vendor == "Clockin" else offer.vendor
+
+def seats(lo, hi):
+    return f"{FMT.integer(lo)}\u2013{FMT.integer(hi)}" if hi else f"{FMT.integer(lo)}+"
+
+def shade_losses(table, rows, column):
+    """Rote Schrift in *column* für die Zeilen *rows*, in denen Shiftfy teurer ist."""
+    table.setStyle(TableStyle([("TEXTCOLOR", (column, r), (column, r), RED_TEXT) for r in rows]))
+
 
 # ═════════════════════════════════════════════════════════════
 #  DOKUMENT ERSTELLEN
@@ -167,13 +220,14 @@ MONATE_DE = {
 }
 
 def datum_de():
-    d = date.today()
+    d = BUILD_DATE
     return f"{d.day}. {MONATE_DE[d.month]} {d.year}"
 
 
-def build():
+def build(output=None):
+    out = PdfOutput("pricing-de", output, OUT_PATH)
     doc = SimpleDocTemplate(
-        OUT_PATH,
+        out,
         pagesize=A4,
         topMargin=20 * mm,
         bottomMargin=20 * mm,
@@ -183,7 +237,14 @@ def build():
         author="Shiftfy GmbH",
     )
 
-    story = []
+    profiler = RenderProfiler("pricing-de", levels=("SectionHead", "SubHead"))
+    story = profiler.story()
+    cmp = comparison()
+    book = cmp.book
+    shiftfy, annual = book.vendor("Shiftfy"), book.vendor("Shiftfy", ANNUAL)
+    stechuhr = book.vendor("Clockin")[0]
+    shift_addon = book.addons["Clockin"]["Schichtplanung"]
+    tier_low, tier_high = cmp.tier_savings
 
     # ─────────────────────────────────────────────────────────
     # DECKBLATT
@@ -203,8 +264,8 @@ def build():
     stats_data = [
         ["", "Shiftfy", "Clockin"],
         ["Preismodell", "Pro Nutzer\n(keine Grundgebühr)", "Pro Nutzer\n(keine Grundgebühr)"],
-        ["Einstiegspreis", "2,99 €/Nutzer/Mo.", "3,99 €/Nutzer/Mo."],
-        ["Schichtplanung", "In jedem Plan inklusive", "Aufpreis 24 €/Mo."],
+        ["Einstiegspreis", f"{eur(shiftfy[0].per_user)}/Nutzer/Mo.", f"{eur(stechuhr.per_user)}/Nutzer/Mo."],
+        ["Schichtplanung", "In jedem Plan inklusive", f"Aufpreis {eur(shift_addon, 0)}/Mo."],
         ["Jahresrabatt", "Bis zu 20 %", "Bis zu 20 % (24 Monate)"],
         ["Kostenlose Testphase", "14 Tage", "14 Tage"],
         ["Zielmarkt", "Deutscher Mittelstand", "Deutscher Mittelstand\n(Handwerk, Pflege)"],
@@ -215,9 +276,9 @@ def build():
     story.append(callout_box(
         "\U0001f4a1 Kernaussage",
         [
-            "Shiftfy ist in jeder Preisstufe <b>25\u201329 % günstiger</b> als Clockin "
+            f"Shiftfy ist in jeder Preisstufe <b>{span(tier_low, tier_high)} günstiger</b> als Clockin "
             "und hat <b>Schichtplanung kostenlos inklusive</b> \u2014 eine Funktion, die Clockin mit "
-            "24 €/Monat extra berechnet. Damit ist Shiftfy der klare Preis-Leistungs-Sieger "
+            f"{eur(shift_addon, 0)}/Monat extra berechnet. Damit ist Shiftfy der klare Preis-Leistungs-Sieger "
             "für schichtbasierte Betriebe."
         ],
     ))
@@ -246,26 +307,25 @@ def build():
     story.append(heading("2. Preisvergleich"))
 
     story.append(subheading("2.1 Clockin-Tarife (pro Nutzer, keine Grundgebühr)"))
-    clockin_data = [
-        ["Tarif", "Monatlich", "12 Monate", "24 Monate (\u221220 %)"],
-        ["Digitale Stechuhr", "3,99 €/Nutzer", "3,59 €/Nutzer", "3,19 €/Nutzer"],
-        ["Projektzeiterfassung", "6,99 €/Nutzer", "6,29 €/Nutzer", "5,59 €/Nutzer"],
-        ["Zeiterfassung &amp;\nDokumentation", "9,99 €/Nutzer", "8,99 €/Nutzer", "7,99 €/Nutzer"],
-    ]
+    clockin_data = [["Tarif", "Monatlich", "12 Monate", "24 Monate (−20 %)"]]
+    clockin = book.offers_by_plan("Clockin")
+    for plan, offers in clockin.items():
+        clockin_data.append([plan.replace(" & ", " &\n")] +
+                            [f"{eur(offers[term].per_user)}/Nutzer" for term in (1, 12, 24)])
     story.append(make_table(clockin_data, col_widths=[42 * mm, 35 * mm, 35 * mm, 42 * mm]))
     story.append(spacer(4))
-    story.append(p("<b>Clockin-Zusatzmodule (Pauschalpreise):</b> Schichtplanung ab 24 €/Mo. \u00b7 "
-                    "Videodokumentation ab 79 €/Mo. \u00b7 Gesprächsnotizen ab 49 €/Mo. \u00b7 "
-                    "Telefonassistent ab 99 €/Mo."))
+    story.append(p("<b>Clockin-Zusatzmodule (Pauschalpreise):</b> " + " · ".join(
+        f"{name} ab {eur(price, 0)}/Mo." for name, price in book.addons["Clockin"].items())))
 
     story.append(spacer(6))
     story.append(subheading("2.2 Shiftfy-Tarife (pro Nutzer, keine Grundgebühr)"))
-    shiftfy_data = [
-        ["Tarif", "Monatlich", "Jährlich (Ersparnis)"],
-        ["Basic", "2,99 €/Nutzer", "2,49 €/Nutzer (\u221217 %)"],
-        ["Professional", "4,99 €/Nutzer", "3,99 €/Nutzer (\u221220 %)"],
-        ["Enterprise", "7,99 €/Nutzer", "6,49 €/Nutzer (\u221219 %)"],
-    ]
+    shiftfy_data = [["Tarif", "Monatlich", "Jährlich (Ersparnis)"]]
+    for monthly, yearly in zip(shiftfy, annual):
+        shiftfy_data.append([
+            monthly.plan,
+            f"{eur(monthly.per_user)}/Nutzer",
+            f"{eur(yearly.per_user)}/Nutzer (−{pct(1 - yearly.per_user / monthly.per_user)})",
+        ])
     story.append(make_table(shiftfy_data, col_widths=[42 * mm, 42 * mm, 52 * mm]))
     story.append(spacer(4))
     story.append(p("<b>Keine Zusatzmodule nötig:</b> Schichtplanung, Team-Chat, Abwesenheitsverwaltung "
@@ -279,12 +339,10 @@ def build():
     story.append(p("Alle Preise sind monatliche Pro-Nutzer-Tarife. Grün = günstigere Option."))
 
     story.append(subheading("3.1 Tarif-für-Tarif (monatliche Abrechnung)"))
-    tier_data = [
-        ["Stufe", "Shiftfy", "Clockin", "Shiftfy-Ersparnis"],
-        ["Einsteiger / Basic", "2,99 €", "3,99 €", "\u221225 % \u2713"],
-        ["Mittel / Professional", "4,99 €", "6,99 €", "\u221229 % \u2713"],
-        ["Premium / Enterprise", "7,99 €", "9,99 €", "\u221220 % \u2713"],
-    ]
+    tier_data = [["Stufe", "Shiftfy", "Clockin", "Shiftfy-Ersparnis"]]
+    for level, (ours, theirs, saved) in zip(("Einsteiger", "Mittel", "Premium"), cmp.tiers):
+        tier_data.append([f"{level} / {ours.plan}", eur(ours.per_user), eur(theirs.per_user),
+                          f"−{pct(saved)} ✓"])
     t = make_table(tier_data, col_widths=[40 * mm, 30 * mm, 30 * mm, 40 * mm])
     t.setStyle(TableStyle([
         ("TEXTCOLOR", (3, 1), (3, -1), GREEN_TEXT),
@@ -292,56 +350,84 @@ def build():
     ]))
     story.append(t)
 
+    limits = ", ".join(f"{o.plan} bis {users(o.max_users)}" for o in shiftfy if o.max_users < float("inf"))
     story.append(spacer(8))
-    story.append(subheading("3.2 Monatliche Gesamtkosten nach Teamgröße (Basic-Tarif)"))
-    story.append(p("Clockin Digitale Stechuhr vs. Shiftfy Basic \u2014 monatliche Abrechnung."))
-
-    team_sizes = [1, 3, 5, 10, 15, 20, 30, 50, 100]
-    team_data = [["Teamgröße", "Shiftfy Basic", "Clockin Stechuhr", "\u0394 (Ersparnis)"]]
-    for n in team_sizes:
-        s = n * 2.99
-        c = n * 3.99
-        delta = ((c - s) / c) * 100
-        team_data.append([
-            f"{n} Nutzer",
-            eur(s),
-            eur(c),
-            f"\u2212{delta:.0f} % ({eur(c - s)})",
-        ])
-    story.append(make_table(team_data, col_widths=[28 * mm, 35 * mm, 38 * mm, 42 * mm]))
+    story.append(subheading("3.2 Monatliche Gesamtkosten nach Teamgröße"))
+    story.append(p("Clockin Digitale Stechuhr vs. der günstigste Shiftfy-Tarif, den ein Team dieser Größe "
+                   f"buchen kann ({limits}) — monatliche Abrechnung."))
+
+    plans, ours, theirs = cmp.team
+    team_data = [["Teamgröße", "Shiftfy-Tarif", "Shiftfy", "Clockin Stechuhr", "Δ (Ersparnis)"]]
+    for n, plan, s, c in zip(TEAM_TABLE, plans, ours, theirs):
+        team_data.append([f"{n} Nutzer", plan, eur(s), eur(c), delta(s, c)])
+    t1 = make_table(team_data, col_widths=[24 * mm, 28 * mm, 28 * mm, 32 * mm, 46 * mm])
+    shade_losses(t1, [i for i, (s, c) in enumerate(zip(ours, theirs), 1) if s > c], 4)
+    story.append(t1)
 
     story.append(spacer(8))
-    story.append(subheading("3.3 Fairer Vergleich: Shiftfy Basic vs. Clockin + Schichtplanung"))
-    story.append(p("Da Clockin für Schichtplanung <b>24 €/Mo. extra</b> berechnet, "
+    story.append(subheading("3.3 Fairer Vergleich: Shiftfy vs. Clockin + Schichtplanung"))
+    story.append(p(f"Da Clockin für Schichtplanung <b>{eur(shift_addon, 0)}/Mo. extra</b> berechnet, "
                     "wird dieser Aufpreis hier eingerechnet:"))
 
-    addon_data = [["Teamgröße", "Shiftfy Basic", "Clockin + Schichtplanung", "\u0394 (Ersparnis)"]]
-    for n in [1, 5, 10, 20, 50, 100]:
-        s = n * 2.99
-        c = n * 3.99 + 24.0
-        delta = ((c - s) / c) * 100
-        addon_data.append([
-            f"{n} Nutzer",
-            eur(s),
-            eur(c),
-            f"\u2212{delta:.0f} % \u2713",
-        ])
-    t2 = make_table(addon_data, col_widths=[28 * mm, 33 * mm, 48 * mm, 35 * mm])
+    plans, ours, theirs = cmp.fair
+    addon_data = [["Teamgröße", "Shiftfy-Tarif", "Shiftfy", "Clockin + Schichtplanung", "Δ (Ersparnis)"]]
+    for n, plan, s, c in zip(FAIR_TABLE, plans, ours, theirs):
+        addon_data.append([f"{n} Nutzer", plan, eur(s), eur(c), delta(s, c, amount=False)])
+    t2 = make_table(addon_data, col_widths=[24 * mm, 28 * mm, 26 * mm, 42 * mm, 38 * mm])
     t2.setStyle(TableStyle([
-        ("TEXTCOLOR", (3, 1), (3, -1), GREEN_TEXT),
-        ("FONTNAME", (3, 1), (3, -1), "Helvetica-Bold"),
+        ("TEXTCOLOR", (4, 1), (4, -1), GREEN_TEXT),
+        ("FONTNAME", (4, 1), (4, -1), "Helvetica-Bold"),
     ]))
+    shade_losses(t2, [i for i, (s, c) in enumerate(zip(ours, theirs), 1) if s > c], 4)
     story.append(t2)
 
     story.append(spacer(6))
-    story.append(callout_box(
-        "\U0001f3c6 Shiftfy gewinnt bei JEDER Teamgröße",
-        [
-            "Wenn Schichtplanung benötigt wird, ist Shiftfy <b>47\u201389 % günstiger</b> "
-            "als Clockin für Teams von 1\u2013100 Nutzern, da Schichtplanung "
-            "ohne Aufpreis enthalten ist."
-        ],
-    ))
+    fair_low, fair_high = cmp.fair_savings
+    turn = cmp.fair_crossover
+    if turn is None:
+        story.append(callout_box(
+            "\U0001f3c6 Shiftfy gewinnt bei JEDER Teamgröße",
+            [
+                f"Wenn Schichtplanung benötigt wird, ist Shiftfy <b>{span(fair_low, fair_high)} günstiger</b> "
+                f"als Clockin für Teams von {FAIR_TABLE[0]}–{FAIR_TABLE[-1]} Nutzern, da Schichtplanung "
+                "ohne Aufpreis enthalten ist."
+            ],
+        ))
+    else:
+        reason = switch_reason(cmp.rivals[0], turn)
+        story.append(callout_box(
+            f"\U0001f3c6 Shiftfy gewinnt bei Teams bis {turn.team_size - 1} Nutzer",
+            [
+                f"Wenn Schichtplanung benötigt wird, ist Shiftfy <b>{span(fair_low, fair_high)} günstiger</b> "
+                f"als Clockin für Teams von 1–{turn.team_size - 1} Nutzern, da Schichtplanung "
+                f"ohne Aufpreis enthalten ist. Ab {turn.team_size} Nutzern kostet {turn.above.label} "
+                f"weniger als Shiftfy {turn.below.plan} ({reason[:1].lower() + reason[1:]})."
+            ],
+        ))
+
+    story.append(spacer(8))
+    story.append(subheading("3.4 Wechselpunkte"))
+    story.append(p("Welches Angebot für jede Teamgröße von 1 bis 10.000 günstiger ist, verglichen mit dem "
+                   "günstigsten Shiftfy-Tarif, den ein Team buchen kann. Die übrigen Anbieter sind mit ihrem "
+                   "Einstiegspreis pro Nutzer angesetzt und nur für die Teamgrößen, die sie anbieten "
+                   "(siehe Wettbewerbstabelle im Profitabilitätsbericht)."))
+    breakeven = [["Verglichen mit", "Günstiger nach Teamgröße", "Wechsel"]]
+    for rivalry in cmp.rivals:
+        breakeven.append([
+            rival_name(rivalry.rival).replace(" + ", "\n+ "),
+            "\n".join(f"{o.vendor}: {seats(lo, hi)}" for lo, hi, o in rivalry.segments()),
+            "\n".join(switch_reason(rivalry, x) for x in rivalry.crossovers) or "—",
+        ])
+    story.append(make_table(breakeven, col_widths=[46 * mm, 50 * mm, 64 * mm]))
+
+    story.append(spacer(8))
+    story.append(subheading("3.5 Monatliche Kosten nach Anbieter und Teamgröße"))
+    market = [["Anbieter"] + [FMT.integer(n) for n in MARKET_TABLE]]
+    for vendor, costs in cmp.market:
+        market.append([vendor + ("*" if vendor == "Clockin" else "")] + list(eur(costs, 0)))
+    story.append(make_table(market, col_widths=[30 * mm] + [19 * mm] * len(MARKET_TABLE)))
+    story.append(p("* Digitale Stechuhr + Schichtplanung. Shiftfy im günstigsten Tarif für die Teamgröße. "
+                   "— = für diese Teamgröße nicht erhältlich.", "SmallGray"))
 
     # ─────────────────────────────────────────────────────────
     # 4. FUNKTIONSVERGLEICH
@@ -356,7 +442,7 @@ def build():
 
     features = [
         ["Funktion", "Shiftfy\nBasic", "Shiftfy\nPro", "Shiftfy\nEnterprise", "Clockin"],
-        ["Schichtplanung", JA, JA, JA, f"{BEZAHLT} 24 €/Mo."],
+        ["Schichtplanung", JA, JA, JA, f"{BEZAHLT} {eur(shift_addon, 0)}/Mo."],
         ["Zeiterfassung", JA, JA, JA, JA],
         ["Abwesenheitsverwaltung", JA, JA, JA, f"{JA} (Basis)"],
         ["Team-Chat", JA, JA, JA, NEIN],
@@ -388,8 +474,8 @@ def build():
 
     story.append(subheading("5.1 Vorteile von Shiftfy"))
     for item in [
-        "<b>25\u201329 % günstiger</b> als Clockin in jeder vergleichbaren Preisstufe",
-        "<b>Schichtplanung inklusive</b> in jedem Plan \u2014 Clockin verlangt 24 €/Mo. extra",
+        f"<b>{span(tier_low, tier_high)} günstiger</b> als Clockin in jeder vergleichbaren Preisstufe",
+        f"<b>Schichtplanung inklusive</b> in jedem Plan \u2014 Clockin verlangt {eur(shift_addon, 0)}/Mo. extra",
         "<b>Team-Chat integriert</b> \u2014 Clockin bietet keine Messaging-Funktion",
         "<b>Auto-Schichtplanung (Pro)</b> \u2014 KI-gestützte Dienstplanerstellung, kein Clockin-Äquivalent",
         "<b>Rollen &amp; API/Webhooks (Pro)</b> \u2014 Entwicklerfreundlich, kein Clockin-Äquivalent",
@@ -440,6 +526,7 @@ def build():
     # ─────────────────────────────────────────────────────────
     story.append(spacer(8))
     story.append(heading("7. Umsatzszenarien (Neue Preise)"))
+    story.append(subheading("7.1 Heutige Preise"))
     story.append(p("Prognostizierter monatlich wiederkehrender Umsatz (MRR) bei verschiedenen "
                     "Kundenmeilensteinen. Annahme: 80 % Basic / 15 % Professional / 5 % Enterprise, "
                     "durchschnittlich 12 Nutzer pro Workspace, monatliche Abrechnung."))
@@ -447,19 +534,66 @@ def build():
     rev_data = [["Workspaces", "Nutzer gesamt", "MRR", "ARR"]]
     for ws in [50, 100, 250, 500, 1000]:
         users_per = 12
-        basic_rev = ws * 0.80 * users_per * 2.99
-        pro_rev = ws * 0.15 * users_per * 4.99
-        ent_rev = ws * 0.05 * users_per * 7.99
+        basic_rev = ws * 0.80 * users_per * shiftfy[0].per_user
+        pro_rev = ws * 0.15 * users_per * shiftfy[1].per_user
+        ent_rev = ws * 0.05 * users_per * shiftfy[2].per_user
         mrr = basic_rev + pro_rev + ent_rev
         arr = mrr * 12
         rev_data.append([
-            f"{ws:,}".replace(",", "."),
-            f"{ws * users_per:,}".replace(",", "."),
+            FMT.integer(ws),
+            FMT.integer(ws * users_per),
             eur(mrr),
             eur(arr),
         ])
     story.append(make_table(rev_data, col_widths=[32 * mm, 32 * mm, 40 * mm, 45 * mm]))
 
+    study = price_study()
+    model, now = study.model, study.current
+    story.append(spacer(6))
+    story.append(subheading("7.2 Optimale Preispunkte"))
+    story.append(p(
+        "Oben ist der Tarifmix fest. Hier folgt er den Preisen: Je weiter ein Tarif über dem vergleichbaren "
+        "Clockin-Tarif liegt, desto weniger Interessenten kaufen ihn, und ein günstigerer Tarif zieht Käufer "
+        f"aus den anderen ab. Das Nachfragemodell ergibt bei heutigen Preisen den heutigen Mix, "
+        f"{FMT.percent(CONVERSION * 100, 0)} Conversion und {FMT.integer(WORKSPACES)} Workspaces, bei einer "
+        f"Elastizität von {FMT.number(model.elasticity, 1)} je 100 % Preisabstand. Die Marge ist der ARR "
+        f"abzüglich {FMT.percent(STRIPE_FEE * 100)} Zahlungsgebühren und {eur(model.seat_cost)} Kosten pro "
+        "Nutzer und Monat (Bruttomarge des Profitabilitätsberichts). Jedes Optimum ist das beste von "
+        f"{FMT.integer(study.arr.combinations)} Preiskombinationen im 5-Cent-Raster "
+        f"({FMT.integer(study.arr.scored)} davon mit jedem Tarif teurer als der darunter)."
+    ))
+    opt = [["", "Heute", "Max. ARR", "Max. Marge"]]
+    outcomes = (now, study.arr.outcome, study.margin.outcome)
+    for i, tier in enumerate(model.tiers):
+        opt.append([f"{tier} (pro Nutzer)"] + [eur(o.prices[i]) for o in outcomes])
+    opt.append(["Workspaces"] + [FMT.integer(sum(o.workspaces)) for o in outcomes])
+    opt.append(["ARR"] + [eur(o.arr, 0) for o in outcomes])
+    opt.append(["Marge"] + [eur(o.margin, 0) for o in outcomes])
+    t3 = make_table(opt, col_widths=[40 * mm, 36 * mm, 36 * mm, 36 * mm])
+    t3.setStyle(TableStyle([("FONTNAME", (2, len(opt) - 2), (2, len(opt) - 2), "Helvetica-Bold"),
+                            ("FONTNAME", (3, len(opt) - 1), (3, len(opt) - 1), "Helvetica-Bold")]))
+    story.append(t3)
+
+    story.append(spacer(6))
+    story.append(subheading("7.3 Sensitivität"))
+    story.append(p("ARR, wenn sich der Preis eines Tarifs vom ARR-Optimum entfernt und die anderen dort bleiben."))
+    story.append(line_chart(
+        study.moves * 100,
+        [(tier, values, color) for (tier, values), color in zip(study.sensitivity, (EMERALD, BLUE_TEXT, DARK))],
+        fmt=lambda v: eur(v, 0), zero=False,
+        x_labels=[(m, f"{'+' if m > 0 else '−'}{abs(m)} %" if m else "Optimum") for m in (-50, -25, 0, 25, 50)]))
+    story.append(spacer(4))
+    scenarios = [["Elastizität"] + list(model.tiers) + ["Workspaces", "ARR", "vs. heute"]]
+    for elasticity, best in study.scenarios:
+        o = best.outcome
+        change = (o.arr / now.arr - 1) * 100
+        scenarios.append([FMT.number(elasticity, 1)] + [eur(x) for x in o.prices] +
+                         [FMT.integer(sum(o.workspaces)), eur(o.arr, 0),
+                          ("+" if change >= 0 else "") + FMT.percent(change, 0)])
+    story.append(make_table(scenarios, col_widths=[22 * mm, 22 * mm, 24 * mm, 24 * mm, 24 * mm, 26 * mm, 20 * mm]))
+    story.append(p("Das ARR-Optimum, wenn Interessenten schwächer (niedrigere Elastizität) oder stärker auf den "
+                   "Preis reagieren.", "SmallGray"))
+
     # ─────────────────────────────────────────────────────────
     # FUSSZEILE / HAFTUNGSAUSSCHLUSS
     # ─────────────────────────────────────────────────────────
@@ -475,10 +609,11 @@ def build():
     story.append(p("<i>\u00a9 2026 Shiftfy GmbH \u2014 Vertraulich</i>", "SmallGray"))
 
     # ── Erstellen ────────────────────────────────────────────
-    doc.build(story)
-    print(f"\n\u2705 Bericht erstellt: {OUT_PATH}")
-    print(f"   Dateigröße: {os.path.getsize(OUT_PATH) / 1024:.1f} KB")
+    profiler.build(doc, story)
+    return out.result(doc)
 
 
 if __name__ == "__main__":
-    build()
+    result = build()
+    print(f"\n\u2705 Bericht erstellt: {result}")
+    print(f"   Dateigröße: {result.size / 1024:.1f} KB")
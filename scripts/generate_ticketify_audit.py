@@ -5,26 +5,29 @@ Generates English and German versions of the comprehensive audit report.
 
 Usage:
     python3 scripts/generate_ticketify_audit.py
+    python3 scripts/generate_ticketify_audit.py --diagnostics eslint.sarif tsc.log --top 40
+
+--diagnostics adds a "Static Analysis" category built from SARIF, ESLint
+JSON or tsc output (see reportlib/diagnostics.py).
 
 Output:
     reports/ticketify_audit_EN.pdf
     reports/ticketify_audit_DE.pdf
 """
 
+import argparse
 import os
 import sys
-from datetime import datetime
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm, cm
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import (
     SimpleDocTemplate,
-    Paragraph,
     Spacer,
     Table,
     TableStyle,
@@ -33,11 +36,20 @@ from reportlab.platypus import (
     KeepTogether,
 )
 
+from reportlib.buildinfo import BUILD_DATE
+from reportlib.diagnostics import ingest
+from reportlib.findings import FindingIndex
+from reportlib.layoutcache import Paragraph
+from reportlib.numfmt import formatter
+from reportlib.output import PdfOutput
+from reportlib.parallel import build_sections
+from reportlib.profiling import RenderProfiler
+from reportlib.styles import register_theme
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 FONTS_DIR = os.path.join(SCRIPT_DIR, "fonts")
 REPORTS_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), "reports")
-os.makedirs(REPORTS_DIR, exist_ok=True)
 
 # ─── Fonts ────────────────────────────────────────────────────────────────────
 pdfmetrics.registerFont(TTFont("DejaVu", os.path.join(FONTS_DIR, "DejaVuSans.ttf")))
@@ -66,8 +78,9 @@ TEXT_GRAY = colors.HexColor("#64748B")      # slate-500
 WHITE = colors.white
 
 # ─── Styles ───────────────────────────────────────────────────────────────────
+@register_theme("ticketify_audit")
 def build_styles():
-    s = getSampleStyleSheet()
+    """Return the report styles; built once per process and shared by EN/DE."""
     styles = {}
     styles["title"] = ParagraphStyle(
         "Title", fontName="DejaVu-Bold", fontSize=26, leading=32,
@@ -146,12 +159,93 @@ def build_styles():
     return styles
 
 # ─── Report Content (Bilingual) ──────────────────────────────────────────────
+DIAGNOSTICS_KEY = "cat_i"
+DEFAULT_TOP = 25
+
+# Strings holding {findings}, {categories}, {milestones}, {budget}, … placeholders.
+SUMMARY_KEYS = (
+    "exec_body", "severity_total", "milestones_title", "milestones_subtitle",
+    "milestones_total_findings", "milestones_total_duration", "closing_body",
+)
+OPTIONAL_SUMMARY_KEYS = ("severity_unscheduled",)   # shown only when non-zero
+
+
 def get_content(lang="en"):
     """Return all report content as a dict, keyed by section."""
     if lang == "en":
         return CONTENT_EN
     return CONTENT_DE
 
+
+def category_keys(c):
+    """``cat_a`` … in content order, including ingested ``cat_i``."""
+    return [k[:-len("_items")] for k in c if k.startswith("cat_") and k.endswith("_items")]
+
+
+def format_number(value, lang):
+    """``3000`` → ``"3,000"`` (en) / ``"3.000"`` (de); ``1.5`` → ``"1.5"`` / ``"1,5"``."""
+    fmt = formatter(lang)
+    return fmt.integer(value) if value == int(value) else fmt.number(value, 1)
+
+
+def summarise(c, lang):
+    """Content with the counts, totals and severity rows from the findings.
+
+    Counts cover the findings the roadmap schedules. Findings in no
+    milestone (the ingested static-analysis buckets) are reported on their
+    own line under the severity table. Raises ``FindingIndexError`` if a
+    milestone's scope names a finding that does not exist or that another
+    milestone already covers.
+    """
+    keys = category_keys(c)
+    index = FindingIndex([(k, c[f"{k}_items"]) for k in keys], c["milestones"], lang)
+    currency, budget = index.total_price()
+    prices = {m["price"] for m in c["milestones"]}
+    scheduled = [k for k in keys if any(f.id in index.milestone_of for f in index.by_category[k])]
+    names = c["category_names"]
+    unscheduled = index.unscheduled
+    facts = {
+        "findings": len(index.scheduled),
+        "categories": len(scheduled),
+        "unscheduled": format_number(len(unscheduled), lang),
+        "unscheduled_categories": ", ".join(
+            names[k] for k in keys if any(f.category == k for f in unscheduled)),
+        "milestones": len(c["milestones"]),
+        "budget": f"{currency}{format_number(budget, lang)}",
+        "breakdown": (f"{len(c['milestones'])} × {prices.pop()}" if len(prices) == 1
+                      else " + ".join(m["price"] for m in c["milestones"])),
+        "weeks": format_number(index.total_duration(), lang),
+    }
+    out = dict(c)
+    for key in SUMMARY_KEYS:
+        out[key] = c[key].format(**facts)
+    for key in OPTIONAL_SUMMARY_KEYS:
+        out[key] = c[key].format(**facts) if unscheduled else ""
+    out["milestones_total_budget"] = facts["budget"]
+
+    out["severity_rows"] = []
+    for sev, count, found in index.severity_rows(scheduled=True):
+        cats = (c["all_categories"] if len(found) == len(scheduled)
+                else ", ".join(names[k] for k in found))
+        note = c["severity_notes"].get(sev)
+        out["severity_rows"].append((sev, str(count), f"{cats} — {note}" if note else cats))
+    return out
+
+
+def with_diagnostics(c, report, lang, top=DEFAULT_TOP):
+    """Content plus a category of the *top* largest buckets of *report*."""
+    stats = report.summary()
+    records = report.findings(DIAGNOSTICS_KEY[-1].upper(), top, lang)
+    facts = {k: format_number(v, lang) for k, v in stats.items() if isinstance(v, int)}
+    facts["tool_list"] = ", ".join(sorted(stats["tools"]))
+    facts["shown"] = len(records)
+    out = dict(c)
+    out[f"{DIAGNOSTICS_KEY}_title"] = c["diagnostics_title"]
+    out[f"{DIAGNOSTICS_KEY}_intro"] = c["diagnostics_intro"].format(**facts)
+    out[f"{DIAGNOSTICS_KEY}_items"] = records
+    out["category_names"] = {**c["category_names"], DIAGNOSTICS_KEY: c["diagnostics_name"]}
+    return out
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  ENGLISH CONTENT
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -162,7 +256,7 @@ CONTENT_EN = {
     "meta_repo": "Repository",
     "meta_author": "Auditor",
     "meta_scope": "Scope",
-    "meta_date_val": datetime.now().strftime("%B %d, %Y"),
+    "meta_date_val": BUILD_DATE.strftime("%B %d, %Y"),
     "meta_repo_val": "Har-dev61/ticketify",
     "meta_author_val": "Omar Rageh — Full-Stack Engineer",
     "meta_scope_val": "Architecture, Code Quality, DevOps, Security, AI, Performance, UI/UX",
@@ -174,7 +268,7 @@ CONTENT_EN = {
         "Next.js 15, Prisma, Clerk, and Stripe. The codebase demonstrates strong fundamentals: "
         "strict tenant isolation via organizationId, a clean App Router structure, "
         "SSE-based real-time updates, proper plan gating, and comprehensive documentation.\n\n"
-        "However, the audit reveals <b>27 findings across 8 categories</b> that must be addressed "
+        "However, the audit reveals <b>{findings} findings across {categories} categories</b> that must be addressed "
         "to make the platform production-ready and scalable. Critical gaps exist in "
         "<b>DevOps infrastructure</b> (no Docker, no commit standards, no staging environment), "
         "<b>code quality</b> (693-line monolithic DB module, hardcoded German strings, empty test setup), "
@@ -225,6 +319,13 @@ CONTENT_EN = {
 
     # ── Findings ──
     "findings_title": "4. Detailed Findings",
+    "diagnostics_title": "4.9 Static Analysis",
+    "diagnostics_name": "Static Analysis",
+    "diagnostics_intro": (
+        "{diagnostics} diagnostics from {inputs} tool reports ({tool_list}) across {files} files, "
+        "in {rules} rule buckets; {duplicates} duplicates were removed. "
+        "The {shown} largest buckets are listed, most severe first."
+    ),
 
     # Category A: Architecture & Refactoring
     "cat_a_title": "4.1 Architecture & Refactoring",
@@ -641,17 +742,27 @@ CONTENT_EN = {
     # ── Severity Summary ──
     "severity_title": "5. Findings Summary by Severity",
     "severity_headers": ["Severity", "Count", "Categories"],
-    "severity_rows": [
-        ("CRITICAL", "2", "DevOps (no Docker, no commit standards)"),
-        ("HIGH", "9", "Architecture, Code Quality, DevOps, False Positives, Scaling, Security"),
-        ("MEDIUM", "12", "All categories — substantial but manageable"),
-        ("LOW", "4", "Code Quality, AI, UI/UX — nice-to-have improvements"),
-    ],
-    "severity_total": "Total: 27 findings",
+    # Rows are counted from the cat_*_items (see summarise()).
+    "category_names": {
+        "cat_a": "Architecture", "cat_b": "Code Quality", "cat_c": "DevOps",
+        "cat_d": "False Positives", "cat_e": "Scaling", "cat_f": "AI",
+        "cat_g": "Security", "cat_h": "UI/UX",
+    },
+    "all_categories": "All categories",
+    "severity_notes": {
+        "CRITICAL": "no Docker, no commit standards",
+        "MEDIUM": "substantial but manageable",
+        "LOW": "nice-to-have improvements",
+    },
+    "severity_total": "Total: {findings} findings",
+    "severity_unscheduled": (
+        "Not counted above: {unscheduled} findings that no milestone schedules "
+        "({unscheduled_categories}). They are listed in section 4 only."
+    ),
 
     # ── Milestones ──
-    "milestones_title": "6. Implementation Roadmap — 6 Milestones",
-    "milestones_subtitle": "Total Budget: $3,000 (6 × $500)",
+    "milestones_title": "6. Implementation Roadmap — {milestones} Milestones",
+    "milestones_subtitle": "Total Budget: {budget} ({breakdown})",
     "milestones": [
         {
             "id": "M1",
@@ -753,20 +864,22 @@ CONTENT_EN = {
     # ── Milestone Summary Table ──
     "milestones_summary_title": "Milestone Overview",
     "milestones_summary_headers": ["#", "Milestone", "Findings", "Budget", "Timeline"],
+    "milestones_total_findings": "{findings} findings",
+    "milestones_total_duration": "~{weeks} weeks",
 
     # ── Closing ──
     "closing_title": "7. Conclusion",
     "closing_body": (
         "Ticketify has a solid technical foundation — the multi-tenancy model is sound, "
         "the AI features are well-integrated, and the documentation is above average. "
-        "The 27 findings identified in this audit are not architectural flaws but rather "
+        "The {findings} findings identified in this audit are not architectural flaws but rather "
         "gaps that prevent the platform from being truly production-ready and scalable.\n\n"
-        "The 6-milestone roadmap addresses all 27 findings in a logical sequence: "
+        "The {milestones}-milestone roadmap addresses all {findings} findings in a logical sequence: "
         "DevOps foundation first (so all subsequent work benefits from CI/CD, Docker, and commit standards), "
         "followed by architecture refactoring, production hardening, performance scaling, "
         "and finally UI/UX polish.\n\n"
         "Each milestone is scoped to approximately one week of focused work, with clear deliverables "
-        "and acceptance criteria. The total investment of $3,000 will transform Ticketify from "
+        "and acceptance criteria. The total investment of {budget} will transform Ticketify from "
         "a well-built MVP into a production-ready, scalable SaaS platform."
     ),
     "footer_text": "Ticketify Audit Report — Confidential — Omar Rageh",
@@ -784,7 +897,7 @@ CONTENT_DE = {
     "meta_repo": "Repository",
     "meta_author": "Auditor",
     "meta_scope": "Umfang",
-    "meta_date_val": datetime.now().strftime("%d. %B %Y"),
+    "meta_date_val": BUILD_DATE.strftime("%d. %B %Y"),
     "meta_repo_val": "Har-dev61/ticketify",
     "meta_author_val": "Omar Rageh — Full-Stack-Engineer",
     "meta_scope_val": "Architektur, Code-Qualität, DevOps, Sicherheit, KI, Performance, UI/UX",
@@ -796,7 +909,7 @@ CONTENT_DE = {
         "gebaut mit Next.js 15, Prisma, Clerk und Stripe. Die Codebasis zeigt starke Grundlagen: "
         "strikte Mandanten-Isolation über organizationId, eine saubere App-Router-Struktur, "
         "SSE-basierte Echtzeit-Updates, korrekte Plan-Gating-Logik und umfassende Dokumentation.\n\n"
-        "Die Prüfung zeigt jedoch <b>27 Befunde in 8 Kategorien</b>, die behoben werden müssen, "
+        "Die Prüfung zeigt jedoch <b>{findings} Befunde in {categories} Kategorien</b>, die behoben werden müssen, "
         "um die Plattform produktionsreif und skalierbar zu machen. Kritische Lücken bestehen bei "
         "<b>DevOps-Infrastruktur</b> (kein Docker, keine Commit-Standards, keine Staging-Umgebung), "
         "<b>Code-Qualität</b> (693-Zeilen monolithisches DB-Modul, fest codierte deutsche Strings, leeres Test-Setup), "
@@ -847,6 +960,13 @@ CONTENT_DE = {
 
     # ── Findings ──
     "findings_title": "4. Detaillierte Befunde",
+    "diagnostics_title": "4.9 Statische Analyse",
+    "diagnostics_name": "Statische Analyse",
+    "diagnostics_intro": (
+        "{diagnostics} Meldungen aus {inputs} Tool-Berichten ({tool_list}) in {files} Dateien, "
+        "gruppiert nach {rules} Regeln; {duplicates} Duplikate wurden entfernt. "
+        "Aufgeführt sind die {shown} größten Gruppen, die schwerwiegendsten zuerst."
+    ),
 
     "cat_a_title": "4.1 Architektur & Refactoring",
     "cat_a_items": [
@@ -1249,17 +1369,26 @@ CONTENT_DE = {
     # ── Severity Summary ──
     "severity_title": "5. Befundübersicht nach Schweregrad",
     "severity_headers": ["Schweregrad", "Anzahl", "Kategorien"],
-    "severity_rows": [
-        ("CRITICAL", "2", "DevOps (kein Docker, keine Commit-Standards)"),
-        ("HIGH", "9", "Architektur, Code-Qualität, DevOps, Falsche Positive, Skalierung, Sicherheit"),
-        ("MEDIUM", "12", "Alle Kategorien — erheblich aber beherrschbar"),
-        ("LOW", "4", "Code-Qualität, KI, UI/UX — Nice-to-have Verbesserungen"),
-    ],
-    "severity_total": "Gesamt: 27 Befunde",
+    "category_names": {
+        "cat_a": "Architektur", "cat_b": "Code-Qualität", "cat_c": "DevOps",
+        "cat_d": "Falsche Positive", "cat_e": "Skalierung", "cat_f": "KI",
+        "cat_g": "Sicherheit", "cat_h": "UI/UX",
+    },
+    "all_categories": "Alle Kategorien",
+    "severity_notes": {
+        "CRITICAL": "kein Docker, keine Commit-Standards",
+        "MEDIUM": "erheblich aber beherrschbar",
+        "LOW": "Nice-to-have Verbesserungen",
+    },
+    "severity_total": "Gesamt: {findings} Befunde",
+    "severity_unscheduled": (
+        "Nicht mitgezählt: {unscheduled} Befunde, die kein Meilenstein einplant "
+        "({unscheduled_categories}). Sie sind nur in Abschnitt 4 aufgeführt."
+    ),
 
     # ── Milestones ──
-    "milestones_title": "6. Implementierungs-Roadmap — 6 Meilensteine",
-    "milestones_subtitle": "Gesamtbudget: $3.000 (6 × $500)",
+    "milestones_title": "6. Implementierungs-Roadmap — {milestones} Meilensteine",
+    "milestones_subtitle": "Gesamtbudget: {budget} ({breakdown})",
     "milestones": [
         {
             "id": "M1",
@@ -1360,20 +1489,22 @@ CONTENT_DE = {
 
     "milestones_summary_title": "Meilenstein-Übersicht",
     "milestones_summary_headers": ["#", "Meilenstein", "Befunde", "Budget", "Zeitraum"],
+    "milestones_total_findings": "{findings} Befunde",
+    "milestones_total_duration": "~{weeks} Wochen",
 
     # ── Closing ──
     "closing_title": "7. Fazit",
     "closing_body": (
         "Ticketify hat ein solides technisches Fundament — das Multi-Tenancy-Modell ist robust, "
         "die KI-Features sind gut integriert, und die Dokumentation ist überdurchschnittlich. "
-        "Die 27 identifizierten Befunde sind keine architektonischen Mängel, sondern Lücken, "
+        "Die {findings} identifizierten Befunde sind keine architektonischen Mängel, sondern Lücken, "
         "die die Plattform daran hindern, wirklich produktionsreif und skalierbar zu sein.\n\n"
-        "Die 6-Meilenstein-Roadmap adressiert alle 27 Befunde in logischer Reihenfolge: "
+        "Die {milestones}-Meilenstein-Roadmap adressiert alle {findings} Befunde in logischer Reihenfolge: "
         "DevOps-Grundlage zuerst (damit alle nachfolgenden Arbeiten von CI/CD, Docker und Commit-Standards profitieren), "
         "gefolgt von Architektur-Refactoring, Produktions-Härtung, Performance-Skalierung "
         "und abschließend UI/UX-Feinschliff.\n\n"
         "Jeder Meilenstein ist auf ungefähr eine Woche fokussierte Arbeit ausgelegt, mit klaren Lieferobjekten "
-        "und Abnahmekriterien. Die Gesamtinvestition von $3.000 wird Ticketify von "
+        "und Abnahmekriterien. Die Gesamtinvestition von {budget} wird Ticketify von "
         "einem gut gebauten MVP in eine produktionsreife, skalierbare SaaS-Plattform verwandeln."
     ),
     "footer_text": "Ticketify Audit-Bericht — Vertraulich — Omar Rageh",
@@ -1446,43 +1577,16 @@ def build_milestone_block(styles, m):
     return elems
 
 
-def build_pdf(lang="en"):
-    c = get_content(lang)
-    styles = build_styles()
-    filename = os.path.join(REPORTS_DIR, f"ticketify_audit_{lang.upper()}.pdf")
-
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=A4,
-        leftMargin=18 * mm,
-        rightMargin=18 * mm,
-        topMargin=20 * mm,
-        bottomMargin=20 * mm,
-    )
-
-    # Footer
-    def footer(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("DejaVu", 7.5)
-        canvas.setFillColor(TEXT_GRAY)
-        w, h = A4
-        canvas.drawCentredString(
-            w / 2, 10 * mm,
-            f'{c["footer_text"]}  —  {c["page_label"]} {doc.page}'
-        )
-        canvas.restoreState()
-
-    story = []
-
-    # ── COVER ──
-    story.append(Spacer(1, 35 * mm))
-    story.append(HRFlowable(width="60%", thickness=2, color=ACCENT))
-    story.append(Spacer(1, 6 * mm))
-    story.append(Paragraph(c["title"], styles["title"]))
-    story.append(Paragraph(c["subtitle"], styles["subtitle"]))
-    story.append(Spacer(1, 8 * mm))
-    story.append(HRFlowable(width="60%", thickness=2, color=ACCENT))
-    story.append(Spacer(1, 15 * mm))
+# ── COVER ──
+def cover_section(c, styles):
+    yield Spacer(1, 35 * mm)
+    yield HRFlowable(width="60%", thickness=2, color=ACCENT)
+    yield Spacer(1, 6 * mm)
+    yield Paragraph(c["title"], styles["title"])
+    yield Paragraph(c["subtitle"], styles["subtitle"])
+    yield Spacer(1, 8 * mm)
+    yield HRFlowable(width="60%", thickness=2, color=ACCENT)
+    yield Spacer(1, 15 * mm)
 
     # Meta table
     meta_data = [
@@ -1501,17 +1605,21 @@ def build_pdf(lang="en"):
         ("TOPPADDING", (0, 0), (-1, -1), 2),
         ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
     ]))
-    story.append(meta_table)
-    story.append(PageBreak())
+    yield meta_table
+    yield PageBreak()
+
 
-    # ── EXECUTIVE SUMMARY ──
-    story.append(Paragraph(c["exec_title"], styles["h1"]))
+# ── EXECUTIVE SUMMARY ──
+def exec_summary_section(c, styles):
+    yield Paragraph(c["exec_title"], styles["h1"])
     for para in c["exec_body"].split("\n\n"):
-        story.append(Paragraph(para, styles["body"]))
-    story.append(PageBreak())
+        yield Paragraph(para, styles["body"])
+    yield PageBreak()
 
-    # ── TECH STACK ──
-    story.append(Paragraph(c["stack_title"], styles["h1"]))
+
+# ── TECH STACK ──
+def tech_stack_section(c, styles, lang):
+    yield Paragraph(c["stack_title"], styles["h1"])
     stack_rows = [[
         Paragraph("<b>Component</b>" if lang == "en" else "<b>Komponente</b>", styles["table_header"]),
         Paragraph("<b>Technology</b>" if lang == "en" else "<b>Technologie</b>", styles["table_header"]),
@@ -1533,27 +1641,35 @@ def build_pdf(lang="en"):
         ("LEFTPADDING", (0, 0), (-1, -1), 4),
         ("RIGHTPADDING", (0, 0), (-1, -1), 4),
     ]))
-    story.append(stack_table)
+    yield stack_table
+
 
-    # ── STRENGTHS ──
-    story.append(Paragraph(c["strengths_title"], styles["h1"]))
+# ── STRENGTHS ──
+def strengths_section(c, styles):
+    yield Paragraph(c["strengths_title"], styles["h1"])
     for s in c["strengths"]:
-        story.append(Paragraph(f"✓ {s}", styles["bullet"]))
+        yield Paragraph(f"✓ {s}", styles["bullet"])
 
-    story.append(PageBreak())
+    yield PageBreak()
 
-    # ── FINDINGS ──
-    story.append(Paragraph(c["findings_title"], styles["h1"]))
 
-    for cat_key in ["cat_a", "cat_b", "cat_c", "cat_d", "cat_e", "cat_f", "cat_g", "cat_h"]:
-        story.append(Paragraph(c[f"{cat_key}_title"], styles["h2"]))
-        story.append(build_finding_table(styles, c[f"{cat_key}_items"]))
-        story.append(Spacer(1, 4 * mm))
+# ── FINDINGS ──
+def findings_section(c, styles):
+    yield Paragraph(c["findings_title"], styles["h1"])
 
-    story.append(PageBreak())
+    for cat_key in category_keys(c):
+        yield Paragraph(c[f"{cat_key}_title"], styles["h2"])
+        if f"{cat_key}_intro" in c:
+            yield Paragraph(c[f"{cat_key}_intro"], styles["body"])
+        yield build_finding_table(styles, c[f"{cat_key}_items"])
+        yield Spacer(1, 4 * mm)
 
-    # ── SEVERITY SUMMARY ──
-    story.append(Paragraph(c["severity_title"], styles["h1"]))
+    yield PageBreak()
+
+
+# ── SEVERITY SUMMARY ──
+def severity_section(c, styles):
+    yield Paragraph(c["severity_title"], styles["h1"])
     sev_header = [Paragraph(h, styles["table_header"]) for h in c["severity_headers"]]
     sev_rows = [sev_header]
     for sev, count, cats in c["severity_rows"]:
@@ -1574,25 +1690,29 @@ def build_pdf(lang="en"):
         ("LEFTPADDING", (0, 0), (-1, -1), 5),
         ("RIGHTPADDING", (0, 0), (-1, -1), 5),
     ]))
-    story.append(sev_table)
-    story.append(Spacer(1, 3 * mm))
-    story.append(Paragraph(f'<b>{c["severity_total"]}</b>', styles["body_bold"]))
+    yield sev_table
+    yield Spacer(1, 3 * mm)
+    yield Paragraph(f'<b>{c["severity_total"]}</b>', styles["body_bold"])
+    if c["severity_unscheduled"]:
+        yield Paragraph(c["severity_unscheduled"], styles["body"])
 
-    story.append(PageBreak())
+    yield PageBreak()
 
-    # ── MILESTONES ──
-    story.append(Paragraph(c["milestones_title"], styles["h1"]))
-    story.append(Paragraph(c["milestones_subtitle"], styles["body_bold"]))
-    story.append(Spacer(1, 4 * mm))
+
+# ── MILESTONES ──
+def milestones_section(c, styles, lang):
+    yield Paragraph(c["milestones_title"], styles["h1"])
+    yield Paragraph(c["milestones_subtitle"], styles["body_bold"])
+    yield Spacer(1, 4 * mm)
 
     for m in c["milestones"]:
         block = build_milestone_block(styles, m)
-        story.append(KeepTogether(block))
+        yield KeepTogether(block)
 
-    story.append(Spacer(1, 5 * mm))
+    yield Spacer(1, 5 * mm)
 
     # Milestone summary table
-    story.append(Paragraph(c["milestones_summary_title"], styles["h2"]))
+    yield Paragraph(c["milestones_summary_title"], styles["h2"])
     ms_header = [Paragraph(h, styles["table_header"]) for h in c["milestones_summary_headers"]]
     ms_rows = [ms_header]
     for m in c["milestones"]:
@@ -1605,13 +1725,12 @@ def build_pdf(lang="en"):
         ])
     # Total row
     total_label = "Total" if lang == "en" else "Gesamt"
-    total_duration = "~7 weeks" if lang == "en" else "~7 Wochen"
     ms_rows.append([
         Paragraph("", styles["table_cell"]),
         Paragraph(f"<b>{total_label}</b>", styles["table_cell_bold"]),
-        Paragraph("27 findings", styles["table_cell"]) if lang == "en" else Paragraph("27 Befunde", styles["table_cell"]),
-        Paragraph("<b>$3,000</b>", styles["table_cell_bold"]),
-        Paragraph(total_duration, styles["table_cell"]),
+        Paragraph(c["milestones_total_findings"], styles["table_cell"]),
+        Paragraph(f'<b>{c["milestones_total_budget"]}</b>', styles["table_cell_bold"]),
+        Paragraph(c["milestones_total_duration"], styles["table_cell"]),
     ])
     ms_table = Table(ms_rows, colWidths=[30, 150, 70, 50, 60])
     ms_table.setStyle(TableStyle([
@@ -1626,33 +1745,93 @@ def build_pdf(lang="en"):
         ("LEFTPADDING", (0, 0), (-1, -1), 4),
         ("RIGHTPADDING", (0, 0), (-1, -1), 4),
     ]))
-    story.append(ms_table)
+    yield ms_table
+
+    yield PageBreak()
 
-    story.append(PageBreak())
 
-    # ── CLOSING ──
-    story.append(Paragraph(c["closing_title"], styles["h1"]))
+# ── CLOSING ──
+def closing_section(c, styles):
+    yield Paragraph(c["closing_title"], styles["h1"])
     for para in c["closing_body"].split("\n\n"):
-        story.append(Paragraph(para, styles["body"]))
+        yield Paragraph(para, styles["body"])
+
+
+def build_pdf(lang="en", output=None, diagnostics=None, top=DEFAULT_TOP):
+    """Build the audit; *diagnostics* is an optional ``DiagnosticReport``."""
+    c = get_content(lang)
+    if diagnostics is not None:
+        c = with_diagnostics(c, diagnostics, lang, top)
+    c = summarise(c, lang)
+    styles = build_styles()
+    out = PdfOutput(f"ticketify-{lang}", output,
+                    os.path.join(REPORTS_DIR, f"ticketify_audit_{lang.upper()}.pdf"))
+
+    doc = SimpleDocTemplate(
+        out,
+        pagesize=A4,
+        leftMargin=18 * mm,
+        rightMargin=18 * mm,
+        topMargin=20 * mm,
+        bottomMargin=20 * mm,
+    )
+
+    # Footer
+    def footer(canvas, doc):
+        canvas.saveState()
+        canvas.setFont("DejaVu", 7.5)
+        canvas.setFillColor(TEXT_GRAY)
+        w, h = A4
+        canvas.drawCentredString(
+            w / 2, 10 * mm,
+            f'{c["footer_text"]}  —  {c["page_label"]} {doc.page}'
+        )
+        canvas.restoreState()
 
-    # Build
-    doc.build(story, onFirstPage=footer, onLaterPages=footer)
-    return filename
+    profiler = RenderProfiler(f"ticketify-{lang}", levels=("H1", "H2"))
+    # Sections are generators: layout pulls flowables as it reaches them.
+    # Each group starts on a new page and can be laid out on its own
+    # (REPORTS_JOBS > 1, see reportlib/parallel.py).
+    groups = [
+        (cover_section(c, styles),),
+        (exec_summary_section(c, styles),),
+        (tech_stack_section(c, styles, lang), strengths_section(c, styles)),
+        (findings_section(c, styles),),
+        (severity_section(c, styles),),
+        (milestones_section(c, styles, lang),),
+        (closing_section(c, styles),),
+    ]
+    build_sections(doc, groups, profiler=profiler, onFirstPage=footer, onLaterPages=footer)
+    return out.result(doc)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  MAIN
 # ═══════════════════════════════════════════════════════════════════════════════
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the Ticketify audit reports.")
+    parser.add_argument("--diagnostics", nargs="+", default=[], metavar="FILE",
+                        help="SARIF, ESLint JSON or tsc output to add as findings")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help=f"rule buckets to list (default: {DEFAULT_TOP})")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("  Ticketify Codebase Audit — PDF Report Generator")
     print("=" * 60)
     print()
 
-    en_path = build_pdf("en")
+    diagnostics = None
+    if args.diagnostics:
+        diagnostics = ingest(args.diagnostics)
+        stats = diagnostics.summary()
+        print(f"  ✓  Ingested {stats['diagnostics']} diagnostics "
+              f"({stats['duplicates']} duplicates) in {stats['rules']} rule buckets")
+
+    en_path = build_pdf("en", diagnostics=diagnostics, top=args.top)
     print(f"  ✓  English report: {en_path}")
 
-    de_path = build_pdf("de")
+    de_path = build_pdf("de", diagnostics=diagnostics, top=args.top)
     print(f"  ✓  German report:  {de_path}")
 
     print()
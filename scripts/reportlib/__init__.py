@@ -0,0 +1,6 @@
+"""
+Shared building blocks for the Shiftfy PDF report generators.
+
+The generators in ``scripts/`` are run directly (``python3 scripts/<name>.py``),
+so this package is importable as ``reportlib`` without any installation step.
+"""
@@ -0,0 +1,67 @@
+"""
+Build date and reproducible output
+==================================
+Generators take "today" from ``BUILD_DATE`` instead of calling
+``datetime.now()`` themselves.
+
+Reproducible mode is on when either variable is set:
+
+* ``SOURCE_DATE_EPOCH`` — Unix timestamp to use as the build date (the
+  reproducible-builds.org convention; CI can pass the commit time).
+* ``REPORTS_REPRODUCIBLE=1`` — use the committer date of ``HEAD``.
+
+In that mode ReportLab's ``invariant`` flag is switched on as well, which
+pins the PDF creation/modification dates and derives the document ID from
+the content, so identical inputs give byte-identical PDFs. Without either
+variable the reports behave as before (current local time).
+
+Importing this module applies the ReportLab setting, so import it before the
+first document is created.
+"""
+
+import os
+import subprocess
+from datetime import datetime, timezone
+
+from reportlab import rl_config
+
+from .registry import ROOT_DIR
+
+
+def _git_commit_time():
+    try:
+        out = subprocess.run(
+            ["git", "log", "-1", "--format=%ct"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        return int(out)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def is_reproducible():
+    return bool(os.environ.get("SOURCE_DATE_EPOCH") or os.environ.get("REPORTS_REPRODUCIBLE"))
+
+
+def build_date():
+    """Return the date the reports should show, honouring reproducible mode."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        try:
+            return datetime.fromtimestamp(int(epoch), tz=timezone.utc).replace(tzinfo=None)
+        except ValueError:
+            raise SystemExit(f"SOURCE_DATE_EPOCH must be a Unix timestamp, got {epoch!r}")
+    if os.environ.get("REPORTS_REPRODUCIBLE"):
+        ts = _git_commit_time()
+        if ts is None:
+            raise SystemExit("REPORTS_REPRODUCIBLE is set but the git commit date is unavailable; "
+                             "set SOURCE_DATE_EPOCH instead")
+        return datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None)
+    return datetime.now()
+
+
+REPRODUCIBLE = is_reproducible()
+BUILD_DATE = build_date()
+
+if REPRODUCIBLE:
+    rl_config.invariant = 1
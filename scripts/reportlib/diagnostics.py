@@ -0,0 +1,277 @@
+"""
+Diagnostics ingestion
+=====================
+Turns linter and compiler output into audit findings, so an audit can
+cover a real codebase and not just hand-written items::
+
+    report = ingest(["eslint.sarif", "eslint.json", "tsc.log"])
+    report.summary()              # {"diagnostics": 48210, "duplicates": 112, …}
+    report.findings("I", top=25)  # [{"id": "I-1", "severity": "HIGH", …}, …]
+
+Three formats are recognised from their first character:
+
+* SARIF 2.1 (``{``): ``runs[].results[]``, with rule names, help text and
+  default levels from ``tool.driver.rules[]``. CodeQL's
+  ``security-severity`` property is used when present.
+* ESLint ``--format json`` (``[``): ``[].messages[]`` below each
+  ``filePath``.
+* ``tsc`` text output, both ``file(12,5): error TS2322: …`` and the
+  ``--pretty`` form ``file:12:5 - error TS2322: …``.
+
+JSON is read through ``jsonstream``, and text line by line, so no input
+is held in memory whole. What is kept grows with the distinct diagnostics:
+the buckets, and one ``hash()`` per unique diagnostic for deduplication. A
+diagnostic reported twice (same tool, rule, file, position and message) is
+counted once, so overlapping runs can be ingested together. Two distinct
+diagnostics whose hashes collide are also counted once, so one of them is
+dropped without a warning. With 64-bit hashes this is very unlikely.
+
+Diagnostics are bucketed by (tool, rule, severity). ``findings()`` turns the
+largest buckets into the ``{id, severity, title, desc, fix}`` records that
+the audit's finding tables render, most severe first.
+"""
+
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from urllib.parse import unquote, urlparse
+from xml.sax.saxutils import escape
+
+from .findings import SEVERITIES
+from .jsonstream import items
+from .numfmt import formatter
+from .registry import ROOT_DIR
+
+TOP_FILES = 3
+
+SARIF_LEVELS = {"error": "HIGH", "warning": "MEDIUM", "note": "LOW", "none": "LOW"}
+ESLINT_LEVELS = {2: "HIGH", 1: "MEDIUM"}
+TSC_LEVELS = {"error": "HIGH", "warning": "MEDIUM", "message": "LOW"}
+
+_TSC = re.compile(
+    r"^(?P<file>[^\s(:][^(:]*?)(?:\((?P<line>\d+),(?P<col>\d+)\)|:(?P<pline>\d+):(?P<pcol>\d+))"
+    r":?\s*-?\s*(?P<level>error|warning|message)\s+(?P<code>TS\d+):\s*(?P<message>.*)$"
+)
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+LABELS = {
+    "en": {
+        "occurrences": "{count} occurrences in {files} files",
+        "occurrence": "1 occurrence",
+        "more_files": "{n} more files",
+        "fix_help": "See {url}.",
+        "fix_default": "Fix the reported locations, or disable the rule with a documented reason.",
+        "fix_tsc": "Fix the type errors at the reported locations; do not silence them with casts.",
+    },
+    "de": {
+        "occurrences": "{count} Vorkommen in {files} Dateien",
+        "occurrence": "1 Vorkommen",
+        "more_files": "{n} weitere Dateien",
+        "fix_help": "Siehe {url}.",
+        "fix_default": "Die gemeldeten Stellen beheben oder die Regel mit dokumentierter Begründung deaktivieren.",
+        "fix_tsc": "Die Typfehler an den gemeldeten Stellen beheben, nicht per Cast unterdrücken.",
+    },
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    id: str
+    help: str = ""
+    help_uri: str = ""
+    level: str = ""          # SARIF default level
+    severity: str = ""       # from security-severity, if any
+
+
+@dataclass
+class Bucket:
+    tool: str
+    rule: str
+    severity: str
+    count: int = 0
+    files: Counter = field(default_factory=Counter)
+    message: str = ""        # the first message seen
+    help: str = ""
+    help_uri: str = ""
+
+
+@lru_cache(maxsize=1 << 16)     # reports name the same files over and over
+def _relative(path, root=ROOT_DIR):
+    if path.startswith("file:"):
+        path = unquote(urlparse(path).path)
+    if os.path.isabs(path):
+        rel = os.path.relpath(path, root)
+        if not rel.startswith(".."):
+            path = rel
+    return path.replace(os.sep, "/")
+
+
+def _security_severity(props):
+    try:
+        score = float((props or {}).get("security-severity", ""))
+    except ValueError:
+        return ""
+    return "CRITICAL" if score >= 9 else "HIGH" if score >= 7 else "MEDIUM" if score >= 4 else "LOW"
+
+
+class DiagnosticReport:
+    """Buckets of diagnostics from any number of inputs (see module docstring)."""
+
+    def __init__(self, root=ROOT_DIR):
+        self.root = root
+        self.buckets = {}
+        self.tools = Counter()
+        self.inputs = 0
+        self.duplicates = 0
+        self._seen = set()
+
+    # ── collecting ───────────────────────────────────────────
+    def add(self, tool, rule, severity, path, line, column, message, help="", help_uri=""):
+        key = hash((tool, rule, path, line, column, message))
+        if key in self._seen:
+            self.duplicates += 1
+            return
+        self._seen.add(key)
+        bucket = self.buckets.get((tool, rule, severity))
+        if bucket is None:
+            bucket = self.buckets[(tool, rule, severity)] = Bucket(
+                tool, rule, severity, message=message, help=help, help_uri=help_uri)
+        bucket.count += 1
+        bucket.files[path] += 1
+        self.tools[tool] += 1
+
+    def read(self, path):
+        """Add the diagnostics in *path*, whatever its format."""
+        with open(path, encoding="utf-8-sig", errors="replace") as fh:
+            head = fh.read(1)
+            while head.isspace():
+                head = fh.read(1)
+            fh.seek(0)
+            if head == "{":
+                self._read_sarif(fh)
+            elif head == "[":
+                self._read_eslint(fh)
+            else:
+                self._read_tsc(fh)
+        self.inputs += 1
+
+    def _read_sarif(self, fh):
+        tool, rules, by_index = "SARIF", {}, []
+        for where, value in items(fh, "runs.item.tool.driver.name",
+                                  "runs.item.tool.driver.rules.item",
+                                  "runs.item.results.item"):
+            if where.endswith(".name"):
+                tool, by_index = value, []
+                continue
+            if where.endswith("rules.item"):
+                help = (value.get("help") or value.get("fullDescription")
+                        or value.get("shortDescription") or {}).get("text", "")
+                rule = Rule(value.get("id", ""), help,
+                            value.get("helpUri", ""),
+                            (value.get("defaultConfiguration") or {}).get("level", ""),
+                            _security_severity(value.get("properties")))
+                rules[rule.id] = rule
+                by_index.append(rule)
+                continue
+            rule_id = value.get("ruleId") or (value.get("rule") or {}).get("id", "")
+            index = value.get("ruleIndex", (value.get("rule") or {}).get("index"))
+            rule = rules.get(rule_id)
+            if rule is None and index is not None and 0 <= index < len(by_index):
+                rule = by_index[index]
+                rule_id = rule_id or rule.id
+            rule = rule or Rule(rule_id)
+            severity = rule.severity or SARIF_LEVELS.get(value.get("level") or rule.level or "warning", "MEDIUM")
+            path, line, column = "", 0, 0
+            locations = value.get("locations") or ()
+            if locations:
+                physical = locations[0].get("physicalLocation") or {}
+                path = _relative((physical.get("artifactLocation") or {}).get("uri", ""), self.root)
+                region = physical.get("region") or {}
+                line, column = region.get("startLine", 0), region.get("startColumn", 0)
+            self.add(tool, rule_id or "(no rule)", severity, path, line, column,
+                     (value.get("message") or {}).get("text", ""), rule.help, rule.help_uri)
+
+    def _read_eslint(self, fh):
+        # ESLint writes "filePath" before "messages" in every file result.
+        path = ""
+        for where, value in items(fh, "item.filePath", "item.messages.item"):
+            if where == "item.filePath":
+                path = _relative(value, self.root)
+                continue
+            if value.get("fatal"):
+                rule, severity = "(parse error)", "HIGH"
+            else:
+                rule = value.get("ruleId") or "(no rule)"
+                severity = ESLINT_LEVELS.get(value.get("severity"), "LOW")
+            uri = f"https://eslint.org/docs/latest/rules/{rule}" if re.fullmatch(r"[a-z-]+", rule) else ""
+            self.add("ESLint", rule, severity, path, value.get("line", 0), value.get("column", 0),
+                     value.get("message", ""), help_uri=uri)
+
+    def _read_tsc(self, fh):
+        for line in fh:
+            m = _TSC.match(_ANSI.sub("", line.rstrip("\n")))
+            if m is None:
+                continue       # continuation lines, code frames, summary
+            self.add("tsc", m["code"], TSC_LEVELS[m["level"]], _relative(m["file"].strip(), self.root),
+                     int(m["line"] or m["pline"]), int(m["col"] or m["pcol"]), m["message"].strip())
+
+    # ── reporting ────────────────────────────────────────────
+    def ranked(self):
+        """Buckets, most severe first, then by size."""
+        rank = {sev: i for i, sev in enumerate(SEVERITIES)}
+        return sorted(self.buckets.values(),
+                      key=lambda b: (rank.get(b.severity, len(rank)), -b.count, b.tool, b.rule))
+
+    def summary(self):
+        by_severity = Counter()
+        files = set()
+        for bucket in self.buckets.values():
+            by_severity[bucket.severity] += bucket.count
+            files.update(bucket.files)
+        return {
+            "inputs": self.inputs,
+            "diagnostics": sum(by_severity.values()),
+            "duplicates": self.duplicates,
+            "rules": len(self.buckets),
+            "files": len(files),
+            "tools": dict(self.tools),
+            "by_severity": {sev: by_severity[sev] for sev in SEVERITIES if by_severity[sev]},
+        }
+
+    def findings(self, prefix, top=25, lang="en"):
+        """The *top* largest buckets as audit finding records (markup-escaped)."""
+        labels = LABELS[lang]
+        records = []
+        for n, bucket in enumerate(self.ranked()[:top], 1):
+            if bucket.count == 1:
+                where = labels["occurrence"]
+            else:
+                where = labels["occurrences"].format(count=formatter(lang).integer(bucket.count),
+                                                     files=len(bucket.files))
+            worst = [f"{escape(f or '?')} ({c})" for f, c in bucket.files.most_common(TOP_FILES)]
+            if len(bucket.files) > TOP_FILES:
+                worst.append(labels["more_files"].format(n=len(bucket.files) - TOP_FILES))
+            if bucket.help:
+                fix = escape(bucket.help)
+            elif bucket.help_uri:
+                fix = labels["fix_help"].format(url=escape(bucket.help_uri))
+            else:
+                fix = labels["fix_tsc"] if bucket.tool == "tsc" else labels["fix_default"]
+            records.append({
+                "id": f"{prefix}-{n}",
+                "severity": bucket.severity,
+                "title": f"{escape(bucket.tool)}: {escape(bucket.rule)}",
+                "desc": f"{escape(bucket.message)}<br/><br/><i>{where}</i>: {', '.join(worst)}",
+                "fix": fix,
+            })
+        return records
+
+
+def ingest(paths, root=ROOT_DIR):
+    """A ``DiagnosticReport`` over every file in *paths*."""
+    report = DiagnosticReport(root)
+    for path in paths:
+        report.read(path)
+    return report
@@ -0,0 +1,445 @@
+"""
+Document IR
+===========
+A small, format-neutral description of a report. A generator builds it once
+— from its data and translations — and renderers turn the same tree into:
+
+* PDF: ``PdfRenderer`` yields ReportLab flowables. Generators subclass it to
+  map the nodes onto their own styles, tables and cover art.
+* HTML: ``render_html(doc)`` gives one self-contained page.
+* Markdown: ``render_markdown(doc)`` gives GitHub-flavoured text that diffs
+  well between report versions.
+* CSV: ``render_csv(doc)`` gives every table as CSV text.
+
+Nodes are frozen dataclasses holding tuples, so a document can be cached
+(``functools.lru_cache`` on the builder) and rendered to any number of
+formats without running the content code again::
+
+    @lru_cache(maxsize=None)
+    def document(lang):
+        return Document(title, (Section("1. Overview", (Para(...),)), ...))
+
+    doc.build(stream(StatusPdf(styles).flowables(document("en"))))
+    write_formats(document("en"), base_path, ("html", "md"))
+
+Text in headings, paragraphs and list items uses ReportLab's paragraph
+markup (``<b>``, ``<i>``, ``<br/>``, ``<font color>``, entities) — the one
+inline format every renderer understands. Plain ``str`` table cells are
+literal text, as they are in ReportLab tables.
+"""
+
+import csv
+import html
+import io
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+
+from reportlab.lib.units import mm
+from reportlab.platypus import HRFlowable, PageBreak, Spacer
+
+from .layoutcache import Paragraph
+from .tables import build_table
+
+
+# ── Nodes ─────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class Document:
+    title: str
+    blocks: tuple
+    lang: str = "en"
+
+
+@dataclass(frozen=True)
+class Section:
+    title: str
+    blocks: tuple
+    level: int = 1
+
+
+@dataclass(frozen=True)
+class Para:
+    text: str
+    role: str = "body"   # style role, e.g. "body", "muted", "small"
+
+
+@dataclass(frozen=True)
+class Bullets:
+    items: tuple
+    ordered: bool = False
+
+
+@dataclass(frozen=True)
+class DataTable:
+    headers: tuple
+    rows: tuple            # cells are str or Badge
+    col_widths: tuple = None   # mm
+
+
+@dataclass(frozen=True)
+class Badge:
+    text: str
+    tone: str = None       # e.g. "done", "progress", "critical"
+
+
+@dataclass(frozen=True)
+class Callout:
+    title: str
+    lines: tuple
+    tone: str = None
+
+
+@dataclass(frozen=True)
+class Banner:
+    title: str
+    subtitle: str = ""
+    note: str = ""
+
+
+@dataclass(frozen=True)
+class Meta:
+    pairs: tuple           # ((label, value), ...)
+
+
+@dataclass(frozen=True)
+class Rule:
+    width: float = 1.0     # fraction of the text width
+    thickness: float = 1.0
+    muted: bool = False
+
+
+@dataclass(frozen=True)
+class Space:
+    height: float          # mm; PDF only
+
+
+@dataclass(frozen=True)
+class Break:
+    """Start a new page (PDF) or printed page (HTML)."""
+
+
+def text_blocks(text):
+    """Split ``"intro\\n• a\\n• b"`` style text into Para and Bullets nodes.
+
+    Runs of ``•`` lines become one ``Bullets`` node; blank lines are dropped.
+    """
+    blocks, items = [], []
+    for line in text.split("\n"):
+        if line.startswith("•"):
+            items.append(line[1:].strip())
+            continue
+        if items:
+            blocks.append(Bullets(tuple(items)))
+            items = []
+        if line.strip():
+            blocks.append(Para(line))
+    if items:
+        blocks.append(Bullets(tuple(items)))
+    return tuple(blocks)
+
+
+def walk(blocks, path=()):
+    """Yield ``(section_path, node)`` for every node below *blocks*."""
+    for node in blocks:
+        yield path, node
+        if isinstance(node, Section):
+            yield from walk(node.blocks, path + (node.title,))
+
+
+# ── PDF ───────────────────────────────────────────────────────
+class PdfRenderer:
+    """Yields the flowables for a document.
+
+    *styles* maps roles to paragraph styles: ``h1``, ``h2``, … for section
+    levels, ``bullet`` for list items, and whatever ``Para.role`` values the
+    document uses. Override the ``render_*`` methods for report-specific
+    looks; the defaults are deliberately plain.
+    """
+
+    rule_color = None
+    muted_color = None
+
+    def __init__(self, styles):
+        self.styles = styles
+
+    def flowables(self, doc):
+        for node in doc.blocks:
+            yield from self.render(node)
+
+    def render(self, node):
+        return getattr(self, "render_" + type(node).__name__.lower())(node)
+
+    def cell(self, value):
+        return self.render_badge(value) if isinstance(value, Badge) else value
+
+    def render_section(self, node):
+        yield Paragraph(node.title, self.styles[f"h{node.level}"])
+        for child in node.blocks:
+            yield from self.render(child)
+
+    def render_para(self, node):
+        yield Paragraph(node.text, self.styles[node.role])
+
+    def render_bullets(self, node):
+        style = self.styles["bullet"]
+        for i, text in enumerate(node.items, 1):
+            if node.ordered:
+                yield Paragraph(f"<b>{i}.</b>  {text}", style)
+            else:
+                yield Paragraph(f"<bullet>&bull;</bullet>{text}", style)
+
+    def render_datatable(self, node):
+        widths = [w * mm for w in node.col_widths] if node.col_widths else None
+        rows = [[self.cell(c) for c in row] for row in node.rows]
+        yield build_table([list(node.headers)] + rows, widths)
+
+    def render_badge(self, node):
+        return node.text
+
+    def render_callout(self, node):
+        yield Paragraph(f"<b>{node.title}</b>", self.styles["body"])
+        for line in node.lines:
+            yield Paragraph(line, self.styles["body"])
+
+    def render_banner(self, node):
+        yield Paragraph(node.title, self.styles["h1"])
+        for text in (node.subtitle, node.note):
+            if text:
+                yield Paragraph(text, self.styles["body"])
+
+    def render_meta(self, node):
+        yield build_table([list(pair) for pair in node.pairs], header_rows=0)
+
+    def render_rule(self, node):
+        color = self.muted_color if node.muted else self.rule_color
+        kwargs = {"color": color} if color is not None else {}
+        yield HRFlowable(width=f"{node.width:.0%}", thickness=node.thickness, **kwargs)
+
+    def render_space(self, node):
+        yield Spacer(1, node.height * mm)
+
+    def render_break(self, node):
+        yield PageBreak()
+
+
+# ── inline markup ─────────────────────────────────────────────
+_FONT_OPEN = re.compile(r'<font\s+color="([^"]+)"\s*>')
+_BULLET = re.compile(r"<bullet>.*?</bullet>", re.S)
+_TAG = re.compile(r"<[^>]+>")
+_MD_SPECIAL = re.compile(r"([\\`*_\[\]|])")
+
+
+def _html_inline(text):
+    text = _BULLET.sub("", text)
+    text = _FONT_OPEN.sub(r'<span style="color:\1">', text)
+    return text.replace("</font>", "</span>")
+
+
+def plain_text(text):
+    """Markup stripped to plain text (entities decoded)."""
+    return html.unescape(_TAG.sub("", _BULLET.sub("", text.replace("<br/>", "\n"))))
+
+
+def _md_inline(text, in_table=False):
+    text = _BULLET.sub("", text)
+    parts = []
+    for piece in re.split(r"(<[^>]+>)", text):
+        if piece.startswith("<"):
+            tag = piece.strip("</>").split()[0].lower() if piece.strip("</>") else ""
+            if tag == "b":
+                parts.append("**")
+            elif tag == "i":
+                parts.append("*")
+            elif tag == "br":
+                parts.append("<br>" if in_table else "  \n")
+        else:
+            parts.append(_MD_SPECIAL.sub(r"\\\1", html.unescape(piece)))
+    return "".join(parts)
+
+
+def _cell_text(value):
+    return value.text if isinstance(value, Badge) else str(value)
+
+
+# ── HTML ──────────────────────────────────────────────────────
+_CSS = """
+body{font:15px/1.55 -apple-system,"Segoe UI",Helvetica,Arial,sans-serif;color:#111827;
+max-width:52rem;margin:2rem auto;padding:0 1rem}
+header.banner{background:#059669;color:#fff;border-radius:6px;padding:1.5rem 2rem;text-align:center}
+header.banner h1{margin:0;font-size:2.4rem;letter-spacing:.05em}
+header.banner p{margin:.3rem 0 0;opacity:.85}
+h2,h3,h4{color:#065f46;margin-top:1.8rem}
+table{border-collapse:collapse;width:100%;margin:.8rem 0;font-size:.9rem}
+th{background:#059669;color:#fff;text-align:left}
+th,td{border:1px solid #e5e7eb;padding:.35rem .5rem;vertical-align:top}
+tbody tr:nth-child(even){background:#f9fafb}
+dl.meta{display:grid;grid-template-columns:max-content 1fr;gap:.2rem 1rem}
+dl.meta dt{color:#6b7280;font-weight:600}
+dl.meta dd{margin:0}
+.muted{color:#6b7280;font-size:.9rem}
+.badge{font-weight:600}
+.badge.done{color:#10b981}
+.badge.progress{color:#f59e0b}
+.badge.critical{color:#ef4444}
+aside.callout{border-left:4px solid #059669;background:#ecfdf5;padding:.6rem 1rem;margin:1rem 0}
+hr{border:0;border-top:1px solid #e5e7eb}
+.page-break{break-after:page}
+""".strip()
+
+
+def _html_blocks(blocks, out):
+    for node in blocks:
+        if isinstance(node, Section):
+            h = min(node.level + 1, 6)
+            out.append(f"<section><h{h}>{_html_inline(node.title)}</h{h}>")
+            _html_blocks(node.blocks, out)
+            out.append("</section>")
+        elif isinstance(node, Para):
+            cls = f' class="{node.role}"' if node.role != "body" else ""
+            out.append(f"<p{cls}>{_html_inline(node.text)}</p>")
+        elif isinstance(node, Bullets):
+            tag = "ol" if node.ordered else "ul"
+            items = "".join(f"<li>{_html_inline(i)}</li>" for i in node.items)
+            out.append(f"<{tag}>{items}</{tag}>")
+        elif isinstance(node, DataTable):
+            head = "".join(f"<th>{html.escape(h)}</th>" for h in node.headers)
+            body = "".join(
+                "<tr>" + "".join(f"<td>{_html_cell(c)}</td>" for c in row) + "</tr>"
+                for row in node.rows
+            )
+            out.append(f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>")
+        elif isinstance(node, Callout):
+            tone = f" {node.tone}" if node.tone else ""
+            lines = "".join(f"<p>{_html_inline(line)}</p>" for line in node.lines)
+            out.append(f'<aside class="callout{tone}"><strong>{_html_inline(node.title)}</strong>'
+                       f"{lines}</aside>")
+        elif isinstance(node, Banner):
+            extra = "".join(f"<p>{html.escape(t)}</p>" for t in (node.subtitle, node.note) if t)
+            out.append(f'<header class="banner"><h1>{html.escape(node.title)}</h1>{extra}</header>')
+        elif isinstance(node, Meta):
+            items = "".join(f"<dt>{html.escape(k)}</dt><dd>{html.escape(v)}</dd>" for k, v in node.pairs)
+            out.append(f'<dl class="meta">{items}</dl>')
+        elif isinstance(node, Rule):
+            style = f' style="width:{node.width:.0%};margin-left:0"' if node.width < 1 else ""
+            out.append(f"<hr{style}>")
+        elif isinstance(node, Break):
+            out.append('<div class="page-break"></div>')
+        elif isinstance(node, Badge):
+            out.append(f"<p>{_html_cell(node)}</p>")
+
+
+def _html_cell(value):
+    if isinstance(value, Badge):
+        tone = f" {value.tone}" if value.tone else ""
+        return f'<span class="badge{tone}">{html.escape(value.text)}</span>'
+    return html.escape(str(value))
+
+
+def render_html(doc):
+    """The document as one self-contained HTML page."""
+    out = [
+        "<!DOCTYPE html>",
+        f'<html lang="{doc.lang}"><head><meta charset="utf-8">',
+        '<meta name="viewport" content="width=device-width,initial-scale=1">',
+        f"<title>{html.escape(doc.title)}</title><style>{_CSS}</style></head><body>",
+    ]
+    _html_blocks(doc.blocks, out)
+    out.append("</body></html>")
+    return "\n".join(out) + "\n"
+
+
+# ── Markdown ──────────────────────────────────────────────────
+def _md_blocks(blocks, out):
+    for node in blocks:
+        if isinstance(node, Section):
+            out.append("#" * min(node.level + 1, 6) + " " + _md_inline(node.title))
+            _md_blocks(node.blocks, out)
+        elif isinstance(node, Para):
+            out.append(_md_inline(node.text))
+        elif isinstance(node, Bullets):
+            out.append("\n".join(
+                f"{f'{i}.' if node.ordered else '-'} {_md_inline(item)}"
+                for i, item in enumerate(node.items, 1)
+            ))
+        elif isinstance(node, DataTable):
+            def row(cells):
+                return "| " + " | ".join(_md_inline(html.escape(_cell_text(c)), True) for c in cells) + " |"
+            out.append("\n".join(
+                [row(node.headers), "|" + "---|" * len(node.headers)]
+                + [row(r) for r in node.rows]
+            ))
+        elif isinstance(node, Callout):
+            out.append("\n".join([f"> **{_md_inline(node.title)}**", ">"]
+                                 + [f"> {_md_inline(line)}" for line in node.lines]))
+        elif isinstance(node, Banner):
+            lines = [f"# {_md_inline(html.escape(node.title))}"]
+            lines += [f"*{_md_inline(html.escape(t))}*" for t in (node.subtitle, node.note) if t]
+            out.append("\n\n".join(lines))
+        elif isinstance(node, Meta):
+            out.append("\n".join(
+                f"- **{_md_inline(html.escape(k))}:** {_md_inline(html.escape(v))}"
+                for k, v in node.pairs
+            ))
+        elif isinstance(node, Rule):
+            out.append("---")
+        elif isinstance(node, Badge):
+            out.append(_md_inline(html.escape(node.text)))
+
+
+def render_markdown(doc):
+    """The document as GitHub-flavoured Markdown."""
+    out = []
+    _md_blocks(doc.blocks, out)
+    return "\n\n".join(out) + "\n"
+
+
+# ── CSV ───────────────────────────────────────────────────────
+def _slug(text):
+    ascii_text = unicodedata.normalize("NFKD", plain_text(text)).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_text.lower()).strip("-") or "table"
+
+
+def render_csv(doc):
+    """Every table as ``(name, csv_text)``, named after its section."""
+    tables = []
+    for path, node in walk(doc.blocks):
+        if isinstance(node, DataTable):
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator="\n")
+            writer.writerow(node.headers)
+            writer.writerows([_cell_text(c) for c in row] for row in node.rows)
+            name = f"{len(tables) + 1:02d}-{_slug(path[-1] if path else doc.title)}"
+            tables.append((name, buf.getvalue()))
+    return tables
+
+
+# ── files ─────────────────────────────────────────────────────
+FORMATS = ("pdf", "html", "md", "csv")
+
+
+def write_formats(doc, base_path, formats):
+    """Write the non-PDF *formats* next to *base_path* (no extension).
+
+    HTML and Markdown go to ``<base>.html`` / ``<base>.md``; CSV tables to
+    ``<base>_tables/NN-<section>.csv``. Returns the written paths.
+    """
+    written = []
+
+    def write(path, text):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            fh.write(text)
+        written.append(path)
+
+    for fmt in formats:
+        if fmt == "html":
+            write(base_path + ".html", render_html(doc))
+        elif fmt == "md":
+            write(base_path + ".md", render_markdown(doc))
+        elif fmt == "csv":
+            for name, text in render_csv(doc):
+                write(os.path.join(base_path + "_tables", name + ".csv"), text)
+        elif fmt != "pdf":
+            raise ValueError(f"unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+    return written
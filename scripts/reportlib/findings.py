@@ -0,0 +1,171 @@
+"""
+Findings index
+==============
+Audit reports keep their findings in per-category lists and their
+milestones in a separate list that names findings by ID. ``FindingIndex``
+reads both in one pass and answers everything the summary tables need:
+
+    index = FindingIndex(
+        [("cat_a", c["cat_a_items"]), ("cat_b", c["cat_b_items"]), …],
+        c["milestones"], lang="en",
+    )
+    index.total                      # 27
+    index.severity_rows()            # [("CRITICAL", 2, ["cat_c"]), …]
+    index.severity_rows(scheduled=True)   # only findings some milestone covers
+    index.by_milestone["M3"]         # [Finding(A-1), Finding(A-2), …]
+    index.total_price()              # ("$", 3000.0)
+
+Milestone ``scope`` strings list IDs separated by commas. They may also
+give ranges within one category: ``"A-1–A-3"`` or ``"A-1..A-3"``. The index
+checks them against the findings. Unknown IDs, duplicate IDs and findings
+scheduled in two milestones raise ``FindingIndexError``, so a typo cannot
+put a wrong count in a report. Findings in no milestone are listed in
+``unscheduled``.
+
+Prices and durations are read with the separators of *lang*
+(``numfmt.LOCALES``): ``"$1,250.50"`` in English, ``"1.250,50 €"`` and
+``"~1,5 Wochen"`` in German.
+
+Building the index is linear in the number of findings and scope
+entries, so large audits aggregate as fast as small ones.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .numfmt import LOCALES
+
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+_RANGE = re.compile(r"^(\w+?)-(\d+)\s*(?:–|—|\.\.)\s*(?:\1-)?(\d+)$")
+
+
+class FindingIndexError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Finding:
+    id: str
+    severity: str
+    category: str        # content key, e.g. "cat_a"
+    item: dict           # the content entry (title, desc, fix, …)
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+def parse_scope(scope):
+    """The finding IDs in a milestone ``scope`` string, in order."""
+    ids = []
+    for part in scope.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        m = _RANGE.match(part)
+        if m:
+            prefix, first, last = m.group(1), int(m.group(2)), int(m.group(3))
+            if last < first:
+                raise FindingIndexError(f"empty range {part!r}")
+            ids.extend(f"{prefix}-{n}" for n in range(first, last + 1))
+        else:
+            ids.append(part)
+    return ids
+
+
+@lru_cache(maxsize=None)
+def _number(lang):
+    """A number with *lang*'s grouping and decimal separators."""
+    loc = LOCALES[lang]
+    group, decimal = re.escape(loc.group), re.escape(loc.decimal)
+    return re.compile(rf"\d{{1,3}}(?:{group}\d{{3}})+(?:{decimal}\d+)?|\d+(?:{decimal}\d+)?")
+
+
+def parse_amount(text, lang="en"):
+    """``"$3,000"`` → ``3000.0``; ``"~1,5 Wochen"`` → ``1.5`` with ``lang="de"``.
+
+    The first number in *text*, read with *lang*'s separators.
+    """
+    m = _number(lang).search(text)
+    if m is None:
+        raise FindingIndexError(f"no number in {text!r}")
+    loc = LOCALES[lang]
+    return float(m.group().replace(loc.group, "").replace(loc.decimal, "."))
+
+
+class FindingIndex:
+    """Findings by id, severity, category and milestone (see module docstring)."""
+
+    def __init__(self, categories, milestones=(), lang="en"):
+        self.lang = lang
+        self.by_id = {}
+        self.by_severity = {sev: [] for sev in SEVERITIES}
+        self.by_category = {}
+        self.by_milestone = {}
+        self.milestone_of = {}
+        self.milestones = list(milestones)
+
+        for key, items in categories:
+            bucket = self.by_category.setdefault(key, [])
+            for item in items:
+                finding = Finding(item["id"], item["severity"], key, item)
+                if finding.id in self.by_id:
+                    raise FindingIndexError(f"duplicate finding id {finding.id}")
+                self.by_id[finding.id] = finding
+                self.by_severity.setdefault(finding.severity, []).append(finding)
+                bucket.append(finding)
+
+        problems = []
+        for milestone in self.milestones:
+            mid = milestone["id"]
+            scheduled = self.by_milestone.setdefault(mid, [])
+            for fid in parse_scope(milestone.get("scope", "")):
+                finding = self.by_id.get(fid)
+                if finding is None:
+                    problems.append(f"{mid}: unknown finding {fid}")
+                elif fid in self.milestone_of:
+                    problems.append(f"{mid}: {fid} is already in {self.milestone_of[fid]}")
+                else:
+                    self.milestone_of[fid] = mid
+                    scheduled.append(finding)
+        if problems:
+            raise FindingIndexError("milestone scope errors:\n  " + "\n  ".join(problems))
+
+    # ── aggregates ────────────────────────────────────────────
+    @property
+    def total(self):
+        return len(self.by_id)
+
+    @property
+    def scheduled(self):
+        return [f for f in self.by_id.values() if f.id in self.milestone_of]
+
+    @property
+    def unscheduled(self):
+        return [f for f in self.by_id.values() if f.id not in self.milestone_of]
+
+    def severity_rows(self, scheduled=False):
+        """``(severity, count, category keys)`` for each severity with findings.
+
+        Severities come in ``SEVERITIES`` order, categories in content order.
+        With *scheduled*, findings in no milestone are left out.
+        """
+        rows = []
+        for sev, findings in self.by_severity.items():
+            if scheduled:
+                findings = [f for f in findings if f.id in self.milestone_of]
+            if findings:
+                keys = {f.category for f in findings}
+                rows.append((sev, len(findings), [k for k in self.by_category if k in keys]))
+        return rows
+
+    def total_price(self):
+        """``(currency prefix, sum)`` over the milestones' ``price``."""
+        prices = [m["price"] for m in self.milestones]
+        currency = re.match(r"^\D*", prices[0]).group().strip() if prices else ""
+        return currency, sum(parse_amount(p, self.lang) for p in prices)
+
+    def total_duration(self):
+        """Sum of the milestones' ``duration`` (in their own unit)."""
+        return sum(parse_amount(m["duration"], self.lang) for m in self.milestones)
@@ -0,0 +1,171 @@
+"""
+Index coverage
+==============
+Checks ``prisma/schema.prisma`` (via ``prismaschema``) for queries that need
+an index the schema does not declare. PostgreSQL does not index foreign keys
+on its own, so these go unnoticed until a table is large enough for a
+sequential scan to hurt.
+
+Three kinds of finding:
+
+* ``foreign_key``: a relation's ``fields`` are not the leading columns of
+  any ``@@index``, ``@@unique`` or ``@id``. Joins, ``include`` and cascading
+  deletes then scan the child table.
+* ``composite``: a workspace-scoped model (it has ``workspaceId``) has a
+  ``status`` column or a calendar-date column (``date``, ``startDate``,
+  ``validFrom``, …) with no index starting ``[workspaceId, <column>]``. For
+  ``status`` the two columns may come in either order. Lists filtered by
+  workspace plus status or date range are the app's most common queries.
+* ``retention``: a data-retention rule deletes rows older than N days by a
+  date column, and no index leads with that column (after the rule's
+  equality filters). The rules are read from
+  ``src/app/api/admin/data-retention/route.ts``, the job behind the
+  retention table in the DSGVO report.
+
+``analyse()`` returns an ``IndexCoverage``. Its ``to_dict()`` is what
+``write_json()`` stores next to the status report.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+
+from .registry import ROOT_DIR
+
+RETENTION_ROUTE = os.path.join(ROOT_DIR, "src", "app", "api", "admin", "data-retention", "route.ts")
+KINDS = ("foreign_key", "composite", "retention")
+
+_CALENDAR_DATE = re.compile(r"^(?:date|\w*Date|\w+From|periodStart|startsAt|startTime)$")
+_RULE = re.compile(r'safeDelete\(\s*"(\w+)[^"]*",\s*\{(.*?)\},\s*\(w\)', re.S)
+_CUTOFF = re.compile(r"(\w+):\s*\{\s*lt:\s*daysAgo\((\d+)\)\s*\}")
+_EQUALS = re.compile(r"(\w+):\s*(?!\{)([^,}]+)")
+
+
+@dataclass(frozen=True)
+class IndexFinding:
+    kind: str            # one of KINDS
+    model: str
+    fields: tuple        # leading columns of the missing index
+    detail: str = ""     # relation target or retention period
+
+    @property
+    def suggestion(self):
+        return f"@@index([{', '.join(self.fields)}])"
+
+
+@dataclass(frozen=True)
+class RetentionRule:
+    model: str
+    date_field: str
+    days: int
+    equals: tuple = ()   # columns compared for equality in the same where
+    filters: tuple = ()  # ((column, literal source), …) for those columns
+
+
+@dataclass
+class IndexCoverage:
+    schema_sha256: str
+    models: int
+    indexes: int
+    foreign_keys: int
+    findings: list = field(default_factory=list)
+
+    def by_kind(self, kind):
+        return [f for f in self.findings if f.kind == kind]
+
+    def to_dict(self):
+        return {
+            "schema_sha256": self.schema_sha256,
+            "models": self.models,
+            "indexes": self.indexes,
+            "foreign_keys": self.foreign_keys,
+            "findings": {
+                kind: [
+                    {"model": f.model, "fields": list(f.fields), "detail": f.detail,
+                     "suggestion": f.suggestion}
+                    for f in self.by_kind(kind)
+                ]
+                for kind in KINDS
+            },
+        }
+
+
+def retention_rules(path=RETENTION_ROUTE):
+    """The ``RetentionRule``s of the data-retention job (empty if it is missing)."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            source = fh.read()
+    except OSError:
+        return []
+    rules = []
+    for model, where in _RULE.findall(source):
+        cutoff = _CUTOFF.search(where)
+        if cutoff:
+            filters = tuple((m.group(1), m.group(2).strip())
+                            for m in _EQUALS.finditer(_CUTOFF.sub("", where)))
+            rules.append(RetentionRule(model, cutoff.group(1), int(cutoff.group(2)),
+                                       tuple(name for name, _ in filters), filters))
+    return rules
+
+
+def _leads(index, columns, any_order=False):
+    head = index.fields[:len(columns)]
+    return set(head) == set(columns) if any_order else tuple(head) == tuple(columns)
+
+
+def _covered(model, columns, any_order=False):
+    return any(_leads(i, columns, any_order) for i in model.indexes)
+
+
+def _retention_covered(model, rule):
+    for index in model.indexes:
+        if rule.date_field not in index.fields:
+            continue
+        before = index.fields[:index.fields.index(rule.date_field)]
+        if set(before) <= set(rule.equals):
+            return True
+    return False
+
+
+def analyse(schema, retention=()):
+    """Check *schema* (a ``prismaschema.Schema``) against the rules above."""
+    findings = []
+    for model in schema.models:
+        for fk in model.foreign_keys:
+            if not _covered(model, fk.relation.fields):
+                findings.append(IndexFinding("foreign_key", model.name, fk.relation.fields,
+                                             f"{fk.name} → {fk.type}"))
+        if model.field("workspaceId") is None:
+            continue
+        if model.field("status") and not _covered(model, ("workspaceId", "status"), any_order=True):
+            findings.append(IndexFinding("composite", model.name, ("workspaceId", "status")))
+        date = next((f.name for f in model.fields
+                     if f.type == "DateTime" and _CALENDAR_DATE.match(f.name)), None)
+        if date and not _covered(model, ("workspaceId", date)):
+            findings.append(IndexFinding("composite", model.name, ("workspaceId", date)))
+
+    names = {m.name for m in schema.models}
+    for rule in retention:
+        if rule.model not in names:
+            continue
+        model = schema.model(rule.model)
+        if not _retention_covered(model, rule):
+            findings.append(IndexFinding("retention", rule.model,
+                                         (*rule.equals, rule.date_field),
+                                         f"{rule.date_field} < now − {rule.days}d"))
+
+    return IndexCoverage(
+        schema_sha256=schema.sha256,
+        models=len(schema.models),
+        indexes=sum(1 for m in schema.models for i in m.indexes if i.kind != "id"),
+        foreign_keys=sum(len(m.foreign_keys) for m in schema.models),
+        findings=findings,
+    )
+
+
+def write_json(coverage, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(coverage.to_dict(), fh, indent=2, ensure_ascii=False)
+        fh.write("\n")
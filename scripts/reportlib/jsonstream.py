@@ -0,0 +1,210 @@
+"""
+Streaming JSON
+==============
+``json.load()`` holds the whole document in memory. Linter reports run to
+hundreds of megabytes, but the interesting values are many small records
+at known places in the tree. ``items()`` reads the file in chunks and
+yields just those records::
+
+    with open("eslint.sarif", encoding="utf-8") as fh:
+        for path, value in items(fh, "runs.item.tool.driver.name",
+                                     "runs.item.results.item"):
+            ...
+
+A path lists the object keys from the root, with ``item`` for "any element
+of an array" (``"item.messages.item"`` is every message of every file in an
+ESLint report). Values come in document order.
+
+The structure between records is walked by a small tokenizer that builds
+nothing. Each matching value is handed to the C ``json`` decoder as soon as
+the buffer holds all of it. Memory is therefore one chunk plus the largest
+record, and most of the bytes are parsed at C speed.
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+
+_WS = re.compile(r"\s*")
+_TOKEN = re.compile(r'\s*(?:([{}\[\],:])|("[^"\\]*(?:\\.[^"\\]*)*")|(-?[\d.eE+-]+|true|false|null))')
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_PLAIN = re.compile(r'[^"{}\[\]]*')
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_DECODER = json.JSONDecoder()
+
+
+class _Buffer:
+    """A sliding window over *fh*; ``pos`` is the next unread character."""
+
+    def __init__(self, fh, chunk_size):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, at_least=0):
+        """Read more; returns False at end of file."""
+        if self.eof:
+            return False
+        self.text = self.text[self.pos:]
+        self.pos = 0
+        chunk = self.fh.read(max(self.chunk_size, at_least))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text += chunk
+        return True
+
+    def token(self):
+        """``(punctuation, string, scalar)`` of the next token, one of them set."""
+        while True:
+            m = _TOKEN.match(self.text, self.pos)
+            # A token that touches the end of the buffer may continue in the
+            # next chunk (a number, or a string cut before its closing quote).
+            if m and (m.end() < len(self.text) or self.eof):
+                self.pos = m.end()
+                return m.groups()
+            if not self.fill():
+                rest = self.text[self.pos:].strip()
+                if not rest:
+                    raise ValueError("unexpected end of JSON input")
+                if m:
+                    self.pos = m.end()
+                    return m.groups()
+                raise ValueError(f"invalid JSON near {rest[:40]!r}")
+
+    def peek(self):
+        """The next non-whitespace character ("" at end of file)."""
+        while True:
+            self.pos = _WS.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or not self.fill():
+                return self.text[self.pos:self.pos + 1]
+
+    def skip(self):
+        """Step over one value without building it."""
+        if self.peek() not in ("{", "["):
+            self.token()
+            return
+        depth = 0
+        while True:
+            self.pos = _PLAIN.match(self.text, self.pos).end()
+            if self.pos == len(self.text):
+                if not self.fill():
+                    raise ValueError("unexpected end of JSON input")
+                continue
+            char = self.text[self.pos]
+            if char == '"':
+                m = _STRING.match(self.text, self.pos)
+                if m is None:
+                    if not self.fill():
+                        raise ValueError("unterminated JSON string")
+                    continue
+                self.pos = m.end()
+                continue
+            self.pos += 1
+            depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return
+
+    def value(self):
+        """Decode one complete value with the C decoder."""
+        extra = self.chunk_size
+        while True:
+            self.pos = _WS.match(self.text, self.pos).end()
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                end = None
+            # raw_decode() also succeeds on a number cut inside the buffer
+            # ("-25" of "-2500.0"), so a value must be followed by something
+            # that cannot continue it.
+            if end is not None and (self.eof or end < len(self.text)
+                                    and self.text[end] not in _NUMBER_CHARS):
+                self.pos = end
+                return value
+            if not self.fill(extra):
+                if end is not None:
+                    self.pos = end
+                    return value
+                raise ValueError("unexpected end of JSON input")
+            extra *= 2   # keep very large records linear in their size
+
+
+def _key(token):
+    return json.loads(token) if "\\" in token else token[1:-1]
+
+
+# parser states
+_VALUE, _FIRST_ITEM, _FIRST_KEY, _KEY, _AFTER = range(5)
+
+
+def items(fh, *paths, chunk_size=CHUNK_SIZE):
+    """Yield ``(path, value)`` for every value at one of *paths* (see above)."""
+    targets = {tuple(p.split(".")) if p else () for p in paths}
+    # Containers on the way to a target are walked; anything else is skipped.
+    prefixes = {t[:i] for t in targets for i in range(len(t))}
+    buf = _Buffer(fh, chunk_size)
+    path = []
+    stack = []          # "{" or "[" per open container
+    state = _VALUE
+    while True:
+        if state == _VALUE:
+            here = tuple(path)
+            if here in targets:
+                yield ".".join(here), buf.value()
+                state = _AFTER
+            elif here not in prefixes:
+                buf.skip()
+                state = _AFTER
+            else:
+                punct, string, scalar = buf.token()
+                if punct == "{":
+                    stack.append("{")
+                    state = _FIRST_KEY
+                elif punct == "[":
+                    stack.append("[")
+                    path.append("item")
+                    state = _FIRST_ITEM
+                elif punct is None:
+                    state = _AFTER
+                else:
+                    raise ValueError(f"unexpected {punct!r} in JSON")
+        elif state == _FIRST_ITEM:
+            if buf.peek() == "]":
+                buf.token()
+                stack.pop()
+                path.pop()
+                state = _AFTER
+            else:
+                state = _VALUE
+        elif state in (_FIRST_KEY, _KEY):
+            punct, string, _ = buf.token()
+            if punct == "}" and state == _FIRST_KEY:
+                stack.pop()
+                state = _AFTER
+            elif string is not None and buf.token()[0] == ":":
+                path.append(_key(string))
+                state = _VALUE
+            else:
+                raise ValueError("expected an object key")
+        else:   # _AFTER a complete value
+            if not stack:
+                return
+            punct = buf.token()[0]
+            if stack[-1] == "{":
+                path.pop()
+                if punct == ",":
+                    state = _KEY
+                    continue
+                if punct != "}":
+                    raise ValueError("expected ',' or '}' in JSON object")
+            else:
+                if punct == ",":
+                    state = _VALUE
+                    continue
+                if punct != "]":
+                    raise ValueError("expected ',' or ']' in JSON array")
+                path.pop()
+            stack.pop()
@@ -0,0 +1,139 @@
+"""
+Layout cache
+============
+Most of a build's layout time is spent breaking paragraphs into lines.
+Much of that work is repeated: tables wrap every cell once to size their
+rows, again after each split and again when drawing. Badges such as
+``status_cell`` or ``severity_style`` cells and the repeated table headers
+come back with the same text and style on every page and in both
+languages.
+
+Two process-wide caches remove the repetition:
+
+* ``Paragraph`` — a drop-in subclass of ReportLab's ``Paragraph`` whose
+  ``wrap()`` looks up ``(text, bullet, style, width)`` in a size-bounded LRU
+  cache and reuses the stored line breaks. The cache lives as long as the
+  process, so the second language and — in a long-running process — later
+  rebuilds start warm.
+* ``string_width`` — a memoised ``pdfmetrics.stringWidth``, installed in
+  place of the module-level reference that ReportLab's paragraph and table
+  code measure words with.
+
+Cached line breaks are shared between paragraphs. ReportLab's ``split()``
+edits the word fragments of the layout it splits, so a paragraph re-breaks
+its lines privately before it is split.
+
+The caches assume fonts are not re-registered under an existing name while
+the process runs.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import paragraph as _rl_paragraph
+from reportlab.platypus import tables as _rl_tables
+
+from .styles import FrozenParagraphStyle
+
+LAYOUT_CACHE_SIZE = 4096
+STRING_WIDTH_CACHE_SIZE = 65536
+
+_stringWidth = pdfmetrics.stringWidth
+
+
+@lru_cache(maxsize=STRING_WIDTH_CACHE_SIZE)
+def string_width(text, fontName, fontSize, encoding="utf8"):
+    return _stringWidth(text, fontName, fontSize, encoding)
+
+
+_rl_paragraph.stringWidth = string_width
+_rl_tables.stringWidth = string_width
+
+
+class _LRU:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+
+_LAYOUTS = _LRU(LAYOUT_CACHE_SIZE)
+
+
+def _hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def style_key(style):
+    """Hashable identity of a style's layout-relevant attributes."""
+    if type(style) is FrozenParagraphStyle:
+        return style   # immutable; identity is enough, and the key keeps it alive
+    return tuple(
+        (k, _hashable(v)) for k, v in sorted(style.__dict__.items())
+        if k not in ("name", "parent")
+    )
+
+
+class Paragraph(_rl_paragraph.Paragraph):
+    """``Paragraph`` whose line breaking is cached (see module docstring)."""
+
+    _shared_layout = False
+
+    def _layout_key(self, availWidth):
+        text, bullet = self.text, self.bulletText
+        if text is None or not (bullet is None or isinstance(bullet, str)):
+            return None   # split pieces and fragment bullets are laid out directly
+        return (text, bullet, style_key(self.style),
+                getattr(self, "autoLeading", None), availWidth)
+
+    def wrap(self, availWidth, availHeight):
+        key = self._layout_key(availWidth)
+        if key is None:
+            return super().wrap(availWidth, availHeight)
+        cached = _LAYOUTS.get(key)
+        if cached is None:
+            before = dict(self.__dict__)
+            super().wrap(availWidth, availHeight)
+            cached = {k: v for k, v in self.__dict__.items()
+                      if k not in before or before[k] is not v}
+            _LAYOUTS.put(key, cached)
+        else:
+            self.__dict__.update(cached)
+        self._shared_layout = True
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        if self._shared_layout:
+            self._shared_layout = False
+            super().wrap(availWidth, availHeight)
+        return super().split(availWidth, availHeight)
+
+
+def cache_info():
+    """Hit/miss counters of both caches, e.g. for the profiler output."""
+    sw = string_width.cache_info()
+    return {
+        "layout": {"hits": _LAYOUTS.hits, "misses": _LAYOUTS.misses,
+                   "size": len(_LAYOUTS.data), "maxsize": _LAYOUTS.maxsize},
+        "string_width": {"hits": sw.hits, "misses": sw.misses,
+                         "size": sw.currsize, "maxsize": sw.maxsize},
+    }
@@ -0,0 +1,179 @@
+"""
+Build manifest
+==============
+Records, per report, a hash of everything that went into the last build and
+the hashes of the files it produced. A report is rebuilt only when its input
+hash changes or one of its recorded outputs is missing or was modified.
+
+The input hash covers:
+
+* the generator source — which holds the content dicts (``CONTENT_DE``,
+  ``DATA``, ``SCENARIOS``, …) — and every module of the shared library,
+* the bundled fonts, for reports that embed them,
+* declared data inputs (``ReportSpec.inputs``) and the listing of declared
+  input directories (``ReportSpec.input_dirs``: name, size and mtime),
+* the checked-out commit id, for specs with ``git_head`` (read from
+  ``.git`` directly; no ``git`` process),
+* parameters: languages, Python and ReportLab versions, and the
+  environment variables listed in ``HASHED_ENV``.
+
+The build date is deliberately not part of it, so a report whose only change
+would be today's date is not regenerated. File hashes are cached by
+``(mtime, size)`` so an up-to-date check does not re-read unchanged files.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+
+import reportlab
+
+from .registry import FONTS_DIR, LIB_DIR, REPORTS_DIR, ROOT_DIR
+
+MANIFEST_PATH = os.path.join(REPORTS_DIR, ".build-manifest.json")
+MANIFEST_VERSION = 1
+
+# Environment variables that change what a generator writes.
+HASHED_ENV = ("SOURCE_DATE_EPOCH", "REPORTS_REPRODUCIBLE", "REPORTS_OPTIMIZE",
+              "REPORTS_RETENTION_DUMPS")
+
+
+def _rel(path):
+    return os.path.relpath(path, ROOT_DIR)
+
+
+def _read(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return fh.read().strip()
+    except OSError:
+        return None
+
+
+def git_head(root=ROOT_DIR):
+    """The commit id HEAD points at, or None outside a git checkout."""
+    git_dir = os.path.join(root, ".git")
+    if os.path.isfile(git_dir):                     # worktree: "gitdir: <path>"
+        git_dir = os.path.join(root, (_read(git_dir) or "").partition("gitdir:")[2].strip())
+    head = _read(os.path.join(git_dir, "HEAD"))
+    if not head or not head.startswith("ref:"):
+        return head                                 # detached: the commit id itself
+    ref = head[4:].strip()
+    # Linked worktrees keep their refs in the main repository ("commondir").
+    common = os.path.join(git_dir, _read(os.path.join(git_dir, "commondir")) or ".")
+    for base in (git_dir, common):
+        commit = _read(os.path.join(base, ref))
+        if commit:
+            return commit
+    for line in (_read(os.path.join(common, "packed-refs")) or "").splitlines():
+        if line.endswith(" " + ref):
+            return line.split(" ", 1)[0]
+    return None
+
+
+class Manifest:
+    """The on-disk build manifest (``reports/.build-manifest.json``)."""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.reports = {}
+        self._file_hashes = {}
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.reports = data.get("reports", {})
+            self._file_hashes = data.get("file_hashes", {})
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "reports": self.reports,
+                "file_hashes": self._file_hashes,
+            }, fh, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    # ── hashing ───────────────────────────────────────────────
+    def file_hash(self, path):
+        """SHA-256 of *path*, reused while its mtime and size are unchanged."""
+        st = os.stat(path)
+        key = _rel(path)
+        cached = self._file_hashes.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 16), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        self._file_hashes[key] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def input_files(self, spec):
+        files = [spec.script_path]
+        files += sorted(glob.glob(os.path.join(LIB_DIR, "*.py")))
+        if spec.fonts:
+            files += sorted(glob.glob(os.path.join(FONTS_DIR, "*.ttf")))
+        for pattern in spec.inputs:
+            files += sorted(glob.glob(os.path.join(ROOT_DIR, pattern), recursive=True))
+        return files
+
+    @staticmethod
+    def dir_listing(spec):
+        """``(name, size, mtime)`` of the files in each of *spec*'s input directories."""
+        listing = []
+        for env, suffixes in spec.input_dirs:
+            directory = os.environ.get(env)
+            try:
+                names = sorted(os.listdir(directory)) if directory else []
+            except OSError:
+                names = []
+            for name in names:
+                if name.lower().endswith(suffixes):
+                    st = os.stat(os.path.join(directory, name))
+                    listing.append([env, name, st.st_size, st.st_mtime_ns])
+        return listing
+
+    def input_hash(self, spec):
+        h = hashlib.sha256()
+        params = {
+            "langs": list(spec.langs),
+            "python": "%d.%d" % sys.version_info[:2],
+            "reportlab": reportlab.Version,
+            "env": {k: os.environ.get(k) for k in HASHED_ENV},
+            "dirs": self.dir_listing(spec),
+            "head": git_head() if spec.git_head else None,
+        }
+        h.update(json.dumps(params, sort_keys=True).encode())
+        for path in self.input_files(spec):
+            h.update(_rel(path).encode())
+            h.update(self.file_hash(path).encode())
+        return h.hexdigest()
+
+    # ── state ─────────────────────────────────────────────────
+    def is_current(self, spec, input_hash):
+        """True when the last build used *input_hash* and its outputs are intact."""
+        entry = self.reports.get(spec.name)
+        if not entry or entry.get("input_hash") != input_hash or not entry.get("outputs"):
+            return False
+        for rel, digest in entry["outputs"].items():
+            path = os.path.join(ROOT_DIR, rel)
+            if not os.path.exists(path) or self.file_hash(path) != digest:
+                return False
+        return True
+
+    def record(self, spec, input_hash, outputs, duration):
+        self.reports[spec.name] = {
+            "input_hash": input_hash,
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "duration_s": round(duration, 3),
+            "outputs": {_rel(p): self.file_hash(p) for p in sorted(outputs)},
+        }
@@ -0,0 +1,127 @@
+"""
+Number formatting
+=================
+One formatter per locale for the numbers the reports print::
+
+    de = formatter("de")         # shared; same as Formatter(DE_DE)
+    de.currency(1234.5)          # "1.234,50 €"
+    de.percent(1.8)              # "1,8 %"
+    de.compact(1_230_000)        # "1,23 Mio. €"
+    de.integer(np.array([1200, 1200, 35]))   # array(["1.200", "1.200", "35"])
+
+Every method takes a scalar (returns ``str``) or anything array-like
+(returns a numpy array of ``str`` with the same shape). Arrays are
+formatted per distinct value (``np.unique``) and mapped back, and each
+formatter remembers what it has formatted. A column of 100k cells with a
+few hundred distinct amounts therefore costs a few hundred format calls.
+
+Separators are swapped in one ``str.translate`` pass over Python's own
+``{:,.2f}`` output. A ``Locale`` also fixes where the currency sign and
+the percent sign go. Reports with their own house style derive one with
+``dataclasses.replace``. For example, the German profit report writes
+``€8,80`` and ``2,8%``::
+
+    Formatter(replace(DE_DE, currency="€{}", percent="{}%", compact=("K", "M")))
+
+``percent`` takes percentage points (``1.8`` → ``"1.8%"``). Negative
+values get a leading ``-``. NaN and infinity (an offer not sold at that
+team size, see ``pricing``) print as ``—``.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+MEMO_SIZE = 1 << 16
+MISSING = "—"
+
+
+@dataclass(frozen=True)
+class Locale:
+    group: str                   # thousands separator
+    decimal: str
+    currency: str = "€{}"        # "{}" is the formatted amount
+    percent: str = "{}%"
+    compact: tuple = ("K", "M")  # suffixes for thousands and millions
+
+
+EN_US = Locale(",", ".")
+DE_DE = Locale(".", ",", currency="{} €", percent="{} %", compact=(" Tsd.", " Mio."))
+LOCALES = {"en": EN_US, "de": DE_DE}
+
+
+class Formatter:
+    """Locale-aware number formats (see module docstring)."""
+
+    def __init__(self, locale=EN_US):
+        if isinstance(locale, str):
+            locale = LOCALES[locale]
+        self.locale = locale
+        self._table = str.maketrans({",": locale.group, ".": locale.decimal})
+        self._memo = {}
+
+    # ── formats ──────────────────────────────────────────────
+    def number(self, values, decimals=0):
+        return self._apply(("number", decimals), values)
+
+    def integer(self, values):
+        return self._apply(("number", 0), values)
+
+    def currency(self, values, decimals=2):
+        return self._apply(("currency", decimals), values)
+
+    def percent(self, values, decimals=1):
+        return self._apply(("percent", decimals), values)
+
+    def compact(self, values, decimals=0):
+        """Currency in thousands/millions: ``€1.23M``, ``€420K``, ``€950``."""
+        return self._apply(("compact", decimals), values)
+
+    # ── machinery ────────────────────────────────────────────
+    def _digits(self, value, decimals):
+        return f"{value:,.{decimals}f}".translate(self._table)
+
+    def _one(self, kind, decimals, value):
+        if not math.isfinite(value):
+            return MISSING
+        sign = "-" if value < 0 and round(value, decimals if kind != "compact" else 2) else ""
+        value = abs(value)
+        loc = self.locale
+        if kind == "number":
+            return sign + self._digits(value, decimals)
+        if kind == "percent":
+            return sign + loc.percent.format(self._digits(value, decimals))
+        if kind == "compact":
+            if value >= 1_000_000:
+                text = self._digits(value / 1_000_000, 2) + loc.compact[1]
+            elif value >= 1_000:
+                text = self._digits(value / 1_000, 0) + loc.compact[0]
+            else:
+                text = self._digits(value, decimals)
+            return sign + loc.currency.format(text)
+        return sign + loc.currency.format(self._digits(value, decimals))
+
+    def _format(self, key, value):
+        memo_key = (key, value)
+        text = self._memo.get(memo_key)
+        if text is None:
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo.clear()
+            text = self._memo[memo_key] = self._one(*key, value)
+        return text
+
+    def _apply(self, key, values):
+        if np.ndim(values) == 0:
+            return self._format(key, float(values))
+        values = np.asarray(values, dtype=float)
+        unique, inverse = np.unique(values, return_inverse=True)
+        texts = np.array([self._format(key, v) for v in unique.tolist()], dtype=object)
+        return texts[inverse].reshape(values.shape).astype(str)
+
+
+@lru_cache(maxsize=None)
+def formatter(locale):
+    """The shared ``Formatter`` for *locale* (``"de"``, ``"en"`` or a ``Locale``)."""
+    return Formatter(locale)
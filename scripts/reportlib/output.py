@@ -0,0 +1,97 @@
+"""
+Render output
+=============
+Generators hand the doc template a ``PdfOutput`` instead of a file name, so
+one ``build_pdf()`` serves the command line, servers and batch jobs::
+
+    result = build_pdf("de")                          # reports/… as before
+    result = build_pdf("de", output="/tmp/x.pdf")     # another file
+    result = build_pdf("de", output=io.BytesIO())     # in memory only
+    result = build_pdf("de", output=response.stream)  # anything with write()
+
+Every call returns a ``RenderResult`` with the PDF bytes, page count, size
+and build time. ReportLab assembles the whole file in memory before writing
+it, so keeping the bytes costs no copy, and callers no longer re-open or
+stat the file they just wrote.
+
+The bytes pass through ``pdfopt.optimize()`` before they are written or
+returned, so every target receives the compacted file.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+
+from . import pdfopt
+
+
+@dataclass
+class RenderResult:
+    """One rendered document."""
+
+    name: str
+    data: bytes
+    pages: int
+    build_s: float
+    path: str = None   # set when the PDF was written to a file
+
+    @property
+    def size(self):
+        return len(self.data)
+
+    def __str__(self):
+        return self.path or f"<{self.name}: {self.size} bytes>"
+
+
+class PdfOutput:
+    """File-like target for ``SimpleDocTemplate(filename=...)``.
+
+    *output* is a path, an object with ``write()`` or None for
+    *default_path*. The build time is measured from construction to
+    ``result()``.
+    """
+
+    def __init__(self, name, output=None, default_path=None):
+        self.label = name
+        self.path = self._stream = None
+        if output is None:
+            output = default_path
+        if isinstance(output, (str, os.PathLike)):
+            self.path = os.fspath(output)
+            self.name = self.path   # ReportLab reads .name for messages
+        elif callable(getattr(output, "write", None)):
+            self._stream = output
+            self.name = getattr(output, "name", f"<{name}>")
+        else:
+            raise TypeError(f"cannot render {name} to {output!r}")
+        self._chunks = []
+        self._start = time.perf_counter()
+
+    def write(self, data):
+        self._chunks.append(data)
+        return len(data)
+
+    def flush(self):
+        pass   # nothing leaves before result(): the whole file is optimised at once
+
+    def result(self, doc):
+        """Optimise and write the output of the built *doc*; describe it."""
+        data = b"".join(self._chunks)
+        if pdfopt.enabled():
+            data = pdfopt.optimize(data)
+        if self.path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "wb") as fh:
+                fh.write(data)
+        else:
+            self._stream.write(data)
+            flush = getattr(self._stream, "flush", None)
+            if flush is not None:
+                flush()
+        return RenderResult(
+            name=self.label,
+            data=data,
+            pages=doc.page,
+            build_s=time.perf_counter() - self._start,
+            path=self.path,
+        )
@@ -0,0 +1,198 @@
+"""
+Section-parallel layout
+=======================
+Lays out page-aligned groups of sections in worker processes and draws the
+result in the parent, for reports whose layout dominates the build time::
+
+    build_sections(doc, [
+        (cover_section(c, styles),),
+        (summary_section(c, styles), gps_purge_section(c, styles)),
+        (absence_section(c, styles),),
+    ], onFirstPage=footer, onLaterPages=footer)
+
+Each group must start on a new page in the serial layout too — i.e. the
+group before it ends with a ``PageBreak`` — because a worker lays its
+group out from the top of an empty page.
+
+Workers only *lay out*: every story flowable is wrapped in a proxy whose
+``drawOn`` records ``(page, flowable, x, y)`` instead of drawing. The
+placed pieces — already wrapped and split, so they carry their line breaks
+and row heights — are pickled back and replayed page by page into the
+parent's ``doc.build()``. Drawing happens once, on one canvas, so:
+
+* every font is embedded as a single subset, exactly as in a serial build,
+* page templates, footers and ``PageTrackingCanvas`` see the real page
+  sequence — "Page X of Y", TOC page references and outlines need no
+  rewriting,
+* the PDF is byte-identical to the serial build.
+
+Merging separately rendered PDFs was not an option: each would carry its
+own font subsets, and page numbers would have to be patched into finished
+content streams.
+
+The number of workers comes from ``REPORTS_JOBS`` (default 1 = serial).
+Workers are forked, so the section generators need not be picklable; on
+platforms without ``fork`` the build is serial. Profiled builds are always
+serial.
+"""
+
+import io
+import multiprocessing
+import os
+import pickle
+from itertools import chain
+
+from reportlab.pdfgen import canvas
+from reportlab.platypus import PageBreak
+from reportlab.platypus.doctemplate import ActionFlowable, BaseDocTemplate, PageTemplate
+from reportlab.platypus.flowables import Flowable
+from reportlab.platypus.frames import Frame
+
+from .streaming import stream
+
+JOBS_ENV = "REPORTS_JOBS"
+
+
+def section_jobs():
+    """Worker processes requested via ``REPORTS_JOBS``."""
+    try:
+        return max(1, int(os.environ.get(JOBS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+# ── worker side ──────────────────────────────────────────────
+class _Recorder:
+    def __init__(self):
+        self.placed = []   # (page, flowable, x, y, sW)
+
+    def proxy(self, flowable):
+        if isinstance(flowable, (ActionFlowable, _Proxy)):
+            return flowable
+        return _Proxy(flowable, self)
+
+    def pages(self):
+        count = max((p for p, *_ in self.placed), default=0)
+        pages = [[] for _ in range(count)]
+        for page, *item in self.placed:
+            pages[page - 1].append(tuple(item))
+        return pages
+
+
+class _Proxy:
+    """Stands in for a story flowable: lays it out, records where it lands."""
+
+    def __init__(self, flowable, recorder):
+        object.__setattr__(self, "_flowable", flowable)
+        object.__setattr__(self, "_recorder", recorder)
+
+    # isinstance() checks in the doc template must see the real class.
+    @property
+    def __class__(self):
+        return self._flowable.__class__
+
+    def __getattr__(self, name):
+        return getattr(self._flowable, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._flowable, name, value)
+
+    def __delattr__(self, name):
+        delattr(self._flowable, name)
+
+    def split(self, availWidth, availHeight):
+        return [self._recorder.proxy(f) for f in self._flowable.split(availWidth, availHeight)]
+
+    def splitOn(self, canv, availWidth, availHeight):
+        return [self._recorder.proxy(f) for f in self._flowable.splitOn(canv, availWidth, availHeight)]
+
+    def drawOn(self, canv, x, y, _sW=0):
+        self._recorder.placed.append((canv.getPageNumber(), self._flowable, x, y, _sW))
+
+
+def _none():
+    return None
+
+
+def _same(obj):
+    return obj
+
+
+class _Pickler(pickle.Pickler):
+    """Drops the worker's canvas, frames and doc template from placed flowables."""
+
+    def reducer_override(self, obj):
+        if type(obj) is _Proxy:
+            return _same, (object.__getattribute__(obj, "_flowable"),)
+        if isinstance(obj, (canvas.Canvas, BaseDocTemplate, Frame, PageTemplate)):
+            return _none, ()
+        return NotImplemented
+
+
+_WORK = {}
+
+
+def _layout_group(index):
+    doc, group = _WORK["doc"], _WORK["groups"][index]
+    recorder = _Recorder()
+    doc.filename = io.BytesIO()
+    doc._doSave = 0
+    doc.build(stream(map(recorder.proxy, chain.from_iterable(group))),
+              canvasmaker=canvas.Canvas)
+    buf = io.BytesIO()
+    _Pickler(buf, pickle.HIGHEST_PROTOCOL).dump(recorder.pages())
+    return buf.getvalue()
+
+
+# ── parent side ──────────────────────────────────────────────
+class _PlacedPage(Flowable):
+    """Draws one recorded page's flowables at their recorded positions."""
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = items
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def drawOn(self, canv, x, y, _sW=0):
+        for flowable, fx, fy, sW in self.items:
+            flowable.drawOn(canv, fx, fy, _sW=sW)
+
+
+def _replay(groups):
+    story = []
+    for pages in groups:
+        for items in pages:
+            if story:
+                story.append(PageBreak())
+            story.append(_PlacedPage(items))
+    return story
+
+
+def build_sections(doc, groups, jobs=None, profiler=None, **kwargs):
+    """Build *doc* from page-aligned *groups* of section iterables.
+
+    With one job (or one group) this is ``doc.build(stream(...))`` — via
+    *profiler* when given.
+    """
+    jobs = section_jobs() if jobs is None else jobs
+    jobs = min(jobs, len(groups))
+    parallel = (
+        jobs > 1
+        and "fork" in multiprocessing.get_all_start_methods()
+        and not (profiler and profiler.enabled)
+    )
+    if not parallel:
+        story = stream(*chain.from_iterable(groups))
+        if profiler is not None:
+            return profiler.build(doc, story, **kwargs)
+        return doc.build(story, **kwargs)
+
+    _WORK.update(doc=doc, groups=groups)
+    try:
+        with multiprocessing.get_context("fork").Pool(jobs) as pool:
+            laid_out = pool.map(_layout_group, range(len(groups)), chunksize=1)
+    finally:
+        _WORK.clear()
+    return doc.build(_replay(pickle.loads(b) for b in laid_out), **kwargs)
@@ -0,0 +1,547 @@
+"""
+PDF size optimisation
+=====================
+ReportLab writes every stream ASCII85-encoded, every object as a separate
+indirect object and a plain-text cross-reference table. For reports that are
+mostly text that adds up to a third of the file. This module shrinks its
+output without changing what is drawn:
+
+* Binary streams: ``rl_config.useA85`` is switched off when this module is
+  imported, so page content is written as plain Flate data rather than
+  ASCII85 text (25% larger).
+* Recompression: Flate streams are recompressed at level 9. Uncompressed
+  streams are compressed when that helps.
+* Deduplication: byte-identical objects — repeated drawings, widths arrays,
+  resource dictionaries — are merged, references are rewritten, and
+  unreachable objects are dropped.
+* Object streams: every non-stream object goes into compressed object
+  streams, indexed by a cross-reference stream (PDF 1.5) instead of the
+  20-bytes-per-object xref table.
+
+* Font subsets: ReportLab already embeds TrueType fonts as subsets holding
+  only the glyphs used, but copies the ``name`` table in full. DejaVu carries
+  its licence text there twice, once per platform; the Unicode copies are
+  dropped when Macintosh records hold the same names, which keeps the
+  notices and removes a fifth of every embedded font.
+
+``optimize()`` is applied by ``PdfOutput`` to every report. Set
+``REPORTS_OPTIMIZE=0`` to get ReportLab's output unchanged, e.g. to compare
+sizes (``bench_reports.py`` does).
+
+The parser handles what ReportLab and this module write. It is not a
+general-purpose PDF reader: encrypted files and incremental updates are
+passed through untouched.
+"""
+
+import base64
+import os
+import re
+import struct
+import zlib
+
+from reportlab import rl_config
+
+OPTIMIZE_ENV = "REPORTS_OPTIMIZE"
+OBJECTS_PER_STREAM = 200
+
+
+def enabled():
+    return os.environ.get(OPTIMIZE_ENV, "1") != "0"
+
+
+if enabled():
+    rl_config.useA85 = 0
+
+
+# ── objects ──────────────────────────────────────────────────
+class Name(bytes):
+    """``/Name`` (stored without the slash, still escaped)."""
+
+
+class Ref(tuple):
+    """``n g R``."""
+
+    def __new__(cls, num, gen=0):
+        return tuple.__new__(cls, (num, gen))
+
+
+class Raw(bytes):
+    """A token kept verbatim: numbers, strings, ``true``/``false``/``null``."""
+
+
+class Stream:
+    __slots__ = ("dict", "data")
+
+    def __init__(self, dct, data):
+        self.dict = dct
+        self.data = data
+
+
+class PdfError(ValueError):
+    pass
+
+
+# ── parsing ──────────────────────────────────────────────────
+_WS = b" \t\r\n\f\x00"
+_DELIM = b"()<>[]{}/%"
+_INT = re.compile(rb"[+-]?\d+")
+_NUMBER = re.compile(rb"[+-]?(?:\d+\.?\d*|\.\d+)")
+_REF = re.compile(rb"(\d+)\s+(\d+)\s+R(?![^\s()<>\[\]{}/%])")
+_TOKEN_END = re.compile(rb"[\s()<>\[\]{}/%]")
+
+
+def _skip_ws(data, pos):
+    n = len(data)
+    while pos < n:
+        c = data[pos]
+        if c in _WS:
+            pos += 1
+        elif c == 0x25:  # % comment
+            while pos < n and data[pos] not in b"\r\n":
+                pos += 1
+        else:
+            break
+    return pos
+
+
+def _literal_string_end(data, pos):
+    depth, pos = 0, pos
+    while True:
+        c = data[pos]
+        if c == 0x5C:  # backslash escapes the next byte
+            pos += 2
+            continue
+        if c == 0x28:
+            depth += 1
+        elif c == 0x29:
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+
+
+def parse_value(data, pos):
+    """Parse one object at *pos*; return ``(value, end)``."""
+    pos = _skip_ws(data, pos)
+    c = data[pos:pos + 1]
+    if c == b"/":
+        end = _TOKEN_END.search(data, pos + 1)
+        end = end.start() if end else len(data)
+        return Name(data[pos + 1:end]), end
+    if c == b"<":
+        if data[pos + 1:pos + 2] == b"<":
+            pos += 2
+            dct = {}
+            while True:
+                pos = _skip_ws(data, pos)
+                if data[pos:pos + 2] == b">>":
+                    return dct, pos + 2
+                key, pos = parse_value(data, pos)
+                if not isinstance(key, Name):
+                    raise PdfError(f"dictionary key expected at {pos}")
+                dct[key], pos = parse_value(data, pos)
+        end = data.index(b">", pos) + 1
+        return Raw(data[pos:end]), end
+    if c == b"[":
+        pos += 1
+        items = []
+        while True:
+            pos = _skip_ws(data, pos)
+            if data[pos:pos + 1] == b"]":
+                return items, pos + 1
+            item, pos = parse_value(data, pos)
+            items.append(item)
+    if c == b"(":
+        end = _literal_string_end(data, pos)
+        return Raw(data[pos:end]), end
+    m = _REF.match(data, pos)
+    if m:
+        return Ref(int(m.group(1)), int(m.group(2))), m.end()
+    m = _NUMBER.match(data, pos)
+    if m:
+        return Raw(m.group()), m.end()
+    end = _TOKEN_END.search(data, pos)
+    end = end.start() if end else len(data)
+    if end == pos:
+        raise PdfError(f"unexpected byte {c!r} at {pos}")
+    return Raw(data[pos:end]), end
+
+
+def _parse_indirect(data, pos):
+    """Parse ``n g obj … endobj`` at *pos*; return ``(num, value)``."""
+    m = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj").match(data, pos)
+    if not m:
+        raise PdfError(f"object expected at {pos}")
+    value, pos = parse_value(data, m.end())
+    after = _skip_ws(data, pos)
+    if isinstance(value, dict) and data.startswith(b"stream", after):
+        start = after + 6
+        if data[start:start + 2] == b"\r\n":
+            start += 2
+        elif data[start:start + 1] in (b"\n", b"\r"):
+            start += 1
+        length = value.get(Name(b"Length"))
+        if not isinstance(length, Raw):
+            raise PdfError("indirect stream lengths are not supported")
+        value = Stream(value, data[start:start + int(length)])
+    return int(m.group(1)), value
+
+
+def _xref_table(data, pos, offsets):
+    pos = _skip_ws(data, pos + 4)  # "xref"
+    while True:
+        m = re.compile(rb"(\d+)\s+(\d+)\s*[\r\n]+").match(data, pos)
+        if not m:
+            break
+        first, count = int(m.group(1)), int(m.group(2))
+        pos = m.end()
+        for i in range(count):
+            entry = data[pos:pos + 20]
+            if entry[17:18] == b"n":
+                offsets.setdefault(first + i, int(entry[:10]))
+            pos += 20
+    pos = _skip_ws(data, pos)
+    if not data.startswith(b"trailer", pos):
+        raise PdfError("trailer expected")
+    trailer, _ = parse_value(data, pos + 7)
+    return trailer
+
+
+def load(data):
+    """Return ``(objects, trailer)`` for a PDF written by ReportLab or by this module."""
+    m = re.search(rb"startxref\s+(\d+)\s+%%EOF\s*$", data[-1024:])
+    if not m:
+        raise PdfError("startxref not found")
+    pos = int(m.group(1))
+    offsets, in_streams = {}, {}
+    if data.startswith(b"xref", pos):
+        trailer = _xref_table(data, pos, offsets)
+        if Name(b"Prev") in trailer:
+            raise PdfError("incremental updates are not supported")
+    else:
+        _, xref = _parse_indirect(data, pos)
+        trailer = xref.dict
+        if Name(b"Prev") in trailer:
+            raise PdfError("incremental updates are not supported")
+        widths = [int(w) for w in trailer[Name(b"W")]]
+        index = [int(i) for i in trailer.get(Name(b"Index"), [Raw(b"0"), trailer[Name(b"Size")]])]
+        rows = decode(xref)
+        step, row = sum(widths), 0
+        for first, count in zip(index[::2], index[1::2]):
+            for num in range(first, first + count):
+                fields, p = [], row * step
+                for w in widths:
+                    fields.append(int.from_bytes(rows[p:p + w], "big") if w else 1)
+                    p += w
+                row += 1
+                if fields[0] == 1:
+                    offsets[num] = fields[1]
+                elif fields[0] == 2:
+                    in_streams[num] = (fields[1], fields[2])
+    objects = {}
+    for num, offset in offsets.items():
+        objects[num] = _parse_indirect(data, offset)[1]
+    for num, (container, _) in in_streams.items():
+        stm = objects[container]
+        header = decode(stm)
+        first, count = int(stm.dict[Name(b"First")]), int(stm.dict[Name(b"N")])
+        pairs = [int(x) for x in header[:first].split()][:2 * count]
+        for onum, off in zip(pairs[::2], pairs[1::2]):
+            if onum == num:
+                objects[num] = parse_value(header, first + off)[0]
+    for num in {c for c, _ in in_streams.values()}:
+        objects.pop(num, None)
+    for num, value in list(objects.items()):
+        if isinstance(value, Stream) and value.dict.get(Name(b"Type")) == Name(b"XRef"):
+            del objects[num]
+    return objects, trailer
+
+
+# ── streams ──────────────────────────────────────────────────
+def _filters(stream):
+    f = stream.dict.get(Name(b"Filter"))
+    if f is None:
+        return []
+    return list(f) if isinstance(f, list) else [f]
+
+
+def decode(stream):
+    """Decoded data of a Flate/ASCII85 stream (without predictors)."""
+    data = stream.data
+    for f in _filters(stream):
+        if f == b"FlateDecode":
+            data = zlib.decompress(data)
+        elif f == b"ASCII85Decode":
+            data = base64.a85decode(data.strip(), adobe=True, ignorechars=b" \t\r\n")
+        else:
+            raise PdfError(f"unsupported filter /{f.decode()}")
+    return data
+
+
+def _recompress(stream):
+    filters = _filters(stream)
+    if Name(b"DecodeParms") in stream.dict or not set(filters) <= {b"FlateDecode", b"ASCII85Decode"}:
+        return stream
+    raw = decode(stream)
+    packed = zlib.compress(raw, 9)
+    if len(packed) >= len(stream.data) and filters == [b"FlateDecode"]:
+        return stream
+    if len(packed) >= len(raw):
+        dct = {k: v for k, v in stream.dict.items() if k != b"Filter"}
+        return Stream(dct, raw)
+    dct = dict(stream.dict)
+    dct[Name(b"Filter")] = Name(b"FlateDecode")
+    return Stream(dct, packed)
+
+
+# ── fonts ────────────────────────────────────────────────────
+def _checksum(data):
+    data += b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+
+def _slim_name_table(table):
+    fmt, count, storage = struct.unpack(">HHH", table[:6])
+    if fmt != 0:
+        return table
+    records = [struct.unpack(">6H", table[6 + 12 * i:18 + 12 * i]) for i in range(count)]
+    mac = {r[3] for r in records if r[:3] == (1, 0, 0)}
+    keep = [r for r in records if r[0] != 3 or r[3] not in mac]
+    if len(keep) == len(records):
+        return table
+    strings, offsets, out = table[storage:], {}, []
+    for platform, encoding, language, name_id, length, offset in keep:
+        text = strings[offset:offset + length]
+        if text not in offsets:
+            offsets[text] = sum(len(t) for t in offsets)
+        out.append(struct.pack(">6H", platform, encoding, language, name_id, length, offsets[text]))
+    head = struct.pack(">HHH", 0, len(keep), 6 + 12 * len(keep))
+    return head + b"".join(out) + b"".join(offsets)
+
+
+def slim_truetype(font):
+    """*font* with its ``name`` table reduced (see module docstring)."""
+    num = struct.unpack(">H", font[4:6])[0]
+    tables = {}
+    for i in range(num):
+        tag, _, offset, length = struct.unpack(">4sIII", font[12 + 16 * i:28 + 16 * i])
+        tables[tag] = font[offset:offset + length]
+    if b"name" not in tables or b"head" not in tables:
+        return font
+    slim = _slim_name_table(tables[b"name"])
+    if slim == tables[b"name"]:
+        return font
+    tables[b"name"] = slim
+    tables[b"head"] = tables[b"head"][:8] + b"\0\0\0\0" + tables[b"head"][12:]
+    directory, body = [], []
+    offset = 12 + 16 * len(tables)
+    for tag in sorted(tables):
+        data = tables[tag]
+        directory.append(struct.pack(">4sIII", tag, _checksum(data), offset, len(data)))
+        body.append(data + b"\0" * (-len(data) % 4))
+        offset += len(body[-1])
+    out = font[:12] + b"".join(directory) + b"".join(body)
+    head_at = 12 + 16 * len(tables) + sum(len(b) for t, b in zip(sorted(tables), body) if t < b"head")
+    adjust = (0xB1B0AFBA - _checksum(out)) & 0xFFFFFFFF
+    return out[:head_at + 8] + struct.pack(">I", adjust) + out[head_at + 12:]
+
+
+def _slim_fonts(objects):
+    for value in list(objects.values()):
+        if not (isinstance(value, dict) and value.get(Name(b"Type")) == Name(b"FontDescriptor")):
+            continue
+        ref = value.get(Name(b"FontFile2"))
+        stream = objects.get(ref[0]) if isinstance(ref, Ref) else None
+        if not isinstance(stream, Stream):
+            continue
+        try:
+            font = decode(stream)
+            slim = slim_truetype(font)
+        except (PdfError, struct.error, zlib.error):
+            continue
+        if slim is not font:
+            dct = {k: v for k, v in stream.dict.items() if k != b"Filter"}
+            dct[Name(b"Length1")] = Raw(b"%d" % len(slim))
+            objects[ref[0]] = Stream(dct, slim)
+
+
+# ── serialising ──────────────────────────────────────────────
+def _needs_space(prev, nxt):
+    return prev[-1:] not in b"()<>[]{}/" and nxt[:1] not in b"()<>[]{}/"
+
+
+def serialize(value):
+    parts = []
+
+    def emit(token):
+        if parts and _needs_space(parts[-1], token):
+            parts.append(b" ")
+        parts.append(token)
+
+    def walk(v):
+        if isinstance(v, Name):
+            emit(b"/" + v)
+        elif isinstance(v, Ref):
+            emit(b"%d %d R" % v)
+        elif isinstance(v, Raw):
+            emit(bytes(v))
+        elif isinstance(v, dict):
+            emit(b"<<")
+            for k, item in v.items():
+                emit(b"/" + k)
+                walk(item)
+            emit(b">>")
+        elif isinstance(v, list):
+            emit(b"[")
+            for item in v:
+                walk(item)
+            emit(b"]")
+        else:
+            raise PdfError(f"cannot serialise {type(v).__name__}")
+
+    walk(value)
+    return b"".join(parts)
+
+
+def _stream_bytes(stream):
+    dct = dict(stream.dict)
+    dct[Name(b"Length")] = Raw(b"%d" % len(stream.data))
+    return serialize(dct) + b"stream\n" + stream.data + b"\nendstream"
+
+
+def _map_refs(value, mapping):
+    if isinstance(value, Ref):
+        return Ref(mapping.get(value[0], value[0]))
+    if isinstance(value, dict):
+        return {k: _map_refs(v, mapping) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_map_refs(v, mapping) for v in value]
+    if isinstance(value, Stream):
+        return Stream(_map_refs(value.dict, mapping), value.data)
+    return value
+
+
+def _refs(value, out):
+    if isinstance(value, Ref):
+        out.append(value[0])
+    elif isinstance(value, dict):
+        for v in value.values():
+            _refs(v, out)
+    elif isinstance(value, list):
+        for v in value:
+            _refs(v, out)
+    elif isinstance(value, Stream):
+        _refs(value.dict, out)
+    return out
+
+
+# ── optimising ───────────────────────────────────────────────
+def _dedupe(objects):
+    """Merge identical objects until nothing changes."""
+    while True:
+        seen, mapping = {}, {}
+        for num in sorted(objects):
+            value = objects[num]
+            key = _stream_bytes(value) if isinstance(value, Stream) else serialize(value)
+            if key in seen:
+                mapping[num] = seen[key]
+            else:
+                seen[key] = num
+        if not mapping:
+            return objects
+        objects = {n: _map_refs(v, mapping) for n, v in objects.items() if n not in mapping}
+
+
+def _reachable(objects, roots):
+    order, seen, todo = [], set(), list(reversed(roots))
+    while todo:
+        num = todo.pop()
+        if num in seen or num not in objects:
+            continue
+        seen.add(num)
+        order.append(num)
+        todo.extend(reversed(_refs(objects[num], [])))
+    return order
+
+
+def _object_stream(members, objects):
+    header, body = [], []
+    offset = 0
+    for num in members:
+        chunk = serialize(objects[num])
+        header.append(b"%d %d" % (num, offset))
+        body.append(chunk)
+        offset += len(chunk) + 1
+    head = b" ".join(header) + b"\n"
+    data = head + b"\n".join(body)
+    return Stream({
+        Name(b"Type"): Name(b"ObjStm"),
+        Name(b"N"): Raw(b"%d" % len(members)),
+        Name(b"First"): Raw(b"%d" % len(head)),
+        Name(b"Filter"): Name(b"FlateDecode"),
+    }, zlib.compress(data, 9))
+
+
+def optimize(data):
+    """Return a smaller, equivalent PDF (see module docstring)."""
+    try:
+        objects, trailer = load(data)
+    except (PdfError, ValueError, IndexError, KeyError, zlib.error):
+        return data
+    if Name(b"Encrypt") in trailer:
+        return data
+
+    _slim_fonts(objects)
+    objects = {n: (_recompress(v) if isinstance(v, Stream) else v) for n, v in objects.items()}
+    objects = _dedupe(objects)
+    roots = _refs({k: v for k, v in trailer.items() if k in (b"Root", b"Info")}, [])
+    order = _reachable(objects, roots)
+    renumber = {old: new for new, old in enumerate(order, 1)}
+    objects = {renumber[n]: _map_refs(objects[n], renumber) for n in order}
+
+    plain = [n for n in sorted(objects) if not isinstance(objects[n], Stream)]
+    groups = [plain[i:i + OBJECTS_PER_STREAM] for i in range(0, len(plain), OBJECTS_PER_STREAM)]
+    next_num = len(objects) + 1
+    containers = {}
+    for group in groups:
+        objects[next_num] = _object_stream(group, objects)
+        containers.update({num: (next_num, i) for i, num in enumerate(group)})
+        next_num += 1
+    xref_num = next_num
+
+    out = [b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n"]
+    size = len(out[0])
+    offsets = {}
+    for num in sorted(objects):
+        if num in containers:
+            continue
+        offsets[num] = size
+        chunk = b"%d 0 obj\n" % num + _stream_bytes(objects[num]) + b"\nendobj\n"
+        out.append(chunk)
+        size += len(chunk)
+    offsets[xref_num] = size
+
+    width = max(1, (size.bit_length() + 7) // 8)
+    rows = [b"\x00" + b"\x00" * width + b"\xff\xff"]
+    for num in range(1, xref_num + 1):
+        if num in containers:
+            container, index = containers[num]
+            rows.append(b"\x02" + container.to_bytes(width, "big") + index.to_bytes(2, "big"))
+        else:
+            rows.append(b"\x01" + offsets[num].to_bytes(width, "big") + b"\x00\x00")
+    xref = {
+        Name(b"Type"): Name(b"XRef"),
+        Name(b"Size"): Raw(b"%d" % (xref_num + 1)),
+        Name(b"W"): [Raw(b"1"), Raw(b"%d" % width), Raw(b"2")],
+        Name(b"Root"): _map_refs(trailer[Name(b"Root")], renumber),
+        Name(b"Filter"): Name(b"FlateDecode"),
+    }
+    if Name(b"Info") in trailer:
+        xref[Name(b"Info")] = _map_refs(trailer[Name(b"Info")], renumber)
+    if Name(b"ID") in trailer:
+        xref[Name(b"ID")] = trailer[Name(b"ID")]
+    out.append(b"%d 0 obj\n" % xref_num
+               + _stream_bytes(Stream(xref, zlib.compress(b"".join(rows), 9)))
+               + b"\nendobj\n")
+    out.append(b"startxref\n%d\n%%%%EOF\n" % offsets[xref_num])
+    return b"".join(out)
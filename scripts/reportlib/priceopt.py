@@ -0,0 +1,198 @@
+"""
+Price optimizer
+===============
+Per-tier prices that maximise ARR or gross margin when conversion depends
+on the price gap to the competition::
+
+    model = DemandModel.calibrated(("Basic", "Pro"), current=(2.99, 4.99),
+                                   reference=(3.99, 6.99))
+    best = optimize(model, "arr")        # or "margin"
+    best.outcome.prices, best.outcome.arr, best.combinations
+    for tier, values in sensitivity(model, best.outcome.prices): …
+
+Demand is a multinomial logit. A prospect buys one of the tiers or stays
+with the competition (utility 0). Tier *i* has the utility
+``appeal_i − elasticity × gap_i``, where ``gap_i`` is its price relative to
+the competitor's comparable tier (``0.10`` is 10 % dearer). Lowering one
+tier's price therefore also draws buyers from the other tiers. The model is
+calibrated so that today's prices reproduce today's plan mix (``MIX``) and
+conversion (``CONVERSION``), scaled to ``WORKSPACES`` paying workspaces.
+
+``optimize()`` scores every price combination on a 5-cent grid from
+``GRID_SPAN`` of the competitor's price, a few million per search.
+Combinations where a higher tier is not dearer than the one below are
+skipped. The grid is scored in blocks of ``CHUNK`` prices of the first
+tier by broadcasting one array per tier. Attraction and value are computed
+once per price point, so a block costs a few array operations, not one
+model evaluation per combination.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .pricing import PROFIT_REPORT, STRIPE_TS, load_price_book, profit_assumption
+
+MONTHS = 12
+MIX = (0.80, 0.15, 0.05)       # plan mix at today's prices (section 7)
+USERS_PER_WORKSPACE = 12
+CONVERSION = 0.25              # share of evaluating prospects who buy Shiftfy today
+WORKSPACES = 250               # paying workspaces at today's prices
+ELASTICITY = 1.5               # utility lost per 100 % price gap (Basic today: -0.9 own-price)
+ELASTICITIES = (1.0, 1.5, 2.0)  # low, base and high scenarios
+STRIPE_FEE = 0.032             # blended, as in the profit report
+GRID_STEP = 0.05
+GRID_SPAN = (0.4, 1.6)         # of the competitor's price
+CHUNK = 16
+
+
+@dataclass(frozen=True)
+class Outcome:
+    prices: tuple
+    workspaces: tuple          # per tier
+    arr: float
+    margin: float              # ARR after payment fees and seat costs
+
+
+@dataclass(frozen=True)
+class DemandModel:
+    tiers: tuple
+    reference: tuple           # competitor price per user and month, per tier
+    appeal: tuple
+    elasticity: float = ELASTICITY
+    prospects: float = WORKSPACES / CONVERSION
+    users: int = USERS_PER_WORKSPACE
+    seat_cost: float = 0.0     # EUR per user and month
+    fee: float = STRIPE_FEE
+
+    @classmethod
+    def calibrated(cls, tiers, current, reference, mix=MIX, conversion=CONVERSION,
+                   workspaces=WORKSPACES, elasticity=ELASTICITY, **kwargs):
+        """The model that sells *mix* at *conversion* at the *current* prices."""
+        stay = 1 - conversion
+        appeal = tuple(math.log(m * conversion / stay) + elasticity * (c - r) / r
+                       for m, c, r in zip(mix, current, reference))
+        return cls(tuple(tiers), tuple(reference), appeal, elasticity,
+                   workspaces / conversion, **kwargs)
+
+    def attraction(self, tier, prices):
+        """``exp(utility)`` of *tier* at *prices* (scalar or array)."""
+        ref = self.reference[tier]
+        gap = (np.asarray(prices, dtype=float) - ref) / ref
+        return np.exp(self.appeal[tier] - self.elasticity * gap)
+
+    def value(self, prices, objective="arr"):
+        """Yearly value of one workspace at *prices*: revenue or margin."""
+        prices = np.asarray(prices, dtype=float)
+        if objective == "arr":
+            return MONTHS * self.users * prices
+        if objective == "margin":
+            return MONTHS * self.users * (prices * (1 - self.fee) - self.seat_cost)
+        raise ValueError(f"unknown objective {objective!r}")
+
+    def outcome(self, prices):
+        prices = tuple(float(p) for p in prices)
+        weights = np.array([float(self.attraction(i, p)) for i, p in enumerate(prices)])
+        workspaces = self.prospects * weights / (1 + weights.sum())
+        return Outcome(prices, tuple(workspaces.tolist()),
+                       float(workspaces @ self.value(prices, "arr")),
+                       float(workspaces @ self.value(prices, "margin")))
+
+
+@dataclass(frozen=True)
+class Optimum:
+    objective: str
+    outcome: Outcome
+    combinations: int          # price combinations on the grid
+    scored: int                # of which had a rising price ladder
+
+
+def price_grid(reference, span=GRID_SPAN, step=GRID_STEP):
+    """Prices on a *step* grid from ``span[0]`` to ``span[1]`` times *reference*."""
+    low, high = math.ceil(reference * span[0] / step), math.floor(reference * span[1] / step)
+    return np.arange(low, high + 1) * step
+
+
+def _along(values, axis, ndim):
+    shape = [1] * ndim
+    shape[axis] = -1
+    return np.asarray(values).reshape(shape)
+
+
+def optimize(model, objective="arr", span=GRID_SPAN, step=GRID_STEP, chunk=CHUNK):
+    """The best price per tier on the grid for *objective* (``"arr"`` or ``"margin"``)."""
+    n = len(model.tiers)
+    grids = [price_grid(r, span, step) for r in model.reference]
+    weights = [model.attraction(i, g) for i, g in enumerate(grids)]
+    gains = [w * model.value(g, objective) for w, g in zip(weights, grids)]
+    # Everything but the first tier, broadcast once.
+    rest_weight = sum(_along(weights[k], k, n) for k in range(1, n))
+    rest_gain = sum(_along(gains[k], k, n) for k in range(1, n))
+    ladder = np.ones([1] + [len(g) for g in grids[1:]], dtype=bool)
+    for k in range(1, n - 1):
+        ladder = ladder & (_along(grids[k], k, n) < _along(grids[k + 1], k + 1, n))
+
+    best, where, scored = -np.inf, None, 0
+    for start in range(0, len(grids[0]), chunk):
+        block = slice(start, start + chunk)
+        score = (_along(gains[0][block], 0, n) + rest_gain) / (1 + _along(weights[0][block], 0, n) + rest_weight)
+        valid = ladder & (_along(grids[0][block], 0, n) < _along(grids[1], 1, n)) if n > 1 else ladder
+        score = np.where(valid, score, -np.inf)
+        scored += int(np.count_nonzero(valid))
+        i = int(score.argmax())
+        if score.flat[i] > best:
+            best = score.flat[i]
+            where = np.unravel_index(i, score.shape)
+            where = (where[0] + start,) + where[1:]
+    prices = tuple(round(float(g[i]), 2) for g, i in zip(grids, where))
+    return Optimum(objective, model.outcome(prices), math.prod(len(g) for g in grids), scored)
+
+
+def sensitivity(model, prices, objective="arr", moves=np.linspace(-0.5, 0.5, 101)):
+    """``(tier, values)`` per tier: *objective* as that tier's price moves by
+    *moves* (``-0.5`` is half price), the other tiers held at *prices*."""
+    weights = np.array([float(model.attraction(i, p)) for i, p in enumerate(prices)])
+    gains = weights * model.value(prices, objective)
+    out = []
+    for i, tier in enumerate(model.tiers):
+        moved = prices[i] * (1 + moves)
+        w = model.attraction(i, moved)
+        gain = gains.sum() - gains[i] + w * model.value(moved, objective)
+        out.append((tier, model.prospects * gain / (1 + weights.sum() - weights[i] + w)))
+    return out
+
+
+# ── the pricing report's numbers ─────────────────────────────
+@dataclass(frozen=True)
+class PriceStudy:
+    model: DemandModel
+    current: Outcome
+    arr: Optimum
+    margin: Optimum
+    scenarios: list            # (elasticity, ARR optimum) for ELASTICITIES
+    moves: np.ndarray
+    sensitivity: list          # (tier, ARR) around the ARR optimum
+
+
+@lru_cache(maxsize=None)
+def price_study(stripe_ts=STRIPE_TS, profit_report=PROFIT_REPORT):
+    """Shiftfy's monthly tiers against Clockin's comparable tiers."""
+    book = load_price_book(stripe_ts, profit_report)
+    shiftfy, clockin = book.vendor("Shiftfy"), book.vendor("Clockin")
+    econ = profit_assumption("UNIT_ECON", profit_report)
+    # The profit report's cost of goods, per seat.
+    seat_cost = round((1 - econ["gross_margin"]) * econ["blended_arpu_mo"], 2)
+
+    def model(elasticity):
+        return DemandModel.calibrated([o.plan for o in shiftfy], [o.per_user for o in shiftfy],
+                                      [o.per_user for o in clockin[:len(shiftfy)]],
+                                      elasticity=elasticity, seat_cost=seat_cost)
+
+    base = model(ELASTICITY)
+    arr = optimize(base, "arr")
+    moves = np.linspace(-0.5, 0.5, 101)
+    return PriceStudy(base, base.outcome([o.per_user for o in shiftfy]), arr, optimize(base, "margin"),
+                      [(e, arr if e == ELASTICITY else optimize(model(e), "arr")) for e in ELASTICITIES],
+                      moves, sensitivity(base, arr.outcome.prices, "arr", moves))
@@ -0,0 +1,326 @@
+"""
+Pricing engine
+==============
+One price book and one computation behind both Shiftfy-vs-Clockin reports::
+
+    book = load_price_book()
+    basic = book.find("Shiftfy", "Basic")
+    rival = book.bundle(book.find("Clockin", "Digitale Stechuhr"), "Schichtplanung")
+    basic.cost([1, 10, 100])                   # array([ 2.99, 29.9 , inf])
+    crossovers(book.vendor("Shiftfy"), rival)  # [Crossover(users=Fraction(24, 1), …)]
+
+The price book is read from the sources, not copied into the reports:
+
+* Shiftfy plans from ``src/lib/stripe.ts`` (``PLANS``): per-user and base
+  prices in cents for monthly and annual billing, and ``maxEmployees``.
+* Clockin tiers per contract term and its flat add-ons (``CLOCKIN_TIERS``,
+  ``CLOCKIN_ADDONS``, from clockin.de/preise).
+* The other vendors from the ``COMPETITORS`` table of the profit report:
+  their entry price per seat and the team sizes they sell to.
+
+An ``Offer`` costs ``base + per_user × users`` per month and ``inf`` for team
+sizes it is not sold to. Every cost curve is computed for all of
+``TEAM_SIZES`` (1–10,000) at once. ``crossovers()`` finds where the cheaper
+of two sides changes. When the same two offers are in play on both sides of
+the change, the lines cross, and the exact team size is solved from the
+prices in cents as a ``Fraction``. Otherwise a plan limit or a vendor's team
+range forced the switch, and the crossover is that team size.
+
+``comparison()`` runs every number the reports print. It is cached, so the
+English and German reports render the same results.
+"""
+
+import ast
+import math
+import os
+import re
+from dataclasses import dataclass, field, replace
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+from .findings import parse_amount
+from .registry import ROOT_DIR, SCRIPTS_DIR
+
+STRIPE_TS = os.path.join(ROOT_DIR, "src", "lib", "stripe.ts")
+PROFIT_REPORT = os.path.join(SCRIPTS_DIR, "generate_profit_report.py")
+TEAM_SIZES = np.arange(1, 10_001)
+
+ANNUAL = 12     # contract months of Shiftfy's annual billing
+
+# Per user and month, by contract months (clockin.de/preise).
+CLOCKIN_TIERS = (
+    ("Digitale Stechuhr",             {1: 3.99, 12: 3.59, 24: 3.19}),
+    ("Projektzeiterfassung",          {1: 6.99, 12: 6.29, 24: 5.59}),
+    ("Zeiterfassung & Dokumentation", {1: 9.99, 12: 8.99, 24: 7.99}),
+)
+CLOCKIN_ADDONS = (
+    ("Schichtplanung", 24.0),
+    ("Videodokumentation", 79.0),
+    ("Gesprächsnotizen", 49.0),
+    ("Telefonassistent", 99.0),
+)
+
+# Team sizes of the report tables
+TEAM_TABLE = (1, 3, 5, 10, 15, 20, 30, 50, 100)
+FAIR_TABLE = (1, 5, 10, 20, 50, 100)
+MARKET_TABLE = (1, 10, 25, 100, 250, 1000, 10_000)
+
+_PLANS = re.compile(r"export const PLANS[^=]*=\s*\{(.*?)^\};", re.S | re.M)
+_PLAN = re.compile(r"^  (\w+): \{(.*?)^  \},", re.S | re.M)
+_CENTS = re.compile(r"\b(basePriceMonthly|basePriceAnnual|perUserMonthly|perUserAnnual):\s*(\d+)")
+_TEAM_RANGE = re.compile(r"(\d+)\s*(?:[–-]\s*(\d+)|(\+))")
+
+
+class PriceBookError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Offer:
+    vendor: str
+    plan: str
+    per_user: float            # EUR per user and month
+    base: float = 0.0          # flat EUR per month (base fee and add-ons)
+    term: int = 1              # contract months
+    min_users: int = 1
+    max_users: float = math.inf
+    addons: tuple = ()         # names of the add-ons in `base`
+
+    @property
+    def label(self):
+        return " + ".join((f"{self.vendor} {self.plan}",) + self.addons)
+
+    def cost(self, users):
+        """Monthly cost for *users* (scalar or array); ``inf`` where not sold."""
+        users = np.asarray(users, dtype=float)
+        sold = (users >= self.min_users) & (users <= self.max_users)
+        return np.where(sold, self.base + self.per_user * users, np.inf)
+
+
+@dataclass(frozen=True)
+class Crossover:
+    users: Fraction            # team size where the cheaper side changes
+    team_size: int             # first whole team size on the other side
+    below: Offer               # cheapest offer just below
+    above: Offer               # cheapest offer from team_size on
+    kind: str                  # "price", "limit" (plan limit) or "range" (not sold)
+
+
+@dataclass
+class PriceBook:
+    offers: list = field(default_factory=list)
+    addons: dict = field(default_factory=dict)   # vendor -> {name: EUR per month}
+
+    def vendor(self, vendor, term=1):
+        return [o for o in self.offers if o.vendor == vendor and o.term == term]
+
+    def vendors(self):
+        return list(dict.fromkeys(o.vendor for o in self.offers))
+
+    def offers_by_plan(self, vendor):
+        """``{plan: {term: offer}}`` for *vendor*, in price-book order."""
+        plans = {}
+        for offer in self.offers:
+            if offer.vendor == vendor:
+                plans.setdefault(offer.plan, {})[offer.term] = offer
+        return plans
+
+    def find(self, vendor, plan, term=1):
+        for offer in self.vendor(vendor, term):
+            if offer.plan == plan:
+                return offer
+        raise PriceBookError(f"no {vendor} {plan} offer for {term} months")
+
+    def bundle(self, offer, *names):
+        """*offer* with the vendor's flat add-ons *names* added to its base."""
+        prices = self.addons.get(offer.vendor, {})
+        missing = [n for n in names if n not in prices]
+        if missing:
+            raise PriceBookError(f"unknown {offer.vendor} add-ons: {', '.join(missing)}")
+        return replace(offer, base=offer.base + sum(prices[n] for n in names),
+                       addons=offer.addons + tuple(names))
+
+
+# ── loading ──────────────────────────────────────────────────
+def shiftfy_offers(path=STRIPE_TS):
+    """Monthly and annual offers for each plan in ``stripe.ts``."""
+    with open(path, encoding="utf-8") as fh:
+        source = fh.read()
+    block = _PLANS.search(source)
+    if block is None:
+        raise PriceBookError(f"no PLANS in {path}")
+    offers = []
+    for _, body in _PLAN.findall(block.group(1)):
+        name = re.search(r'\bname:\s*"([^"]+)"', body).group(1)
+        cents = dict(_CENTS.findall(body))
+        limit = re.search(r"maxEmployees:\s*(\w+)", body).group(1)
+        max_users = math.inf if limit == "Infinity" else int(limit)
+        for term, suffix in ((1, "Monthly"), (ANNUAL, "Annual")):
+            offers.append(Offer("Shiftfy", name, int(cents["perUser" + suffix]) / 100,
+                                int(cents["basePrice" + suffix]) / 100, term, max_users=max_users))
+    return offers
+
+
+def clockin_offers():
+    return [Offer("Clockin", plan, price, term=term)
+            for plan, prices in CLOCKIN_TIERS for term, price in prices.items()]
+
+
+def profit_assumption(name, path=PROFIT_REPORT):
+    """The literal assigned to *name* at the top level of the profit report."""
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == name for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise PriceBookError(f"no {name} in {path}")
+
+
+def competitor_offers(path=PROFIT_REPORT):
+    """Entry offers from the profit report's ``COMPETITORS`` table (Shiftfy excluded)."""
+    offers = []
+    for name, segment, price, team, _trial in profit_assumption("COMPETITORS", path):
+        if name == "Shiftfy":
+            continue
+        m = _TEAM_RANGE.search(team)
+        low = int(m.group(1)) if m else 1
+        high = int(m.group(2)) if m and m.group(2) else math.inf
+        # The table writes "ab €3.60" with a decimal point.
+        offers.append(Offer(name, segment, parse_amount(price, "en"), min_users=low, max_users=high))
+    return offers
+
+
+@lru_cache(maxsize=None)
+def load_price_book(stripe_ts=STRIPE_TS, profit_report=PROFIT_REPORT):
+    return PriceBook(shiftfy_offers(stripe_ts) + clockin_offers() + competitor_offers(profit_report),
+                     {"Clockin": dict(CLOCKIN_ADDONS)})
+
+
+# ── solving ──────────────────────────────────────────────────
+def _offers(side):
+    return [side] if isinstance(side, Offer) else list(side)
+
+
+def cheapest(offers, sizes=TEAM_SIZES):
+    """``(cost, index)`` of the cheapest of *offers* at every team size."""
+    costs = np.vstack([o.cost(sizes) for o in offers])
+    index = costs.argmin(axis=0)
+    return costs[index, np.arange(costs.shape[1])], index
+
+
+def _cents(value):
+    return int(round(value * 100))
+
+
+def crossovers(a, b, sizes=TEAM_SIZES):
+    """Where the cheaper of *a* and *b* (an offer or a list to pick the
+    cheapest from) changes, in team-size order."""
+    a, b = _offers(a), _offers(b)
+    sizes = np.asarray(sizes)
+    cost_a, index_a = cheapest(a, sizes)
+    cost_b, index_b = cheapest(b, sizes)
+    with np.errstate(invalid="ignore"):
+        sign = np.nan_to_num(np.sign(cost_a - cost_b))     # neither sold: 0
+    decided = np.flatnonzero(sign)
+    turns = np.flatnonzero(sign[decided[:-1]] != sign[decided[1:]])
+    found = []
+    for k, k2 in zip(decided[turns], decided[turns + 1]):
+        below = a[index_a[k]] if sign[k] < 0 else b[index_b[k]]
+        above = a[index_a[k2]] if sign[k2] < 0 else b[index_b[k2]]
+        oa, ob = a[index_a[k]], b[index_b[k]]
+        lines = (index_a[k] == index_a[k2] and index_b[k] == index_b[k2]
+                 and np.isfinite([cost_a[k], cost_b[k], cost_a[k2], cost_b[k2]]).all())
+        if lines:
+            users = Fraction(_cents(ob.base) - _cents(oa.base), _cents(oa.per_user) - _cents(ob.per_user))
+            team = math.floor(users) + 1
+            found.append(Crossover(users, int(sizes[np.searchsorted(sizes, team)]), below, above, "price"))
+        else:
+            finite = np.isfinite([cost_a[k], cost_b[k], cost_a[k2], cost_b[k2]]).all()
+            found.append(Crossover(Fraction(int(sizes[k2])), int(sizes[k2]), below, above,
+                                   "limit" if finite else "range"))
+    return found
+
+
+def saving(ours, theirs):
+    """Fraction saved by *ours* against *theirs* (``0.25`` is 25 % cheaper)."""
+    return 1 - np.asarray(ours, dtype=float) / np.asarray(theirs, dtype=float)
+
+
+# ── the reports' numbers ─────────────────────────────────────
+@dataclass(frozen=True)
+class Rivalry:
+    rival: Offer
+    first: Offer            # the cheaper offer at the smallest team size either sells to
+    crossovers: list        # [Crossover] against the cheapest Shiftfy plan
+
+    def segments(self):
+        """``(first team size, last or None, cheaper offer)`` in team-size order."""
+        out, start, winner = [], int(TEAM_SIZES[0]), self.first
+        for x in self.crossovers:
+            out.append((start, x.team_size - 1, winner))
+            start, winner = x.team_size, x.above
+        out.append((start, None, winner))
+        return out
+
+
+@dataclass(frozen=True)
+class Comparison:
+    book: PriceBook
+    tiers: list             # (Shiftfy offer, Clockin offer, saving), monthly billing
+    team: tuple             # (Shiftfy plans, Shiftfy costs, Clockin Stechuhr costs) at TEAM_TABLE
+    fair: tuple             # (Shiftfy plans, Shiftfy costs, Stechuhr + Schichtplanung) at FAIR_TABLE
+    fair_offer: Offer       # Clockin Stechuhr + Schichtplanung
+    rivals: list            # [Rivalry]; the first is fair_offer
+    market: list            # (vendor, costs at MARKET_TABLE) of each cheapest sold offer
+
+    @property
+    def tier_savings(self):
+        return min(s for _, _, s in self.tiers), max(s for _, _, s in self.tiers)
+
+    @property
+    def fair_savings(self):
+        """Lowest and highest saving in ``fair`` where Shiftfy is cheaper."""
+        s = saving(self.fair[1], self.fair[2])
+        s = s[s > 0]
+        return (float(s.min()), float(s.max())) if s.size else (0.0, 0.0)
+
+    @property
+    def fair_crossover(self):
+        """The first team size where ``fair_offer`` beats Shiftfy, or None."""
+        rivalry = self.rivals[0]
+        return next((x for x in rivalry.crossovers if x.above is rivalry.rival), None)
+
+
+def _at(values, sizes):
+    return values[np.asarray(sizes) - TEAM_SIZES[0]]
+
+
+@lru_cache(maxsize=None)
+def comparison(stripe_ts=STRIPE_TS, profit_report=PROFIT_REPORT):
+    book = load_price_book(stripe_ts, profit_report)
+    shiftfy = book.vendor("Shiftfy")
+    clockin = book.vendor("Clockin")
+    tiers = [(s, c, float(saving(s.per_user, c.per_user))) for s, c in zip(shiftfy, clockin)]
+
+    # Each team size on the cheapest Shiftfy plan it may use (plan limits apply).
+    cost, index = cheapest(shiftfy)
+    plans = np.array([o.plan for o in shiftfy], dtype=object)[index]
+    stechuhr = clockin[0]
+    fair_offer = book.bundle(stechuhr, "Schichtplanung")
+    team = (_at(plans, TEAM_TABLE), _at(cost, TEAM_TABLE), _at(stechuhr.cost(TEAM_SIZES), TEAM_TABLE))
+    fair = (_at(plans, FAIR_TABLE), _at(cost, FAIR_TABLE), _at(fair_offer.cost(TEAM_SIZES), FAIR_TABLE))
+
+    rivals = []
+    for rival in [fair_offer, stechuhr] + [o for o in book.offers if o.vendor not in ("Shiftfy", "Clockin")]:
+        theirs = rival.cost(TEAM_SIZES)
+        k = int(np.argmax(np.isfinite(cost) | np.isfinite(theirs)))
+        first = shiftfy[index[k]] if cost[k] <= theirs[k] else rival
+        rivals.append(Rivalry(rival, first, crossovers(shiftfy, rival)))
+
+    market = []
+    for vendor in book.vendors():
+        offers = [fair_offer] if vendor == "Clockin" else book.vendor(vendor)
+        market.append((vendor, _at(cheapest(offers)[0], MARKET_TABLE)))
+    return Comparison(book, tiers, team, fair, fair_offer, rivals, market)
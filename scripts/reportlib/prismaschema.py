@@ -0,0 +1,464 @@
+"""
+Prisma schema parser
+====================
+Reads ``prisma/schema.prisma`` into a small tree so reports can list models,
+relations and indexes from the schema itself::
+
+    schema = load_schema()
+    schema.by_section()            # {"Core": ("User", …), "STRIPE BILLING …": (…), …}
+    schema.model("Shift").foreign_keys
+    schema.cascade_from("Workspace")
+
+Parsing is one pass of a regex tokenizer over the file. Blocks (``model``,
+``enum``, …) are read line by line: a line holds a field or a block attribute
+(``@@index``, ``@@unique``, ``@@id``). Field-level ``@id`` and ``@unique``
+become ``Index`` entries too, so every key of a model is in one list.
+
+Sections come from the banner comments that divide the schema::
+
+    // ═════════════════
+    // STRIPE BILLING & SUBSCRIPTIONS — optional description
+    // ═════════════════
+
+Models above the first banner belong to ``"Core"``. ``///`` doc comments are
+attached to the model, enum or field that follows them.
+
+The parsed ``Schema`` is cached by the SHA-256 of the file, in memory and in
+``reports/.prisma-cache.pickle``. Unchanged schemas are not re-parsed, either
+across builds or between the reports of one build. The cache file starts
+with the SHA-256 of this module, which defines both the parser and the tree
+classes; after any edit to it the file is discarded before its trees are
+unpickled.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from .registry import REPORTS_DIR, ROOT_DIR
+
+SCHEMA_PATH = os.path.join(ROOT_DIR, "prisma", "schema.prisma")
+CACHE_PATH = os.path.join(REPORTS_DIR, ".prisma-cache.pickle")
+CACHE_ENTRIES = 8
+DEFAULT_SECTION = "Core"
+
+_TOKEN = re.compile(r"""
+    (?P<doc>///[^\n]*)
+  | (?P<comment>//[^\n]*)
+  | (?P<nl>\n)
+  | (?P<ws>[ \t\r]+)
+  | (?P<string>"(?:[^"\\\n]|\\.)*")
+  | (?P<attr>@@?[A-Za-z_][\w.]*)
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_]\w*)
+  | (?P<punct>[{}()\[\],:=?!])
+  | (?P<other>.)
+""", re.X)
+_RULE = re.compile(r"^//\s*[═=─-]{8,}\s*$")
+
+
+class SchemaError(ValueError):
+    pass
+
+
+# ── tree ─────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class Call:
+    """A function-style argument value: ``now()``, ``createdAt(sort: Desc)``."""
+
+    name: str
+    args: tuple = ()
+    kwargs: tuple = ()   # ((name, value), …)
+
+
+@dataclass(frozen=True)
+class Attribute:
+    """``@default(now())``, ``@@index([a, b], name: "x")``."""
+
+    name: str            # without the leading @ / @@
+    args: tuple = ()
+    kwargs: tuple = ()
+
+    def kwarg(self, name, default=None):
+        return dict(self.kwargs).get(name, default)
+
+
+@dataclass(frozen=True)
+class Relation:
+    name: str = None
+    fields: tuple = ()
+    references: tuple = ()
+    on_delete: str = None
+    on_update: str = None
+
+
+@dataclass(frozen=True)
+class Field:
+    name: str
+    type: str
+    optional: bool = False
+    list: bool = False
+    attributes: tuple = ()
+    doc: str = ""
+    line: int = 0
+
+    def attribute(self, name):
+        return next((a for a in self.attributes if a.name == name), None)
+
+    @property
+    def relation(self):
+        """The ``@relation`` of this field, or None."""
+        attr = self.attribute("relation")
+        if attr is None:
+            return None
+        return Relation(
+            name=attr.args[0] if attr.args else attr.kwarg("name"),
+            fields=tuple(_names(attr.kwarg("fields", ()))),
+            references=tuple(_names(attr.kwarg("references", ()))),
+            on_delete=attr.kwarg("onDelete"),
+            on_update=attr.kwarg("onUpdate"),
+        )
+
+
+@dataclass(frozen=True)
+class Index:
+    kind: str            # "id", "unique", "index" or "fulltext"
+    fields: tuple
+    name: str = None
+
+
+@dataclass(frozen=True)
+class Model:
+    name: str
+    fields: tuple
+    indexes: tuple
+    section: str = DEFAULT_SECTION
+    doc: str = ""
+    line: int = 0
+    kind: str = "model"  # or "view" / "type"
+
+    def field(self, name):
+        return next((f for f in self.fields if f.name == name), None)
+
+    @property
+    def foreign_keys(self):
+        """Relation fields on the owning side (those with ``fields: […]``)."""
+        return tuple(f for f in self.fields if f.relation and f.relation.fields)
+
+
+@dataclass(frozen=True)
+class Enum:
+    name: str
+    values: tuple
+    section: str = DEFAULT_SECTION
+    doc: str = ""
+    line: int = 0
+
+
+@dataclass(frozen=True)
+class Schema:
+    models: tuple
+    enums: tuple
+    lines: int
+    sha256: str = ""
+    _by_name: dict = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_by_name", {m.name: m for m in self.models})
+
+    def model(self, name):
+        return self._by_name[name]
+
+    def relations(self, model):
+        """Fields of *model* whose type is another model."""
+        return tuple(f for f in model.fields if f.type in self._by_name)
+
+    def by_section(self):
+        """``{section: (model names…)}`` in schema order."""
+        out = {}
+        for model in self.models:
+            out.setdefault(model.section, []).append(model.name)
+        return {section: tuple(names) for section, names in out.items()}
+
+    def cascade_from(self, root):
+        """Models deleted, directly or transitively, when a *root* row is deleted."""
+        deleted, changed = {root}, True
+        while changed:
+            changed = False
+            for model in self.models:
+                if model.name in deleted:
+                    continue
+                for fk in model.foreign_keys:
+                    if fk.type in deleted and fk.relation.on_delete == "Cascade":
+                        deleted.add(model.name)
+                        changed = True
+                        break
+        deleted.discard(root)
+        return deleted
+
+
+def _names(values):
+    for value in values:
+        yield value.name if isinstance(value, Call) else value
+
+
+# ── parsing ──────────────────────────────────────────────────
+def tokenize(text):
+    """``(kind, value, line)`` tokens; whitespace is dropped."""
+    line = 1
+    for m in _TOKEN.finditer(text):
+        kind = m.lastgroup
+        if kind == "nl":
+            yield kind, "\n", line
+            line += 1
+        elif kind != "ws":
+            yield kind, m.group(), line
+
+
+class _Parser:
+    def __init__(self, text):
+        self.tokens = list(tokenize(text))
+        self.pos = 0
+        self.section = DEFAULT_SECTION
+        self._banner = self._titled = False
+        self._doc = []
+
+    # token access
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else ("eof", "", 0)
+
+    def next(self):
+        tok = self.peek()
+        self.pos += 1
+        return tok
+
+    def expect(self, value):
+        kind, got, line = self.next()
+        if got != value:
+            raise SchemaError(f"line {line}: expected {value!r}, got {got!r}")
+
+    def skip_comments(self, newlines=True):
+        """Consume comments (tracking banners and doc text) and blank lines."""
+        while True:
+            kind, value, _ = self.peek()
+            if kind == "comment":
+                self._comment(value)
+            elif kind == "doc":
+                self._doc.append(value[3:].strip())
+            elif not (newlines and kind == "nl"):
+                return
+            self.pos += 1
+
+    def _comment(self, text):
+        if _RULE.match(text):
+            self._banner = not self._banner
+            self._titled = False
+        elif self._banner and not self._titled:
+            title = re.split(r"\s+[—–-]\s+", text[2:].strip(), 1)[0]
+            if title.count("(") > title.count(")"):   # "E-SIGNATURE (SES — …)"
+                title = title.rsplit("(", 1)[0].strip()
+            self.section = title or self.section
+            self._titled = True
+
+    def take_doc(self):
+        doc, self._doc = " ".join(self._doc), []
+        return doc
+
+    # values
+    def value(self):
+        kind, tok, line = self.next()
+        if tok == "[":
+            items = []
+            while self.peek()[1] != "]":
+                items.append(self.value())
+                if self.peek()[1] == ",":
+                    self.next()
+            self.next()
+            return tuple(items)
+        if kind == "string":
+            return tok[1:-1]
+        if kind == "number":
+            return float(tok) if "." in tok else int(tok)
+        if kind == "ident":
+            if self.peek()[1] == "(":
+                args, kwargs = self.arguments()
+                return Call(tok, args, kwargs)
+            return tok
+        raise SchemaError(f"line {line}: unexpected {tok!r}")
+
+    def arguments(self):
+        args, kwargs = [], []
+        self.expect("(")
+        while self.peek()[1] != ")":
+            if self.peek()[0] == "ident" and self.tokens[self.pos + 1][1] == ":":
+                name = self.next()[1]
+                self.next()
+                kwargs.append((name, self.value()))
+            else:
+                args.append(self.value())
+            if self.peek()[1] == ",":
+                self.next()
+        self.next()
+        return tuple(args), tuple(kwargs)
+
+    def attribute(self):
+        name = self.next()[1].lstrip("@")
+        if self.peek()[1] == "(":
+            args, kwargs = self.arguments()
+            return Attribute(name, args, kwargs)
+        return Attribute(name)
+
+    # blocks
+    def parse(self):
+        models, enums = [], []
+        while True:
+            self.skip_comments()
+            kind, keyword, line = self.next()
+            if kind == "eof":
+                return models, enums
+            name = self.next()[1]
+            doc = self.take_doc()
+            if keyword in ("model", "view", "type"):
+                models.append(self.model(keyword, name, doc, line))
+            elif keyword == "enum":
+                enums.append(self.enum(name, doc, line))
+            elif kind == "ident":
+                self.skip_block()
+            else:
+                raise SchemaError(f"line {line}: unexpected {keyword!r}")
+
+    def skip_block(self):
+        self.expect("{")
+        depth = 1
+        while depth:
+            kind, tok, line = self.next()
+            if kind == "eof":
+                raise SchemaError("unterminated block")
+            depth += {"{": 1, "}": -1}.get(tok, 0) if kind == "punct" else 0
+
+    def model(self, keyword, name, doc, line):
+        fields, indexes = [], []
+        self.expect("{")
+        while True:
+            self.skip_comments()
+            kind, tok, fline = self.peek()
+            if tok == "}":
+                self.next()
+                break
+            if kind == "attr":
+                self.take_doc()
+                attr = self.attribute()
+                if attr.name in ("id", "unique", "index", "fulltext"):
+                    indexes.append(Index(attr.name, tuple(_names(attr.args[0] if attr.args else
+                                                                 attr.kwarg("fields", ()))),
+                                         attr.kwarg("name") or attr.kwarg("map")))
+            else:
+                fields.append(self.field())
+            self.skip_comments(newlines=False)
+        for f in fields:
+            for attr in f.attributes:
+                if attr.name in ("id", "unique"):
+                    indexes.append(Index(attr.name, (f.name,), attr.kwarg("map")))
+        return Model(name, tuple(fields), tuple(indexes), self.section, doc, line, keyword)
+
+    def field(self):
+        doc = self.take_doc()
+        kind, name, line = self.next()
+        ftype = self.next()[1]
+        if self.peek()[1] == "(":     # Unsupported("…")
+            args, _ = self.arguments()
+            ftype = f'{ftype}("{args[0]}")' if args else ftype
+        optional = is_list = False
+        if self.peek()[1] == "?":
+            self.next()
+            optional = True
+        elif self.peek()[1] == "[":
+            self.next()
+            self.expect("]")
+            is_list = True
+        attrs = []
+        while self.peek()[0] == "attr":
+            attrs.append(self.attribute())
+        return Field(name, ftype, optional, is_list, tuple(attrs), doc, line)
+
+    def enum(self, name, doc, line):
+        values = []
+        self.expect("{")
+        while True:
+            self.skip_comments()
+            kind, tok, _ = self.next()
+            if tok == "}":
+                break
+            if kind == "attr":
+                self.pos -= 1
+                self.attribute()
+            else:
+                self.take_doc()
+                values.append(tok)
+                while self.peek()[0] == "attr":
+                    self.attribute()
+        return Enum(name, tuple(values), self.section, doc, line)
+
+
+def parse_schema(text, sha256=""):
+    """Parse schema *text* into a ``Schema``."""
+    models, enums = _Parser(text).parse()
+    lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+    return Schema(tuple(models), tuple(enums), lines, sha256)
+
+
+# ── caching ──────────────────────────────────────────────────
+_memory = {}
+
+
+@lru_cache(maxsize=None)
+def _module_digest():
+    """SHA-256 of this file: the parser and the classes of the cached tree."""
+    with open(__file__, "rb") as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+
+def _load_cache(path):
+    try:
+        with open(path, "rb") as fh:
+            if pickle.load(fh) != _module_digest():
+                return {}
+            return pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return {}
+
+
+def _save_cache(path, schemas):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            pickle.dump(_module_digest(), fh)
+            pickle.dump(schemas, fh)
+        os.replace(tmp, path)
+    except OSError:
+        pass   # read-only checkout: parse every time
+
+
+def load_schema(path=SCHEMA_PATH, cache_path=CACHE_PATH):
+    """The parsed schema at *path*, re-parsed only when its content changed."""
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    schema = _memory.get(digest)
+    if schema is not None:
+        return schema
+    stored = _load_cache(cache_path) if cache_path else {}
+    schema = stored.get(digest)
+    if schema is None:
+        schema = parse_schema(raw.decode("utf-8"), digest)
+        if cache_path:
+            stored[digest] = schema
+            while len(stored) > CACHE_ENTRIES:
+                stored.pop(next(iter(stored)))
+            _save_cache(cache_path, stored)
+    _memory[digest] = schema
+    return schema
@@ -0,0 +1,238 @@
+"""
+Render profiling
+================
+Answers "which section of this report is slow?". Enabled by setting
+``REPORTS_PROFILE`` (``1`` writes to ``reports/profile/``, any other value
+is used as the output directory); when unset every hook is a no-op.
+
+A generator wires it in with two changes::
+
+    prof = RenderProfiler("dsgvo-de", levels=("H1", "H2"))
+    story = prof.story()                     # instead of story = []
+    ...
+    prof.build(doc, story, onFirstPage=...)  # instead of doc.build(story, ...)
+
+* Story construction: ``prof.story()`` returns a list that timestamps every
+  append, so the time spent computing a flowable is charged to it. Streamed
+  stories (``reportlib/streaming.py``) are passed to ``prof.build()`` as
+  they are; the time each flowable takes to be yielded is charged instead.
+* Section tagging: flowables are tagged with the section they belong to.
+  A section starts at each Paragraph whose style name is listed in
+  *levels* (outermost first); everything before the first heading is
+  ``cover``. Pieces produced by ``split()`` inherit the tag.
+* Layout: ``wrap``, ``split`` and ``drawOn`` of every story flowable are
+  timed, exclusive of nested instrumented calls, and aggregated by
+  (section path, flowable type, phase).
+
+Each build writes ``<label>.json`` (per-section totals with a breakdown by
+flowable type) and ``<label>.folded`` — one ``frame;frame;... microseconds``
+line per stack, the input format of flamegraph.pl and speedscope.
+"""
+
+import json
+import os
+import time
+from collections import defaultdict
+from itertools import count
+
+from reportlab.platypus import Paragraph
+
+from .registry import REPORTS_DIR
+from .streaming import StreamingStory
+
+PHASES = ("construct", "wrap", "split", "draw")
+
+
+def profile_dir():
+    """Output directory, or None when profiling is disabled."""
+    value = os.environ.get("REPORTS_PROFILE")
+    if not value:
+        return None
+    return os.path.join(REPORTS_DIR, "profile") if value == "1" else value
+
+
+class TimedStory(list):
+    """A story list that records how long each appended flowable took to make."""
+
+    def __init__(self):
+        super().__init__()
+        self.costs = []
+        self._last = time.perf_counter()
+
+    def _charge(self, n):
+        now = time.perf_counter()
+        if n:
+            self.costs.append(now - self._last)
+            self.costs.extend([0.0] * (n - 1))
+        self._last = now
+
+    def append(self, item):
+        super().append(item)
+        self._charge(1)
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self._charge(len(items))
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.costs.insert(index, 0.0)
+
+
+class RenderProfiler:
+    """Per-section timing of one document build (see module docstring)."""
+
+    def __init__(self, label, levels=()):
+        self.label = label
+        self.levels = tuple(levels)
+        self.out_dir = profile_dir()
+        self.enabled = self.out_dir is not None
+        self.stats = defaultdict(lambda: [0, 0.0])   # (path, type, phase) -> [calls, seconds]
+        self._stack = []
+        self._streamed_s = 0.0   # construction time spent inside doc.build()
+
+    # ── story ─────────────────────────────────────────────────
+    def story(self):
+        return TimedStory() if self.enabled else []
+
+    def _heading_level(self, flowable):
+        if isinstance(flowable, Paragraph):
+            name = getattr(flowable.style, "name", None)
+            if name in self.levels:
+                return self.levels.index(name)
+        return None
+
+    def _heading_text(self, flowable):
+        text = " ".join(frag.text for frag in getattr(flowable, "frags", ()) if hasattr(frag, "text"))
+        return " ".join(text.split())[:60] or "(untitled)"
+
+    def instrument(self, story):
+        """Yield the flowables of *story* tagged and wrapped for timing.
+
+        *story* may be a list (a ``TimedStory`` supplies construction
+        times) or any iterable — for generators the time spent in ``next()``
+        is the construction time.
+        """
+        costs = getattr(story, "costs", None)
+        source = iter(story.drain() if isinstance(story, StreamingStory) else story)
+        path = ("cover",)
+        for i in count():
+            start = time.perf_counter()
+            try:
+                flowable = next(source)
+            except StopIteration:
+                return
+            if costs is None:
+                cost = time.perf_counter() - start
+                self._streamed_s += cost
+            else:
+                cost = costs[i] if i < len(costs) else 0.0
+            level = self._heading_level(flowable)
+            if level is not None:
+                path = path[:level] if path != ("cover",) else ()
+                path = path + ("",) * (level - len(path)) + (self._heading_text(flowable),)
+            self._wrap(flowable, path)
+            self._add(path, type(flowable).__name__, "construct", cost)
+            yield flowable
+
+    # ── timing ────────────────────────────────────────────────
+    def _add(self, path, kind, phase, seconds):
+        entry = self.stats[(path, kind, phase)]
+        entry[0] += 1
+        entry[1] += seconds
+
+    def _timed(self, flowable, path, phase, fn):
+        kind = type(flowable).__name__
+
+        def timed(*args, **kwargs):
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += elapsed
+                self._add(path, kind, phase, elapsed - nested)
+            if phase == "split":
+                for part in result:
+                    self._wrap(part, path)
+            return result
+
+        return timed
+
+    def _wrap(self, flowable, path):
+        # Written to __dict__ directly: Drawing validates setattr.
+        attrs = getattr(flowable, "__dict__", None)
+        if attrs is None or attrs.get("_profiled"):
+            return
+        attrs["_profiled"] = True
+        for phase, name in (("wrap", "wrap"), ("split", "split"), ("draw", "drawOn")):
+            attrs[name] = self._timed(flowable, path, phase, getattr(flowable, name))
+
+    # ── build + report ────────────────────────────────────────
+    def build(self, doc, story, **kwargs):
+        """``doc.build(story, **kwargs)``, profiled when enabled."""
+        if not self.enabled:
+            return doc.build(story, **kwargs)
+        start = time.perf_counter()
+        result = doc.build(StreamingStory(self.instrument(story)), **kwargs)
+        self.write(time.perf_counter() - start)
+        return result
+
+    def summary(self, build_s):
+        sections = {}
+        for (path, kind, phase), (calls, seconds) in self.stats.items():
+            sec = sections.setdefault(path, {
+                "section": " › ".join(p for p in path if p),
+                **{f"{p}_s": 0.0 for p in PHASES},
+                "by_type": {},
+            })
+            sec[f"{phase}_s"] += seconds
+            sec["by_type"].setdefault(kind, {})[phase] = {
+                "calls": calls, "s": round(seconds, 6),
+            }
+        rows = []
+        for sec in sections.values():
+            for p in PHASES:
+                sec[f"{p}_s"] = round(sec[f"{p}_s"], 6)
+            sec["layout_s"] = round(sec["wrap_s"] + sec["split_s"] + sec["draw_s"], 6)
+            rows.append(sec)
+        rows.sort(key=lambda s: s["layout_s"] + s["construct_s"], reverse=True)
+        layout = sum(s["layout_s"] for s in rows)
+        return {
+            "label": self.label,
+            "build_s": round(build_s, 6),
+            "layout_s": round(layout, 6),
+            "streamed_construct_s": round(self._streamed_s, 6),
+            # Page templates, canvas save and the PDF writer.
+            "other_s": round(build_s - layout - self._streamed_s, 6),
+            "sections": rows,
+        }
+
+    def folded(self, build_s):
+        lines = []
+        for (path, kind, phase), (_, seconds) in sorted(self.stats.items()):
+            frames = [self.label] + [p or "(untitled)" for p in path] + [kind, phase]
+            us = int(seconds * 1e6)
+            if us:
+                lines.append(";".join(f.replace(";", ",") for f in frames) + f" {us}")
+        layout = sum(s for (_, _, phase), (_, s) in self.stats.items() if phase != "construct")
+        other = int((build_s - layout - self._streamed_s) * 1e6)
+        if other > 0:
+            lines.append(f"{self.label};(pdf output) {other}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, build_s):
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, self.label)
+        with open(base + ".json", "w", encoding="utf-8") as fh:
+            json.dump(self.summary(build_s), fh, indent=2, ensure_ascii=False)
+        with open(base + ".folded", "w", encoding="utf-8") as fh:
+            fh.write(self.folded(build_s))
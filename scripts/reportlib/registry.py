@@ -0,0 +1,121 @@
+"""
+Report registry
+===============
+The one list of generators that the build driver, the benchmark and the
+watcher work from. Paths are relative to the repository root.
+"""
+
+import glob
+import os
+from dataclasses import dataclass, field
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+REPORTS_DIR = os.path.join(ROOT_DIR, "reports")
+LIB_DIR = os.path.join(SCRIPTS_DIR, "reportlib")
+FONTS_DIR = os.path.join(SCRIPTS_DIR, "fonts")
+
+
+@dataclass(frozen=True)
+class ReportSpec:
+    """A generator script and what it reads and writes.
+
+    ``outputs`` are glob patterns because some reports put the build date in
+    the file name. ``inputs`` lists data files (globs) the generator reads
+    besides its own source, the shared library and — if ``fonts`` — the
+    bundled TTF fonts. ``input_dirs`` are ``(environment variable, suffixes)``
+    pairs: the files with those suffixes in the directory the variable names,
+    hashed by name, size and mtime because they can be large. ``git_head``
+    adds the checked-out commit, for reports that print git history.
+    """
+
+    name: str
+    script: str
+    outputs: tuple
+    langs: tuple = ("en", "de")
+    fonts: bool = False
+    inputs: tuple = field(default_factory=tuple)
+    input_dirs: tuple = field(default_factory=tuple)
+    git_head: bool = False
+
+    @property
+    def script_path(self):
+        return os.path.join(ROOT_DIR, self.script)
+
+    def find_outputs(self, since_ns=0):
+        """Files matching ``outputs`` that were written after *since_ns*."""
+        found = []
+        for pattern in self.outputs:
+            for path in glob.glob(os.path.join(ROOT_DIR, pattern)):
+                if os.stat(path).st_mtime_ns >= since_ns:
+                    found.append(path)
+        return sorted(found)
+
+
+REPORTS = (
+    ReportSpec(
+        "status",
+        "scripts/generate_status_report.py",
+        ("reports/Shiftfy_Status_Report_*.pdf", "reports/Shiftfy_Index_Coverage_*.json"),
+        # Scanned for the live codebase metrics (reportlib/repometrics.py).
+        inputs=("src/**/*.ts", "src/**/*.tsx", "prisma/**/*.prisma", "e2e/**/*.ts"),
+        git_head=True,   # the commit count
+    ),
+    ReportSpec(
+        "dsgvo",
+        "scripts/generate_dsgvo_report.py",
+        ("reports/Shiftfy_DSGVO_Compliance_*.pdf",),
+        fonts=True,
+        inputs=("prisma/schema.prisma",),
+        # Table exports for the retention dry run (reportlib/retention.py).
+        input_dirs=(("REPORTS_RETENTION_DUMPS", (".parquet", ".csv", ".csv.gz")),),
+    ),
+    ReportSpec(
+        "ticketify",
+        "scripts/generate_ticketify_audit.py",
+        ("reports/ticketify_audit_*.pdf",),
+        fonts=True,
+    ),
+    ReportSpec(
+        "pricing-en",
+        "scripts/generate_pricing_comparison.py",
+        ("reports/shiftfy-vs-clockin-pricing-report.pdf",),
+        langs=("en",),
+        # The price book (reportlib/pricing.py).
+        inputs=("src/lib/stripe.ts", "scripts/generate_profit_report.py"),
+    ),
+    ReportSpec(
+        "pricing-de",
+        "scripts/generate_pricing_comparison_de.py",
+        ("reports/shiftfy-vs-clockin-preisvergleich.pdf",),
+        langs=("de",),
+        inputs=("src/lib/stripe.ts", "scripts/generate_profit_report.py"),
+    ),
+    ReportSpec(
+        "profit-de",
+        "scripts/generate_profit_report.py",
+        ("reports/shiftfy_profit_projections_2025_2028.pdf",),
+        langs=("de",),
+    ),
+    ReportSpec(
+        "profit-en",
+        "scripts/generate_profit_report_en.py",
+        ("reports/shiftfy_profit_projections_2025_2028_EN.pdf",),
+        langs=("en",),
+    ),
+)
+
+BY_NAME = {spec.name: spec for spec in REPORTS}
+
+
+def select(names=None):
+    """Return the specs for *names* (all reports when empty)."""
+    if not names:
+        return list(REPORTS)
+    unknown = [n for n in names if n not in BY_NAME]
+    if unknown:
+        raise SystemExit(
+            f"unknown report(s): {', '.join(unknown)} "
+            f"(choose from {', '.join(BY_NAME)})"
+        )
+    return [BY_NAME[n] for n in names]
@@ -0,0 +1,239 @@
+"""
+Repository metrics
+==================
+Live codebase numbers for the status report, instead of figures typed into
+``DATA`` that go stale with the next commit::
+
+    metrics = collect_metrics()
+    metrics.fields()   # {"total_commits": 412, "total_ts_files": 813, …}
+
+* Walking: ``src/``, ``prisma/`` and ``e2e/`` are scanned by a thread pool,
+  one ``os.scandir()`` task per directory. Subdirectories are submitted as
+  they are found, so deep and wide trees are spread over the workers.
+  ``node_modules`` and dot-directories are skipped.
+* Caching: what a file contributes (lines, Prisma models, test cases) is
+  stored in ``reports/.metrics-cache.json`` under its ``(mtime, size)``. A
+  re-run stats every file but reads only the files that changed. The cache
+  also stays in memory, so watch-mode rebuilds do not reload it.
+* Git: ``git rev-list --count HEAD`` runs alongside the walk.
+
+A metric whose source is missing (no ``src/`` or no git checkout) is left
+out of ``fields()``, and the report keeps its static value for it.
+"""
+
+import json
+import os
+import re
+import subprocess
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from .registry import REPORTS_DIR, ROOT_DIR
+
+CACHE_PATH = os.path.join(REPORTS_DIR, ".metrics-cache.json")
+CACHE_VERSION = 1
+
+SCANNED_DIRS = ("src", "prisma", "e2e")
+SKIPPED_DIRS = {"node_modules"}
+TS_SUFFIXES = (".ts", ".tsx")
+TEST_SUFFIXES = tuple(f".{kind}{ext}" for kind in ("test", "spec") for ext in TS_SUFFIXES)
+
+_MODEL = re.compile(r"^model\s+\w+\s*\{", re.M)
+# it(…), test(…), it.only(…), test.skip(…), it.each([...])(…) — not test.describe(…)
+_TEST_CASE = re.compile(r"^\s*(?:it|test)(?:\.(?:only|skip|todo|concurrent|each\b[^\n]*?\)))?\s*\(", re.M)
+
+
+@dataclass
+class RepoMetrics:
+    """Counts over the scanned tree (see ``fields()`` for the report keys)."""
+
+    ts_files: int = 0
+    ts_lines: int = 0
+    api_routes: int = 0
+    ui_pages: int = 0
+    lib_modules: int = 0
+    prisma_models: int = 0
+    schema_lines: int = 0
+    test_files: int = 0
+    test_count: int = 0
+    commits: int = None
+    found: set = field(default_factory=set)   # scanned dirs that exist
+    files_read: int = 0                       # files re-read (not served from cache)
+
+    def fields(self):
+        """Values keyed like the status report's ``DATA``."""
+        out = {}
+        if "src" in self.found:
+            out.update(
+                total_ts_files=self.ts_files, total_loc=self.ts_lines,
+                api_routes=self.api_routes, ui_pages=self.ui_pages,
+                lib_modules=self.lib_modules,
+            )
+        if "prisma" in self.found:
+            out.update(prisma_models=self.prisma_models, schema_lines=self.schema_lines)
+        if "src" in self.found or "e2e" in self.found:
+            out.update(test_files=self.test_files, test_count=self.test_count)
+        if self.commits is not None:
+            out["total_commits"] = self.commits
+        return out
+
+
+# ── walking ──────────────────────────────────────────────────
+def _scan(path):
+    """``([(path, mtime_ns, size)], [subdirectories])`` of one directory."""
+    files, dirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRS and not entry.name.startswith("."):
+                        dirs.append(entry.path)
+                elif entry.is_file():
+                    st = entry.stat()
+                    files.append((entry.path, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return files, dirs
+
+
+def walk(roots, pool):
+    """All files below *roots*, scanned in parallel on *pool*."""
+    found = []
+    pending = {pool.submit(_scan, root) for root in roots}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            files, dirs = future.result()
+            found.extend(files)
+            pending.update(pool.submit(_scan, d) for d in dirs)
+    return found
+
+
+def _git_commits(root):
+    try:
+        out = subprocess.run(
+            ["git", "rev-list", "--count", "HEAD"],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        return int(out)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+# ── per-file facts ───────────────────────────────────────────
+def _relevant(rel):
+    return rel.endswith(TS_SUFFIXES) or rel.endswith(".prisma")
+
+
+def file_facts(path):
+    """``{"lines": …, "models": …, "tests": …}`` for one source file."""
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        text = fh.read()
+    facts = {"lines": text.count("\n") + (1 if text and not text.endswith("\n") else 0)}
+    if path.endswith(".prisma"):
+        facts["models"] = len(_MODEL.findall(text))
+    elif path.endswith(TEST_SUFFIXES):
+        facts["tests"] = len(_TEST_CASE.findall(text))
+    return facts
+
+
+class _Cache:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION:
+            self.entries = data.get("files", {})
+
+    def get(self, rel, mtime_ns, size):
+        cached = self.entries.get(rel)
+        if cached and cached[0] == mtime_ns and cached[1] == size:
+            return cached[2]
+        return None
+
+    def put(self, rel, mtime_ns, size, facts):
+        self.entries[rel] = [mtime_ns, size, facts]
+        self.dirty = True
+
+    def prune(self, live):
+        stale = self.entries.keys() - live
+        for rel in stale:
+            del self.entries[rel]
+        self.dirty |= bool(stale)
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"version": CACHE_VERSION, "files": self.entries}, fh, sort_keys=True)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass   # a read-only checkout still gets its numbers, just uncached
+
+
+_caches = {}
+
+
+# ── collecting ───────────────────────────────────────────────
+def _tally(metrics, rel, facts):
+    parts = rel.split("/")
+    name = parts[-1]
+    if rel.endswith(".prisma"):
+        metrics.prisma_models += facts.get("models", 0)
+        metrics.schema_lines += facts["lines"]
+        return
+    if name.endswith(TEST_SUFFIXES):
+        metrics.test_files += 1
+        metrics.test_count += facts.get("tests", 0)
+    if parts[0] != "src":
+        return
+    metrics.ts_files += 1
+    metrics.ts_lines += facts["lines"]
+    if parts[1:3] == ["app", "api"] and name.startswith("route."):
+        metrics.api_routes += 1
+    elif parts[1] == "app" and name == "page.tsx":
+        metrics.ui_pages += 1
+    elif parts[1] == "lib" and not name.endswith(TEST_SUFFIXES) and not name.endswith(".d.ts"):
+        metrics.lib_modules += 1
+
+
+def collect_metrics(root=ROOT_DIR, cache_path=CACHE_PATH, jobs=None):
+    """Scan *root* and return its ``RepoMetrics`` (see module docstring)."""
+    cache = _caches.get(cache_path)
+    if cache is None:
+        cache = _caches[cache_path] = _Cache(cache_path)
+    metrics = RepoMetrics()
+    roots = []
+    for name in SCANNED_DIRS:
+        path = os.path.join(root, name)
+        if os.path.isdir(path):
+            metrics.found.add(name)
+            roots.append(path)
+
+    with ThreadPoolExecutor(jobs) as pool:
+        commits = pool.submit(_git_commits, root)
+        files = []
+        for path, mtime_ns, size in walk(roots, pool):
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            if _relevant(rel):
+                files.append((rel, path, mtime_ns, size))
+        stale = [f for f in files if cache.get(f[0], f[2], f[3]) is None]
+        for (rel, _, mtime_ns, size), facts in zip(stale, pool.map(file_facts, [f[1] for f in stale])):
+            cache.put(rel, mtime_ns, size, facts)
+        metrics.commits = commits.result()
+
+    for rel, _, mtime_ns, size in sorted(files):
+        _tally(metrics, rel, cache.get(rel, mtime_ns, size))
+    metrics.files_read = len(stale)
+    cache.prune({f[0] for f in files})
+    cache.save()
+    return metrics
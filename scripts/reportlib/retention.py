@@ -0,0 +1,308 @@
+"""
+Retention dry run
+=================
+The DSGVO report lists retention periods. This module checks them against
+real data: CSV or Parquet exports of the tables, one file per model, named
+after it (``TimeEntryAudit.csv``, ``Session.csv.gz``,
+``AuditLog.parquet``)::
+
+    audit = dry_run("/backups/2026-10-18", schema)
+    for result in audit.results:
+        result.check.model, result.rows, result.expired, result.status(audit.threshold)
+
+What is checked comes from the code, not from the report text:
+
+* Deletion rules: the ``safeDelete`` calls of the data-retention job
+  (``indexcoverage.retention_rules()``), with their extra filters
+  (``acknowledged: true``). Rows past the window are deleted by the next
+  weekly run. Rows past the window plus ``CRON_GRACE_DAYS`` mean the job is
+  not running. If more than the job's ``SAFETY_THRESHOLD`` share of a table
+  is due, the job refuses to delete any of it.
+* Statutory periods: models the job's header table keeps for a fixed time
+  (``3650 days``, §147 AO) without deleting them. Their date column is the
+  one that records creation (``@default(now())``). Rows older than the
+  period must be deleted by hand.
+* Purged columns (``purged=``): the GPS columns dropped in section 1 must
+  not come back. If an export still has one, its non-empty values are
+  counted.
+
+Files are read in chunks of ``CHUNK_ROWS`` rows and only the needed columns
+are kept. Each chunk's dates are converted and compared as numpy arrays, so
+memory stays flat for tables of tens of millions of rows. Parquet needs
+``pyarrow``; without it, Parquet exports are reported as not readable.
+The cutoffs are measured from ``BUILD_DATE``, so reproducible builds give
+the same counts. ``python3 -m reportlib.retention`` (from ``scripts/``)
+runs the doctests.
+"""
+
+import csv
+import gzip
+import os
+import re
+from dataclasses import dataclass, field, replace
+from itertools import islice
+
+import numpy as np
+
+from .buildinfo import BUILD_DATE
+from .indexcoverage import RETENTION_ROUTE, retention_rules
+
+CHUNK_ROWS = 50_000
+CRON_GRACE_DAYS = 7            # the job runs weekly (vercel.json: "30 4 * * 0")
+SUFFIXES = (".parquet", ".csv", ".csv.gz")
+NULLS = ("", "\\N", "NULL", "null")
+DATE_RANGE = (np.datetime64("1900-01-01", "s"), np.datetime64("10000-01-01", "s"))
+
+_STATUTORY = re.compile(r"^\s*\*\s*\|\s*(\w+)[^|]*\|\s*(\d+)\s*days\s*\|", re.M)
+_THRESHOLD = re.compile(r"SAFETY_THRESHOLD\s*=\s*([\d.]+)")
+_TRUE = ("true", "t", "1")
+
+
+@dataclass(frozen=True)
+class TableCheck:
+    model: str
+    date_field: str = ""
+    days: int = 0
+    filters: tuple = ()      # ((column, literal), …) besides the cutoff
+    statutory: bool = False  # kept by law for `days`; no job deletes it
+    purged: tuple = ()       # columns that must be gone or empty
+
+
+@dataclass
+class TableResult:
+    check: TableCheck
+    path: str = None
+    rows: int = 0
+    expired: int = 0         # past the window (and matching the filters)
+    overdue: int = 0         # past the window plus CRON_GRACE_DAYS
+    residual: int = 0        # rows with a value in a purged column
+    oldest: object = None    # numpy datetime64 of the oldest expired row
+    error: str = ""
+
+    def status(self, threshold):
+        """Of the retention window: ``missing``, ``error``, ``overdue``, ``blocked``, ``due`` or ``ok``."""
+        if self.path is None:
+            return "missing"
+        if self.error:
+            return "error"
+        if self.check.statutory:
+            return "overdue" if self.expired else "ok"
+        if self.rows and self.expired > self.rows * threshold:
+            return "blocked"
+        if self.overdue:
+            return "overdue"
+        return "due" if self.expired else "ok"
+
+    def purge_status(self):
+        """Of the purged columns: ``missing``, ``error``, ``residual`` or ``ok``."""
+        if self.path is None:
+            return "missing"
+        if self.error:
+            return "error"
+        return "residual" if self.residual else "ok"
+
+
+@dataclass
+class RetentionAudit:
+    as_of: object
+    threshold: float
+    results: list = field(default_factory=list)
+
+    @property
+    def checked(self):
+        return [r for r in self.results if r.path is not None]
+
+
+# ── rules ────────────────────────────────────────────────────
+def _created_field(model):
+    for f in model.fields:
+        default = f.attribute("default")
+        if f.type == "DateTime" and default and any(
+                getattr(arg, "name", None) == "now" for arg in default.args):
+            return f.name
+    return ""
+
+
+def safety_threshold(route=RETENTION_ROUTE, default=0.5):
+    try:
+        with open(route, encoding="utf-8") as fh:
+            m = _THRESHOLD.search(fh.read())
+    except OSError:
+        return default
+    return float(m.group(1)) if m else default
+
+
+def table_checks(schema, route=RETENTION_ROUTE, purged=None):
+    """The ``TableCheck``s for *schema* (see module docstring)."""
+    checks = [TableCheck(r.model, r.date_field, r.days, r.filters)
+              for r in retention_rules(route)]
+    deleted = {c.model for c in checks}
+    try:
+        with open(route, encoding="utf-8") as fh:
+            header = fh.read()
+    except OSError:
+        header = ""
+    names = {m.name for m in schema.models}
+    for model, days in _STATUTORY.findall(header):
+        if model in deleted or model not in names:
+            continue
+        date_field = _created_field(schema.model(model))
+        if date_field:
+            checks.append(TableCheck(model, date_field, int(days), statutory=True))
+    # A model with both is read once.
+    for model, columns in (purged or {}).items():
+        index = next((i for i, c in enumerate(checks) if c.model == model), None)
+        if index is None:
+            checks.append(TableCheck(model, purged=tuple(columns)))
+        else:
+            checks[index] = replace(checks[index], purged=tuple(columns))
+    return checks
+
+
+# ── reading ──────────────────────────────────────────────────
+def find_export(directory, model):
+    """The export of *model* in *directory* (any suffix, any case), or None."""
+    try:
+        entries = os.listdir(directory)
+    except OSError:
+        return None
+    wanted = model.lower()
+    for suffix in SUFFIXES:
+        for name in sorted(entries):
+            if name.lower() == wanted + suffix:
+                return os.path.join(directory, name)
+    return None
+
+
+def _csv_chunks(path, columns, chunk_rows):
+    """``{column: array}`` per chunk; columns the file lacks are left out."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        present = {c: header.index(c) for c in columns if c in header}
+        while True:
+            block = list(islice(reader, chunk_rows))
+            if not block:
+                return
+            yield len(block), {c: np.array([row[i] if i < len(row) else "" for row in block])
+                               for c, i in present.items()}
+
+
+def _parquet_chunks(path, columns, chunk_rows):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("pyarrow is not installed") from None
+    pf = pq.ParquetFile(path)
+    present = [c for c in columns if c in pf.schema_arrow.names]
+    if not present:
+        yield pf.metadata.num_rows, {}
+        return
+    for batch in pf.iter_batches(batch_size=chunk_rows, columns=present):
+        yield batch.num_rows, {c: batch.column(c).to_numpy(zero_copy_only=False) for c in present}
+
+
+def _dates(values):
+    """Timestamps (ISO text, epoch milliseconds or datetime64) as datetime64[s].
+
+    NULLs become NaT, and the format is decided on the other values. Dates
+    outside ``DATE_RANGE`` raise ``ValueError`` rather than being counted::
+
+        >>> _dates(np.array(["1577836800000", ""])).astype(str).tolist()
+        ['2020-01-01T00:00:00', 'NaT']
+        >>> _dates(np.array(["1577836800000", "2020-01-01"]))
+        Traceback (most recent call last):
+        ValueError: dates outside the years 1900–9999 (epoch milliseconds mixed with text?)
+    """
+    if np.issubdtype(values.dtype, np.datetime64):
+        dates = values.astype("datetime64[s]")
+    else:
+        values = values.astype(str)
+        present = ~np.isin(values, NULLS)
+        known = values[present]
+        dates = np.full(values.shape, np.datetime64("NaT", "s"))
+        if known.size and np.char.isdigit(known).all():
+            dates[present] = known.astype(np.int64).astype("datetime64[ms]")
+        else:
+            # "2026-01-31 12:00:00.123+00" → "2026-01-31 12:00:00": dumps are in UTC.
+            dates[present] = known.astype("U19").astype("datetime64[s]")
+    known = dates[~np.isnat(dates)]
+    if known.size and (known.min() < DATE_RANGE[0] or known.max() >= DATE_RANGE[1]):
+        raise ValueError("dates outside the years 1900–9999 (epoch milliseconds mixed with text?)")
+    return dates
+
+
+def _present(values):
+    if values.dtype == object:     # Parquet strings, None for null
+        return np.array([v is not None and v not in NULLS for v in values], dtype=bool)
+    if values.dtype.kind in "US":
+        return ~np.isin(values, NULLS)
+    if values.dtype.kind == "f":
+        return ~np.isnan(values)
+    return np.ones(values.shape, dtype=bool)
+
+
+def _matches(values, literal):
+    literal = literal.strip("\"'")
+    if values.dtype == bool:
+        return values == (literal == "true")
+    values = np.char.lower(values.astype(str))
+    if literal in ("true", "false"):
+        return np.isin(values, _TRUE) == (literal == "true")
+    return values == literal.lower()
+
+
+def check_table(check, path, as_of, chunk_rows=CHUNK_ROWS):
+    """Count what *check* finds in the export at *path*."""
+    result = TableResult(check, path)
+    reader = _parquet_chunks if path.endswith(".parquet") else _csv_chunks
+    wanted = ([check.date_field] if check.date_field else []) + \
+        [c for c, _ in check.filters] + list(check.purged)
+    cutoff = as_of - np.timedelta64(check.days, "D")
+    late = cutoff - np.timedelta64(CRON_GRACE_DAYS, "D")
+    try:
+        for n, columns in reader(path, wanted, chunk_rows):
+            result.rows += n
+            if check.date_field:
+                if check.date_field not in columns:
+                    raise ValueError(f"no column {check.date_field}")
+                dates = _dates(columns[check.date_field])
+                mask = dates < cutoff
+                for column, literal in check.filters:
+                    if column not in columns:
+                        raise ValueError(f"no column {column}")
+                    mask &= _matches(columns[column], literal)
+                expired = dates[mask]
+                result.expired += int(expired.size)
+                result.overdue += int(np.count_nonzero(expired < late))
+                if expired.size:
+                    oldest = expired.min()
+                    if result.oldest is None or oldest < result.oldest:
+                        result.oldest = oldest
+            if check.purged:
+                found = [_present(columns[c]) for c in check.purged if c in columns]
+                if found:
+                    result.residual += int(np.count_nonzero(np.logical_or.reduce(found)))
+    except (OSError, ValueError, csv.Error, UnicodeDecodeError) as exc:
+        result.error = str(exc)
+    return result
+
+
+def dry_run(directory, schema, route=RETENTION_ROUTE, purged=None, as_of=None,
+            chunk_rows=CHUNK_ROWS):
+    """Check every ``table_checks()`` rule against the exports in *directory*."""
+    as_of = np.datetime64(as_of or BUILD_DATE, "s")
+    audit = RetentionAudit(as_of, safety_threshold(route))
+    for check in table_checks(schema, route, purged):
+        path = find_export(directory, check.model)
+        if path is None:
+            audit.results.append(TableResult(check))
+        else:
+            audit.results.append(check_table(check, path, as_of, chunk_rows))
+    return audit
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
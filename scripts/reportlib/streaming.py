@@ -0,0 +1,95 @@
+"""
+Streaming stories
+=================
+``doc.build()`` wants a list and keeps every flowable of the story alive
+until the build ends. For long reports the story can instead be written as
+generator functions, one per section::
+
+    def findings(c, styles):
+        yield Paragraph(c["findings_title"], styles["h1"])
+        for item in c["findings"]:
+            yield finding_table(styles, item)
+
+    doc.build(stream(cover(c, styles), findings(c, styles), closing(c, styles)))
+
+``stream()`` returns a ``StreamingStory``: a list look-alike that pulls
+flowables from the generators only as layout reaches them and drops them
+once placed, so memory tracks the page being laid out rather than the whole
+document.
+
+``BaseDocTemplate`` only touches the front of the story — it reads, deletes
+and re-inserts (split remainders) at index 0 — with one exception:
+``keepWithNext`` groups are collected by scanning ahead up to ``len()``.
+``len()`` therefore pulls until the last buffered flowable does not keep
+with the next one, so a group is never cut at the buffer edge.
+"""
+
+from collections.abc import MutableSequence
+from itertools import chain
+
+
+def _keeps_with_next(flowable):
+    get = getattr(flowable, "getKeepWithNext", None)
+    return bool(get and get())
+
+
+class StreamingStory(MutableSequence):
+    """A story that is read lazily from an iterable of flowables."""
+
+    def __init__(self, source):
+        self._source = iter(source)
+        self._buffer = []
+        self.exhausted = False
+
+    def _pull(self):
+        try:
+            self._buffer.append(next(self._source))
+        except StopIteration:
+            self.exhausted = True
+            self._source = iter(())
+            return False
+        return True
+
+    def _fill(self, n=None):
+        """Buffer at least *n* flowables (all of them when None)."""
+        while (n is None or len(self._buffer) < n) and self._pull():
+            pass
+
+    def _fill_for(self, index):
+        if isinstance(index, slice):
+            stop = index.stop
+            self._fill(None if stop is None or stop < 0 else stop)
+        else:
+            self._fill(None if index < 0 else index + 1)
+
+    def __len__(self):
+        self._fill(1)
+        while self._buffer and _keeps_with_next(self._buffer[-1]) and self._pull():
+            pass
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        self._fill_for(index)
+        return self._buffer[index]
+
+    def __setitem__(self, index, value):
+        self._fill_for(index)
+        self._buffer[index] = value
+
+    def __delitem__(self, index):
+        self._fill_for(index)
+        del self._buffer[index]
+
+    def insert(self, index, value):
+        self._fill(index)
+        self._buffer.insert(index, value)
+
+    def drain(self):
+        """Yield the remaining flowables, removing them from the story."""
+        while self._buffer or self._pull():
+            yield self._buffer.pop(0)
+
+
+def stream(*parts):
+    """Chain section generators (or lists) into one ``StreamingStory``."""
+    return StreamingStory(chain.from_iterable(parts))
@@ -0,0 +1,159 @@
+"""
+Paragraph style registry
+========================
+Every generator used to rebuild its ParagraphStyles on each ``build_pdf``
+call (once per language), and the profit reports constructed fresh styles
+inside table-row loops. Styles are pure configuration, so they are now built
+once per process and shared:
+
+* ``register_theme(name)`` turns a style-builder function into a cached
+  accessor. The first call builds the theme; later calls (other language,
+  other generator in the same process) get the same read-only mapping.
+* ``sample_styles()`` is the shared ReportLab sample sheet.
+* ``derive(name, parent, **overrides)`` creates a one-off variant. Variants
+  are memoised, and call sites that keep deriving styles (typically once per
+  table row) are reported with a ``StyleRegistryWarning`` so the style can be
+  hoisted out of the loop.
+
+Registered styles are frozen: assigning an attribute raises, so one report
+can no longer leak a tweak into another.
+"""
+
+import sys
+import warnings
+from collections import Counter
+from functools import wraps
+from types import MappingProxyType
+
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+# Number of derive() calls from a single source line before it is flagged.
+HOT_LOOP_THRESHOLD = 10
+
+_builders = {}
+_themes = {}
+_derived = {}
+_call_sites = Counter()
+_flagged = set()
+_sample = None
+
+
+class StyleRegistryWarning(UserWarning):
+    """A style is being constructed repeatedly where one instance would do."""
+
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """A registered, shared ParagraphStyle that rejects attribute writes.
+
+    It reports ``ParagraphStyle`` as its ``__class__`` so ReportLab's own
+    parent-class checks (``ParagraphStyle(name, parent=frozen)``) and
+    ``clone()`` keep working and produce ordinary, mutable styles.
+    """
+
+    @property
+    def __class__(self):
+        return ParagraphStyle
+
+    def __setattr__(self, key, value):
+        raise AttributeError(
+            f"style {self.name!r} is shared through the style registry; "
+            f"use derive() to create a variant instead of mutating it"
+        )
+
+    def __delattr__(self, key):
+        self.__setattr__(key, None)
+
+    def __reduce__(self):
+        return (_unpickle_frozen, (dict(self.__dict__),))
+
+
+def _unpickle_frozen(state):
+    style = ParagraphStyle(state["name"])
+    style.__dict__.update(state)
+    return freeze(style)
+
+
+def freeze(style):
+    """Mark *style* as shared and return it. Non-paragraph styles pass through."""
+    if type(style) is ParagraphStyle:
+        object.__setattr__(style, "__class__", FrozenParagraphStyle)
+    return style
+
+
+def sample_styles():
+    """Return the ReportLab sample stylesheet, built once per process."""
+    global _sample
+    if _sample is None:
+        sheet = getSampleStyleSheet()
+        for style in sheet.byName.values():
+            freeze(style)
+        _sample = sheet
+    return _sample
+
+
+def register_theme(name):
+    """Decorator: register a builder returning ``{key: ParagraphStyle}``.
+
+    The decorated function returns the cached, read-only theme. Registering
+    the same name again (e.g. after a module reload) replaces the builder and
+    drops the cached theme.
+    """
+    def decorator(builder):
+        _builders[name] = builder
+        _themes.pop(name, None)
+
+        @wraps(builder)
+        def accessor():
+            return get_theme(name)
+
+        return accessor
+
+    return decorator
+
+
+def get_theme(name):
+    """Return the theme registered under *name*, building it on first use."""
+    theme = _themes.get(name)
+    if theme is None:
+        try:
+            builder = _builders[name]
+        except KeyError:
+            raise KeyError(f"unknown style theme {name!r}") from None
+        theme = MappingProxyType({key: freeze(style) for key, style in builder().items()})
+        _themes[name] = theme
+    return theme
+
+
+def _style_key(name, parent, overrides):
+    return (name, id(parent), tuple(sorted((k, repr(v)) for k, v in overrides.items())))
+
+
+def derive(name, parent=None, stacklevel=1, **overrides):
+    """Return a frozen variant of *parent* with *overrides* applied.
+
+    Identical requests return the same object, so calling this inside a loop
+    is cheap — but a call site that fires more than ``HOT_LOOP_THRESHOLD``
+    times is still flagged once, since the style belongs outside the loop.
+    Wrappers such as a generator's ``make_style()`` pass ``stacklevel=2`` so
+    the warning points at their caller.
+    """
+    frame = sys._getframe(stacklevel)
+    site = (frame.f_code.co_filename, frame.f_lineno)
+    _call_sites[site] += 1
+    if _call_sites[site] > HOT_LOOP_THRESHOLD and site not in _flagged:
+        _flagged.add(site)
+        warnings.warn(
+            f"style {name!r} derived {_call_sites[site]} times from "
+            f"{site[0]}:{site[1]}; build it once outside the loop",
+            StyleRegistryWarning,
+            stacklevel=stacklevel + 1,
+        )
+
+    key = _style_key(name, parent, overrides)
+    style = _derived.get(key)
+    if style is None:
+        # The style keeps a reference to its parent, so the id() in the key
+        # stays valid for as long as the cache entry exists.
+        style = freeze(ParagraphStyle(name, parent=parent, **overrides))
+        _derived[key] = style
+    return style
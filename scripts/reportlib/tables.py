@@ -0,0 +1,305 @@
+"""
+Table builder
+=============
+One implementation behind every generator's ``make_table()``.
+
+* Zebra striping is a single ``ROWBACKGROUNDS`` command instead of one
+  ``BACKGROUND`` command per row.
+* Cells that hold numbers stay plain strings; only text that may need to wrap
+  becomes a ``Paragraph`` (and only when the caller asks for it).
+* Column widths are measured once, up front, and shared by every page.
+* Bodies longer than ``chunk_rows`` are laid out page by page through
+  ``ChunkedTable`` instead of as one monolithic ``Table``. ReportLab splits a
+  big table by copying its remaining rows into a new table on every page,
+  which makes long ledgers quadratic; chunks keep the work per page bounded
+  so a 100k-row listing renders in linear time.
+
+Small tables come back as an ordinary ``Table``, so callers can keep calling
+``setStyle()`` on the result either way.
+"""
+
+import re
+
+from reportlab.platypus import Table, TableStyle
+from reportlab.platypus.flowables import Flowable
+
+from .layoutcache import Paragraph, string_width
+
+# Body rows per chunk — comfortably more than fit on an A4 page.
+DEFAULT_CHUNK_ROWS = 80
+
+_NUMERIC = re.compile(
+    r"^[~≈<>±+\-−–]?\s*[€$]?\s*[\d][\d.,\s]*\s*(%|€|\$|K|M|k|x|×|h|ms|s|MB|KB)?$"
+)
+
+
+def is_numeric_cell(value):
+    """True for numbers and number-like strings ("1.234,56 €", "81%", "€12K")."""
+    if isinstance(value, (int, float)):
+        return True
+    return isinstance(value, str) and bool(_NUMERIC.match(value.strip()))
+
+
+def body_text_commands(style, first_row=1):
+    """Table commands that make plain-string body cells look like *style*."""
+    return [
+        ("FONTNAME", (0, first_row), (-1, -1), style.fontName),
+        ("FONTSIZE", (0, first_row), (-1, -1), style.fontSize),
+        ("LEADING", (0, first_row), (-1, -1), style.leading),
+        ("TEXTCOLOR", (0, first_row), (-1, -1), style.textColor),
+    ]
+
+
+def _cell(value, cell_style):
+    if cell_style is None or isinstance(value, Flowable):
+        return value
+    if is_numeric_cell(value):
+        return str(value)
+    return Paragraph(str(value), cell_style)
+
+
+def _cmd_font(commands, first_row):
+    """Font name/size that plain-string body cells will be drawn with."""
+    font, size = "Helvetica", 10
+    for cmd in commands:
+        op, sr, er = cmd[0], cmd[1][1], cmd[2][1]
+        if not (isinstance(sr, int) and isinstance(er, int)):
+            continue
+        if sr <= first_row and (er < 0 or er >= first_row):
+            if op == "FONTNAME":
+                font = cmd[3]
+            elif op in ("FONTSIZE", "SIZE"):
+                size = cmd[3]
+            elif op == "FONT":
+                font = cmd[3]
+                if len(cmd) > 4:
+                    size = cmd[4]
+    return font, size
+
+
+def measure_col_widths(rows, avail_width, commands=(), header_rows=1, padding=12):
+    """Measure column widths once for a whole table.
+
+    Columns that only contain strings get their natural width (widest cell
+    plus padding). Columns holding flowables share whatever width is left.
+    If the natural widths overflow *avail_width* everything is scaled down.
+    """
+    ncols = max(len(r) for r in rows)
+    head_font, head_size = _cmd_font(commands, 0)
+    body_font, body_size = _cmd_font(commands, header_rows)
+    natural = [0.0] * ncols
+    flexible = [False] * ncols
+    for i, row in enumerate(rows):
+        font, size = (head_font, head_size) if i < header_rows else (body_font, body_size)
+        for c, value in enumerate(row):
+            if isinstance(value, Flowable):
+                flexible[c] = True
+                continue
+            for line in str(value).split("\n"):
+                w = string_width(line, font, size)
+                if w > natural[c]:
+                    natural[c] = w
+    widths = [w + padding for w in natural]
+    n_flex = sum(flexible)
+    if n_flex:
+        fixed = sum(w for w, f in zip(widths, flexible) if not f)
+        share = max(avail_width - fixed, 0) / n_flex
+        widths = [max(w, share) if f else w for w, f in zip(widths, flexible)]
+    total = sum(widths)
+    if total > avail_width:
+        widths = [w * avail_width / total for w in widths]
+    return widths
+
+
+def _norm_row(r, nrows):
+    return r + nrows if r < 0 else r
+
+
+def translate_commands(commands, header_rows, nrows, start, count):
+    """Map style commands written for the full table onto one chunk.
+
+    The chunk holds the header rows followed by full-table body rows
+    ``header_rows + start`` … ``header_rows + start + count - 1``.
+    """
+    out = []
+    first, last = header_rows + start, header_rows + start + count - 1
+    for cmd in commands:
+        op, (sc, sr), (ec, er) = cmd[0], cmd[1], cmd[2]
+        args = tuple(cmd[3:])
+        if not (isinstance(sr, int) and isinstance(er, int)):
+            out.append(cmd)
+            continue
+        sr, er = _norm_row(sr, nrows), _norm_row(er, nrows)
+        head = (sr, min(er, header_rows - 1)) if sr < header_rows else None
+        lo, hi = max(sr, first), min(er, last)
+        body = (lo - start, hi - start) if lo <= hi else None
+        if op == "ROWBACKGROUNDS":
+            # Header and body get their own command: the body's colour cycle
+            # is rotated to stay in phase with the full table.
+            if head:
+                out.append((op, (sc, head[0]), (ec, head[1])) + args)
+            if body:
+                cycle = list(args[0])
+                k = (lo - sr) % len(cycle)
+                out.append((op, (sc, body[0]), (ec, body[1])) + (cycle[k:] + cycle[:k],) + args[1:])
+            continue
+        if head and body and head[1] + 1 == body[0]:
+            out.append((op, (sc, head[0]), (ec, body[1])) + args)
+            continue
+        for rng in (head, body):
+            if rng and rng[0] <= rng[1]:
+                out.append((op, (sc, rng[0]), (ec, rng[1])) + args)
+    return out
+
+
+class ChunkedTable(Flowable):
+    """A long table laid out one page-sized chunk at a time.
+
+    Each ``split()`` measures at most one chunk of rows, emits a ``Table``
+    holding exactly the rows that fit (with the header repeated) and hands
+    the rest on as a new ``ChunkedTable`` that shares the same row list.
+    """
+
+    def __init__(self, header, body, col_widths, commands, zebra=None,
+                 chunk_rows=DEFAULT_CHUNK_ROWS, start=0, hAlign="CENTER"):
+        super().__init__()
+        self.header = header
+        self.body = body
+        self.col_widths = col_widths
+        self.commands = list(commands)
+        self.zebra = tuple(zebra) if zebra else None
+        self.chunk_rows = chunk_rows
+        self.start = start
+        self.hAlign = hAlign
+        self._measured = None
+        # Row heights by body index (plus "header"), shared with the
+        # remainders this table splits into. Column widths are fixed, so a
+        # row measured while fitting one page is still valid on the next.
+        self._heights = {}
+
+    # -- helpers -----------------------------------------------------------
+    @property
+    def remaining(self):
+        return len(self.body) - self.start
+
+    def setStyle(self, commands):
+        if isinstance(commands, TableStyle):
+            commands = commands.getCommands()
+        self.commands.extend(commands)
+
+    def _widths(self, aw):
+        if self.col_widths is None:
+            self.col_widths = measure_col_widths(
+                self.header + self.body, aw, self.commands, len(self.header))
+        return self.col_widths
+
+    def _table(self, start, count, aw):
+        h = len(self.header)
+        nrows = h + len(self.body)
+        cmds = translate_commands(self.commands, h, nrows, start, count)
+        if self.zebra:
+            k = start % len(self.zebra)
+            cmds.append(("ROWBACKGROUNDS", (0, h), (-1, -1),
+                         self.zebra[k:] + self.zebra[:k]))
+        t = Table(self.header + self.body[start:start + count],
+                  colWidths=self._widths(aw), repeatRows=h, hAlign=self.hAlign)
+        t.setStyle(TableStyle(cmds))
+        return t
+
+    def _measure(self, start, aw):
+        """Measure one chunk of rows from *start* into the shared height cache."""
+        h = len(self.header)
+        count = min(self.chunk_rows, len(self.body) - start)
+        t = self._table(start, count, aw)
+        t.wrap(aw, 0)
+        heights = t._rowHeights
+        cache = self._heights
+        cache["header"] = sum(heights[:h])
+        cache.update(zip(range(start, start + count), heights[h:]))
+
+    def _fit(self, aw, ah):
+        """Number of body rows (from ``self.start``) that fit into *ah*."""
+        cache = self._heights
+        if self.start not in cache:
+            self._measure(self.start, aw)
+        used, fitted = cache["header"], 0
+        for i in range(self.start, len(self.body)):
+            if i not in cache:
+                self._measure(i, aw)
+            used += cache[i]
+            if used > ah:
+                break
+            fitted += 1
+        return fitted
+
+    # -- Flowable API ------------------------------------------------------
+    def wrap(self, aw, ah):
+        if self.remaining <= self.chunk_rows:
+            self._measured = self._table(self.start, self.remaining, aw)
+            return self._measured.wrap(aw, ah)
+        # Only one chunk is measured; the rest is extrapolated so that the
+        # frame sees a flowable taller than the page and splits it.
+        if self.start not in self._heights:
+            self._measure(self.start, aw)
+        cache = self._heights
+        known = [cache[i] for i in range(self.start, self.start + self.chunk_rows) if i in cache]
+        estimate = cache["header"] + sum(known) * self.remaining / len(known)
+        if estimate <= ah:
+            self._measured = self._table(self.start, self.remaining, aw)
+            return self._measured.wrap(aw, ah)
+        self._measured = None
+        self.width = sum(self._widths(aw))
+        return self.width, estimate
+
+    def split(self, aw, ah):
+        fitted = self._fit(aw, ah)
+        if fitted == 0:
+            return []
+        if fitted >= self.remaining:
+            return [self._table(self.start, self.remaining, aw)]
+        rest = ChunkedTable(self.header, self.body, self.col_widths, self.commands,
+                            self.zebra, self.chunk_rows, self.start + fitted, self.hAlign)
+        rest._heights = self._heights
+        return [self._table(self.start, fitted, aw), rest]
+
+    def drawOn(self, canv, x, y, _sW=0):
+        # Only reached when the remainder fits in one go (see wrap()).
+        self._measured.drawOn(canv, x, y, _sW)
+
+
+def build_table(rows, col_widths=None, header_rows=1, style=(), zebra=None,
+                cell_style=None, chunk_rows=DEFAULT_CHUNK_ROWS, avail_width=None):
+    """Build a styled table from ``rows`` (header rows first).
+
+    Args:
+        rows: Header row(s) followed by body rows. Cells may be strings,
+            numbers or flowables.
+        col_widths: Column widths; measured once from the data when omitted.
+        header_rows: Number of leading rows repeated on every page.
+        style: Table commands addressing the full table.
+        zebra: Background colours cycled over the body rows (``None``
+            entries leave a row unfilled).
+        cell_style: If given, non-numeric body strings are wrapped in a
+            Paragraph with this style, and plain cells are styled to match.
+        chunk_rows: Bodies longer than this are returned as a ChunkedTable.
+        avail_width: Width used when measuring columns for a small table.
+    """
+    header = [list(r) for r in rows[:header_rows]]
+    if cell_style is None:
+        body = [list(r) for r in rows[header_rows:]]
+    else:
+        body = [[_cell(v, cell_style) for v in r] for r in rows[header_rows:]]
+    commands = list(style)
+    if cell_style is not None:
+        commands = body_text_commands(cell_style, header_rows) + commands
+
+    if len(body) > chunk_rows:
+        return ChunkedTable(header, body, col_widths, commands, zebra, chunk_rows)
+
+    if col_widths is None and avail_width is not None:
+        col_widths = measure_col_widths(header + body, avail_width, commands, header_rows)
+    if zebra:
+        commands.append(("ROWBACKGROUNDS", (0, header_rows), (-1, -1), list(zebra)))
+    t = Table(header + body, colWidths=col_widths, repeatRows=header_rows)
+    t.setStyle(TableStyle(commands))
+    return t
@@ -0,0 +1,195 @@
+"""
+Table of contents with one-pass page tracking
+=============================================
+ReportLab's own ``TableOfContents`` needs ``multiBuild``, which lays the
+whole document out at least twice. The reports here already buffer every
+page until ``save()`` to print "Page X of Y", so page numbers can be filled
+in at that point instead:
+
+* ``SectionIndex.heading()`` creates the section heading and remembers it.
+  When the heading is drawn it records its page and its PDF outline entry.
+* ``SectionIndex.toc()`` is a placeholder flowable for the TOC. Its rows are
+  built when it is laid out, i.e. once the whole story — and therefore every
+  heading — exists. The page column holds ``PageRef`` cells that reserve
+  space and record where the number goes.
+* ``PageTrackingCanvas.save()`` draws the recorded numbers onto the buffered
+  pages before writing them out, next to the usual footer. Bookmarks and
+  outline entries are added there too: a bookmark points at the page object
+  being written, and during layout that is still the first one.
+
+Layout runs once; the patch stage only draws a few strings.
+``python3 -m reportlib.toc`` (from ``scripts/``) runs the doctests.
+"""
+
+import re
+
+from reportlab.pdfgen import canvas
+from reportlab.platypus.flowables import Flowable
+
+from .layoutcache import Paragraph
+
+_NUMBERED = re.compile(r"^\s*(\d+(?:\.\d+)*\.?)\s+(.*)$")
+
+
+class SectionHeading(Paragraph):
+    """A heading paragraph that reports the page it lands on."""
+
+    def __init__(self, text, style, key, outline_title=None, level=0):
+        super().__init__(text, style)
+        self.toc_key = key
+        self.outline_title = outline_title or text
+        self.outline_level = level
+
+    def draw(self):
+        canv = self.canv
+        if isinstance(canv, PageTrackingCanvas):
+            canv.section_pages[self.toc_key] = canv.getPageNumber()
+            canv.outline.append((canv.getPageNumber(), self.toc_key,
+                                 self.outline_title, self.outline_level))
+        else:
+            canv.bookmarkPage(self.toc_key)
+            canv.addOutlineEntry(self.outline_title, self.toc_key, level=self.outline_level)
+        super().draw()
+
+    def split(self, availWidth, availHeight):
+        # Headings are short; never let one break across pages, otherwise the
+        # recorded page would be the one holding its first line only.
+        return []
+
+
+class PageRef(Flowable):
+    """Reserves one line for a page number that is filled in at save time."""
+
+    def __init__(self, key, style):
+        super().__init__()
+        self.key = key
+        self.style = style
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        return availWidth, self.style.leading
+
+    def draw(self):
+        x, y = self.canv.absolutePosition(self.width, self.style.leading - self.style.fontSize)
+        self.canv.page_refs.append((self.canv.getPageNumber(), self.key, x, y, self.style))
+
+
+class _LazyFlowable(Flowable):
+    """Delegates to a flowable created on first layout."""
+
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory
+        self._content = None
+
+    def _get(self):
+        if self._content is None:
+            self._content = self._factory()
+        return self._content
+
+    def wrap(self, availWidth, availHeight):
+        self.width, self.height = self._get().wrap(availWidth, availHeight)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        return self._get().split(availWidth, availHeight)
+
+    def drawOn(self, canv, x, y, _sW=0):
+        self._get().drawOn(canv, x, y, _sW)
+
+
+class SectionIndex:
+    """Collects numbered section headings and renders the TOC for them."""
+
+    def __init__(self):
+        self.entries = []
+
+    def heading(self, title, style, level=0):
+        """Return the heading flowable for *title* and register it in the TOC.
+
+        Titles like ``"5. Revenue Projections"`` are split into the number and
+        the text for the two TOC columns.
+        """
+        key = f"section-{len(self.entries) + 1}"
+        m = _NUMBERED.match(title)
+        number, text = (m.group(1), m.group(2)) if m else ("", title)
+        self.entries.append((key, number, text))
+        return SectionHeading(title, style, key, level=level)
+
+    def toc(self, build):
+        """Placeholder for the TOC; ``build(entries)`` returns its flowable.
+
+        *entries* is a list of ``(key, number, title)``; put a ``PageRef(key,
+        style)`` wherever the page number should appear.
+        """
+        return _LazyFlowable(lambda: build(list(self.entries)))
+
+
+class PageTrackingCanvas(canvas.Canvas):
+    """Canvas that buffers pages so totals and TOC page numbers can be drawn
+    once the whole document is known. Subclasses draw their footer in
+    ``_draw_footer(page_count)``."""
+
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self._saved_page_states = []
+        self.section_pages = {}
+        self.page_refs = []
+        self.outline = []          # (page, key, title, level), in drawing order
+
+    def showPage(self):
+        self._saved_page_states.append(dict(self.__dict__))
+        self._startPage()  # type: ignore[attr-defined]
+
+    def save(self):
+        num_pages = len(self._saved_page_states)
+        refs, outline = {}, {}
+        for ref in self.page_refs:
+            refs.setdefault(ref[0], []).append(ref)
+        for entry in self.outline:
+            outline.setdefault(entry[0], []).append(entry)
+        for state in self._saved_page_states:
+            self.__dict__.update(state)
+            for _, key, title, level in outline.get(self._pageNumber, ()):  # type: ignore[attr-defined]
+                self.bookmarkPage(key)
+                self.addOutlineEntry(title, key, level=level)
+            self._draw_page_refs(refs.get(self._pageNumber, ()))  # type: ignore[attr-defined]
+            self._draw_footer(num_pages)
+            canvas.Canvas.showPage(self)
+        canvas.Canvas.save(self)
+
+    def outline_pages(self):
+        """Page each bookmark points at, by key; after ``save()`` this matches
+        ``section_pages``::
+
+            >>> import io
+            >>> from reportlab.lib.styles import getSampleStyleSheet
+            >>> from reportlab.platypus import PageBreak, SimpleDocTemplate
+            >>> sections, h1 = SectionIndex(), getSampleStyleSheet()["Heading1"]
+            >>> doc = SimpleDocTemplate(io.BytesIO())
+            >>> doc.build([sections.heading("1. A", h1), PageBreak(), PageBreak(),
+            ...            sections.heading("2. B", h1)], canvasmaker=PageTrackingCanvas)
+            >>> doc.canv.outline_pages() == doc.canv.section_pages == {"section-1": 1, "section-2": 3}
+            True
+        """
+        return {key: int(dest.page.name[len("Page"):])
+                for key, dest in self._destinations.items()}  # type: ignore[attr-defined]
+
+    def _draw_page_refs(self, refs):
+        for _, key, x, y, style in refs:
+            page = self.section_pages.get(key)
+            if page is None:
+                continue
+            self.saveState()
+            self.setFont(style.fontName, style.fontSize)
+            self.setFillColor(style.textColor)
+            self.drawRightString(x, y, str(page))
+            self.restoreState()
+
+    def _draw_footer(self, page_count):
+        pass
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
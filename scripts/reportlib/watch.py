@@ -0,0 +1,331 @@
+"""
+Watch mode
+==========
+``build_reports.py --watch`` keeps the reports current while their sources
+are being edited:
+
+* Polling: the input files of the selected reports (``Manifest.input_files``)
+  are stat()ed every ``POLL_S`` seconds. This needs only the standard library.
+  A burst of saves is collected until nothing has changed for the debounce
+  period.
+* Dependencies: each changed file is mapped to the reports that read it. A
+  generator maps to itself. A ``reportlib`` module maps to the generators
+  that import it, directly or through other library modules. A font maps to
+  the reports that embed it, and a declared ``inputs`` file to its report.
+* Languages: an edit to a generator may touch only language-specific content:
+  a top-level ``*_DE``/``*_EN`` assignment, or the ``"de"``/``"en"`` entry of
+  a top-level dict such as ``TR``. Then only that language is rebuilt.
+* Warm workers: builds run in a pool of worker processes that have already
+  imported ReportLab and the library, and keep their layout caches between
+  builds. Each job re-executes the generator source, so content edits need
+  no restart. Library or font changes restart the pool.
+
+A content edit therefore costs one in-process ``build_pdf(lang)``, not a
+fresh interpreter that renders every language.
+"""
+
+import ast
+import difflib
+import importlib
+import importlib.util
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+from .registry import FONTS_DIR, LIB_DIR, ROOT_DIR
+
+POLL_S = 0.1
+DEFAULT_DEBOUNCE_S = 0.2
+
+# Imported by every worker up front, so the first build after a change does
+# not pay for them.
+_WARM_MODULES = (
+    "reportlab.platypus", "reportlab.pdfbase.ttfonts", "reportlab.graphics.shapes",
+    "reportlib.buildinfo", "reportlib.layoutcache", "reportlib.tables",
+    "reportlib.styles", "reportlib.toc", "reportlib.streaming", "reportlib.parallel",
+    "reportlib.profiling", "reportlib.output", "reportlib.docir", "reportlib.repometrics",
+    "reportlib.prismaschema", "reportlib.findings", "reportlib.jsonstream",
+    "reportlib.diagnostics", "reportlib.numfmt", "reportlib.charts",
+    "reportlib.pricing", "reportlib.priceopt",
+)
+
+
+# ── dependencies ─────────────────────────────────────────────
+def _lib_path(module):
+    return os.path.join(LIB_DIR, module + ".py")
+
+
+def lib_imports(path):
+    """``reportlib`` module files imported directly by *path*."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            tree = ast.parse(fh.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    in_lib = os.path.dirname(os.path.abspath(path)) == LIB_DIR
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            if node.level == 1 and in_lib:
+                names = [node.module] if node.module else [a.name for a in node.names]
+            elif node.level == 0 and node.module == "reportlib":
+                names = [a.name for a in node.names]
+            elif node.level == 0 and (node.module or "").startswith("reportlib."):
+                names = [node.module.split(".")[1]]
+            else:
+                continue
+        elif isinstance(node, ast.Import):
+            names = [a.name.split(".")[1] for a in node.names if a.name.startswith("reportlib.")]
+        else:
+            continue
+        found.update(p for p in map(_lib_path, names) if os.path.exists(p))
+    return found
+
+
+def lib_closure(path):
+    """Library files *path* depends on, directly or transitively."""
+    seen, todo = set(), [path]
+    while todo:
+        for dep in lib_imports(todo.pop()):
+            if dep not in seen:
+                seen.add(dep)
+                todo.append(dep)
+    return seen
+
+
+def reports_for(changed, specs, manifest):
+    """Map each spec to the changed files it depends on."""
+    hits = {}
+    for spec in specs:
+        deps = set(manifest.input_files(spec))
+        libs = lib_closure(spec.script_path)
+        for path in changed:
+            if os.path.dirname(path) == LIB_DIR:
+                relevant = path in libs
+            else:
+                relevant = path in deps
+            if relevant:
+                hits.setdefault(spec, set()).add(path)
+    return hits
+
+
+# ── languages ────────────────────────────────────────────────
+def lang_ranges(source, langs):
+    """``(first_line, last_line, lang)`` of language-specific top-level content."""
+    tree = ast.parse(source)
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and "_" in target.id:
+                suffix = target.id.rsplit("_", 1)[1].lower()
+                if suffix in langs:
+                    yield node.lineno, node.end_lineno, suffix
+        if isinstance(node.value, ast.Dict):
+            for key, value in zip(node.value.keys, node.value.values):
+                if isinstance(key, ast.Constant) and key.value in langs:
+                    yield key.lineno, value.end_lineno, key.value
+
+
+def changed_langs(old, new, langs):
+    """Languages affected by editing *old* into *new*; None means all of them."""
+    try:
+        ranges = list(lang_ranges(new, langs))
+    except SyntaxError:
+        return None
+
+    def lang_of(line):
+        for first, last, lang in ranges:
+            if first <= line <= last:
+                return lang
+        return None
+
+    found = set()
+    matcher = difflib.SequenceMatcher(None, old.splitlines(), new.splitlines(), autojunk=False)
+    for tag, _, _, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        if j2 > j1:
+            touched = {lang_of(line) for line in range(j1 + 1, j2 + 1)}
+        else:
+            # Pure deletion between new lines j1 and j1 + 1.
+            before, after = lang_of(j1), lang_of(j1 + 1)
+            touched = {before if before == after else None}
+        if None in touched:
+            return None
+        found |= touched
+    return found
+
+
+# ── workers ──────────────────────────────────────────────────
+def _warm_up():
+    # Workers are daemonic and cannot fork section workers of their own.
+    os.environ["REPORTS_JOBS"] = "1"
+    for name in _WARM_MODULES:
+        importlib.import_module(name)
+
+
+def _build(script, lang):
+    """Run one generator's build in this worker; return (paths, seconds, error)."""
+    start = time.perf_counter()
+    try:
+        name = "_watched_" + os.path.splitext(os.path.basename(script))[0]
+        loader_spec = importlib.util.spec_from_file_location(name, script)
+        module = importlib.util.module_from_spec(loader_spec)
+        sys.modules[name] = module
+        loader_spec.loader.exec_module(module)
+        entry = getattr(module, "build_pdf", None) or module.build
+        result = entry(lang) if lang else entry()
+        return [result.path], time.perf_counter() - start, None
+    except Exception:
+        return [], time.perf_counter() - start, traceback.format_exc()
+
+
+class WarmPool:
+    """Worker processes that stay alive, and warm, between rebuilds."""
+
+    def __init__(self, jobs):
+        self.jobs = max(1, jobs)
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        self._pool = None
+
+    def start(self):
+        if self._pool is None:
+            self._pool = self._ctx.Pool(self.jobs, initializer=_warm_up)
+
+    def restart(self):
+        self.close()
+        self.start()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def run(self, tasks):
+        """Run ``(script, lang)`` tasks; yield ``(task, result)`` in order."""
+        self.start()
+        pending = [(task, self._pool.apply_async(_build, task)) for task in tasks]
+        for task, res in pending:
+            yield task, res.get()
+
+
+# ── watcher ──────────────────────────────────────────────────
+class Watcher:
+    """Polls the inputs of *specs* and rebuilds what their changes affect."""
+
+    def __init__(self, specs, manifest, jobs=1, debounce=DEFAULT_DEBOUNCE_S, out=print):
+        self.specs = specs
+        self.manifest = manifest
+        self.debounce = debounce
+        self.out = out
+        self.pool = WarmPool(jobs)
+        self._sources = {}   # generator path -> text of its last build
+
+    def files(self):
+        files = set()
+        for spec in self.specs:
+            files.update(self.manifest.input_files(spec))
+        return files
+
+    def snapshot(self):
+        state = {}
+        for path in self.files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def _read(self, path):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
+    def wait_for_changes(self, state):
+        """Block until inputs change and then settle; return (changed, state)."""
+        while True:
+            time.sleep(POLL_S)
+            current = self.snapshot()
+            if current != state:
+                break
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < self.debounce:
+            time.sleep(POLL_S)
+            latest = self.snapshot()
+            if latest != current:
+                current, quiet_since = latest, time.monotonic()
+        changed = {p for p in set(state) | set(current) if state.get(p) != current.get(p)}
+        return changed, current
+
+    def plan(self, changed):
+        """``[(spec, langs)]`` to rebuild; *langs* is None for single-language reports."""
+        plan = []
+        for spec, paths in reports_for(changed, self.specs, self.manifest).items():
+            langs = set(spec.langs)
+            if paths == {spec.script_path} and len(spec.langs) > 1:
+                old, new = self._sources.get(spec.script_path), self._read(spec.script_path)
+                if old is not None and new is not None:
+                    langs = changed_langs(old, new, spec.langs) or langs
+            plan.append((spec, sorted(langs) if len(spec.langs) > 1 else None))
+        return plan
+
+    def rebuild(self, plan):
+        tasks = [(spec.script_path, lang) for spec, langs in plan for lang in (langs or [None])]
+        by_script = {spec.script_path: spec for spec, _ in plan}
+        built, took, failed = {}, {}, 0
+        for (script, lang), (paths, duration, error) in self.pool.run(tasks):
+            spec = by_script[script]
+            label = f"{spec.name}{f' [{lang}]' if lang else ''}"
+            if error:
+                failed += 1
+                self.out(f"  ✘ {label:<16} failed after {duration:.2f}s\n{error.rstrip()}")
+                continue
+            built.setdefault(spec, []).extend(paths)
+            took[spec] = took.get(spec, 0.0) + duration
+            self.out(f"  ✔ {label:<16} built in {duration:.2f}s")
+        for spec, paths in built.items():
+            entry = self.manifest.reports.get(spec.name, {})
+            # Languages that were not rebuilt keep their recorded outputs.
+            previous = [os.path.join(ROOT_DIR, rel) for rel in entry.get("outputs", ())]
+            outputs = {os.path.realpath(p) for p in previous + paths if os.path.exists(p)}
+            self.manifest.record(spec, self.manifest.input_hash(spec), sorted(outputs), took[spec])
+            self._sources[spec.script_path] = self._read(spec.script_path)
+        self.manifest.save()
+        return failed
+
+    def run(self):
+        state = self.snapshot()
+        for spec in self.specs:
+            self._sources[spec.script_path] = self._read(spec.script_path)
+        self.pool.start()
+        self.out(f"Watching {len(state)} files for {len(self.specs)} reports — Ctrl-C to stop.")
+        try:
+            while True:
+                changed, state = self.wait_for_changes(state)
+                if any(os.path.dirname(p) in (LIB_DIR, FONTS_DIR) for p in changed):
+                    self.pool.restart()
+                plan = self.plan(changed)
+                if not plan:
+                    continue
+                names = ", ".join(os.path.relpath(p) for p in sorted(changed))
+                self.out(f"\n  ↻ {names}")
+                start = time.perf_counter()
+                self.rebuild(plan)
+                self.out(f"  … done in {time.perf_counter() - start:.2f}s")
+        except KeyboardInterrupt:
+            self.out("")
+        finally:
+            self.pool.close()
+        return 0